@@ -0,0 +1,2 @@
+"""Benchmarks de performance du parseur de documents."""
+
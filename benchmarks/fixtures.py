@@ -0,0 +1,265 @@
+"""Génération de fichiers de test synthétiques et reproductibles pour les benchmarks.
+
+Chaque format supporté par ExtractorFactory (txt, pdf, epub, html, docx) est
+produit à partir du même générateur de texte, à différentes tailles.
+"""
+
+import random
+import textwrap
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Taille approximative du texte de chaque fixture, en caractères
+SIZES = {
+    'small': 20_000,
+    'medium': 500_000,
+    'huge': 5_000_000
+}
+
+FORMATS = ['txt', 'pdf', 'epub', 'html', 'docx']
+
+_SUBJECTS = ['Marie Dupont', 'Jean Martin', 'La société Renault', 'Le gouvernement',
+             "L'université de Lyon", 'Google', 'La mairie de Paris', "L'équipe de France"]
+_VERBS = ['annonce', 'présente', 'finance', 'publie', 'développe', 'soutient', 'analyse']
+_OBJECTS = ['un nouveau logiciel', 'une étude scientifique', 'un traitement médical',
+            'un investissement important', 'une réforme de la loi', 'un championnat régional',
+            "un programme d'enseignement", 'les données du marché']
+_COMPLEMENTS = ['à Paris', 'à Marseille', 'avec ses partenaires', 'pour les patients',
+                'depuis Bruxelles', 'et ses étudiants', 'pour la recherche', 'en Europe']
+
+WORDS = ['document', 'analyse', 'entreprise', 'marché', 'Paris', 'recherche', 'données',
+         'gouvernement', 'équipe', 'logiciel', 'santé', 'université', 'le', 'la', 'des', 'et']
+
+
+def generate_paragraphs(n_chars: int, seed: int = 0) -> List[str]:
+    """
+    Génère des paragraphes en français contenant entités et mots-clés de catégories.
+    
+    Args:
+        n_chars: Nombre approximatif de caractères à produire
+        seed: Graine du générateur aléatoire
+        
+    Returns:
+        List[str]: Paragraphes générés
+    """
+    rng = random.Random(seed)
+    paragraphs = []
+    size = 0
+    
+    while size < n_chars:
+        sentences = [
+            f"{rng.choice(_SUBJECTS)} {rng.choice(_VERBS)} {rng.choice(_OBJECTS)} "
+            f"{rng.choice(_COMPLEMENTS)}."
+            for _ in range(rng.randint(3, 8))
+        ]
+        paragraph = ' '.join(sentences)
+        paragraphs.append(paragraph)
+        size += len(paragraph) + 2
+    
+    return paragraphs
+
+
+def generate_html(size_mb: float, seed: int = 0) -> str:
+    """
+    Génère une page HTML synthétique d'environ size_mb mégaoctets.
+    
+    Args:
+        size_mb: Taille visée en mégaoctets
+        seed: Graine du générateur aléatoire
+        
+    Returns:
+        str: Code HTML de la page
+    """
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    parts = [
+        '<!DOCTYPE html><html><head><title>Page de test</title>',
+        '<meta name="description" content="Page synthétique">',
+        '<meta property="og:title" content="Test">',
+        '<style>body { color: black; }</style></head><body>',
+        '<header><nav><a href="/">Accueil</a> <a href="/contact">Contact</a></nav></header>'
+    ]
+    size = sum(len(p) for p in parts)
+    
+    while size < target:
+        sentence = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(8, 25)))
+        block = (f'<div class="bloc"><p>{sentence}. <b>{rng.choice(WORDS)}</b> '
+                 f'<a href="#">{rng.choice(WORDS)}</a></p>'
+                 f'<script>var x = {rng.randint(0, 1000)};</script></div>\n')
+        parts.append(block)
+        size += len(block)
+    
+    parts.append('<footer>Mentions légales</footer></body></html>')
+    return ''.join(parts)
+
+
+def write_txt(path: Path, paragraphs: List[str]):
+    """Écrit un fichier texte UTF-8."""
+    path.write_text('\n\n'.join(paragraphs), encoding='utf-8')
+
+
+def write_html(path: Path, paragraphs: List[str]):
+    """Écrit une page HTML avec navigation, scripts et styles à supprimer."""
+    body = ''.join(
+        f'<div class="bloc"><p>{paragraph}</p><script>var n = {i};</script></div>\n'
+        for i, paragraph in enumerate(paragraphs)
+    )
+    path.write_text(
+        '<!DOCTYPE html><html><head><title>Rapport de test</title>'
+        '<meta name="author" content="Benchmark"><style>p { margin: 0; }</style></head><body>'
+        '<header><nav><a href="/">Accueil</a></nav></header>'
+        f'{body}<footer>Pied de page</footer></body></html>',
+        encoding='utf-8'
+    )
+
+
+def write_docx(path: Path, paragraphs: List[str]):
+    """Écrit un fichier DOCX avec des paragraphes et un tableau tous les 20 paragraphes."""
+    from docx import Document as DocxDocument
+    
+    doc = DocxDocument()
+    doc.core_properties.title = 'Rapport de test'
+    doc.core_properties.author = 'Benchmark'
+    
+    for i, paragraph in enumerate(paragraphs):
+        doc.add_paragraph(paragraph)
+        if i % 20 == 19:
+            table = doc.add_table(rows=5, cols=3)
+            for r, row in enumerate(table.rows):
+                for c, cell in enumerate(row.cells):
+                    cell.text = f'Ligne {r} colonne {c}'
+    
+    doc.save(str(path))
+
+
+def write_epub(path: Path, paragraphs: List[str], chapter_size: int = 50):
+    """Écrit un fichier EPUB découpé en chapitres de chapter_size paragraphes."""
+    from ebooklib import epub
+    
+    book = epub.EpubBook()
+    book.set_identifier('benchmark-fixture')
+    book.set_title('Livre de test')
+    book.set_language('fr')
+    book.add_author('Benchmark')
+    
+    chapters = []
+    for i in range(0, len(paragraphs), chapter_size):
+        number = i // chapter_size + 1
+        chapter = epub.EpubHtml(title=f'Chapitre {number}', file_name=f'chap_{number}.xhtml', lang='fr')
+        body = ''.join(f'<p>{paragraph}</p>' for paragraph in paragraphs[i:i + chapter_size])
+        chapter.content = f'<html><body><h1>Chapitre {number}</h1>{body}</body></html>'
+        book.add_item(chapter)
+        chapters.append(chapter)
+    
+    book.toc = chapters
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    book.spine = ['nav'] + chapters
+    epub.write_epub(str(path), book)
+
+
+def _pdf_escape(text: str) -> bytes:
+    """Encode une ligne de texte en chaîne littérale PDF (WinAnsiEncoding)."""
+    raw = text.encode('cp1252', errors='replace')
+    return raw.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+
+
+def write_pdf(path: Path, paragraphs: List[str], line_width: int = 90, lines_per_page: int = 60):
+    """
+    Écrit un PDF minimal (police Helvetica standard) sans dépendance externe.
+    
+    Args:
+        path: Chemin du fichier à créer
+        paragraphs: Paragraphes à écrire
+        line_width: Nombre maximal de caractères par ligne
+        lines_per_page: Nombre de lignes par page
+    """
+    lines = []
+    for paragraph in paragraphs:
+        lines.extend(textwrap.wrap(paragraph, line_width))
+        lines.append('')
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    
+    # Objets : 1 catalogue, 2 arbre des pages, 3 police, 4 infos, puis (page, contenu) par page
+    objects: Dict[int, bytes] = {
+        3: b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>',
+        4: b'<< /Title (Rapport de test) /Author (Benchmark) >>'
+    }
+    kids = []
+    for index, page_lines in enumerate(pages):
+        page_id = 5 + 2 * index
+        content_id = page_id + 1
+        kids.append(f'{page_id} 0 R'.encode())
+        
+        stream = b'BT /F1 10 Tf 12 TL 40 800 Td ' + b' '.join(
+            b'(' + _pdf_escape(line) + b') Tj T*' for line in page_lines
+        ) + b' ET'
+        objects[content_id] = (b'<< /Length ' + str(len(stream)).encode() + b' >>\nstream\n'
+                               + stream + b'\nendstream')
+        objects[page_id] = (b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+                            b'/Resources << /Font << /F1 3 0 R >> >> /Contents '
+                            + str(content_id).encode() + b' 0 R >>')
+    
+    objects[1] = b'<< /Type /Catalog /Pages 2 0 R >>'
+    objects[2] = (b'<< /Type /Pages /Kids [' + b' '.join(kids) + b'] /Count '
+                  + str(len(pages)).encode() + b' >>')
+    
+    output = bytearray(b'%PDF-1.4\n')
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = len(output)
+        output += str(object_id).encode() + b' 0 obj\n' + objects[object_id] + b'\nendobj\n'
+    
+    xref_offset = len(output)
+    count = max(objects) + 1
+    output += b'xref\n0 ' + str(count).encode() + b'\n0000000000 65535 f \n'
+    for object_id in range(1, count):
+        output += f'{offsets[object_id]:010d} 00000 n \n'.encode()
+    output += (b'trailer\n<< /Size ' + str(count).encode() + b' /Root 1 0 R /Info 4 0 R >>\n'
+               b'startxref\n' + str(xref_offset).encode() + b'\n%%EOF\n')
+    
+    path.write_bytes(bytes(output))
+
+
+WRITERS = {
+    'txt': write_txt,
+    'pdf': write_pdf,
+    'epub': write_epub,
+    'html': write_html,
+    'docx': write_docx
+}
+
+
+def generate_fixtures(output_dir: str, sizes: List[str], formats: List[str],
+                      seed: int = 0) -> Dict[Tuple[str, str], Path]:
+    """
+    Génère (ou réutilise) les fixtures demandées.
+    
+    Les fichiers déjà présents sont conservés : le générateur étant déterministe,
+    un répertoire de fixtures peut être partagé entre plusieurs exécutions.
+    
+    Args:
+        output_dir: Répertoire où écrire les fichiers
+        sizes: Noms de tailles (clés de SIZES)
+        formats: Formats à générer (éléments de FORMATS)
+        seed: Graine du générateur de texte
+        
+    Returns:
+        Dict[Tuple[str, str], Path]: Chemin de chaque fixture indexé par (format, taille)
+    """
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    fixtures = {}
+    
+    for size in sizes:
+        paragraphs = None
+        for file_format in formats:
+            path = directory / f'{size}.{file_format}'
+            if not path.exists():
+                if paragraphs is None:
+                    paragraphs = generate_paragraphs(SIZES[size], seed=seed)
+                WRITERS[file_format](path, paragraphs)
+            fixtures[(file_format, size)] = path
+    
+    return fixtures
+
@@ -0,0 +1,60 @@
+"""Compare les backends d'extraction HTML (lxml et BeautifulSoup).
+
+Usage:
+    python -m benchmarks.html_extraction [--sizes 0.1 1 5] [--repeat 3]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from benchmarks.fixtures import generate_html
+from src.extractors.html_extractor import HtmlExtractor
+
+
+def time_backend(backend: str, files: list, repeat: int) -> float:
+    """Retourne le meilleur temps (en secondes) d'extraction de tous les fichiers."""
+    extractor = HtmlExtractor(backend=backend)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for file_path in files:
+            extractor.extract(str(file_path))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Génère le corpus de test et affiche le temps de chaque backend."""
+    parser = argparse.ArgumentParser(description='Benchmark des backends HTML')
+    parser.add_argument('--sizes', type=float, nargs='+', default=[0.1, 1.0, 5.0],
+                        help='Tailles des pages générées en Mo (par défaut: 0.1 1 5)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Nombre de répétitions, le meilleur temps est retenu (par défaut: 3)')
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        files = []
+        for i, size_mb in enumerate(args.sizes):
+            path = Path(tmp_dir) / f'page_{i}.html'
+            path.write_text(generate_html(size_mb, seed=i), encoding='utf-8')
+            files.append(path)
+        
+        # Les deux backends doivent produire le même texte
+        for path in files:
+            fast = HtmlExtractor(backend='lxml').extract(str(path))
+            slow = HtmlExtractor(backend='bs4').extract(str(path))
+            if (fast.content, fast.title, fast.metadata) != (slow.content, slow.title, slow.metadata):
+                print(f"Attention: résultats différents pour {path.name}")
+        
+        total_mb = sum(args.sizes)
+        timings = {backend: time_backend(backend, files, args.repeat) for backend in ('bs4', 'lxml')}
+        
+        for backend, elapsed in timings.items():
+            print(f"{backend:>5}: {elapsed:.3f} s ({total_mb / elapsed:.1f} Mo/s)")
+        print(f"Accélération lxml: x{timings['bs4'] / timings['lxml']:.1f}")
+
+
+if __name__ == '__main__':
+    main()
+
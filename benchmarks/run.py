@@ -0,0 +1,312 @@
+"""Banc d'essai de chaque étape : extraction, analyse et export.
+
+Usage:
+    python -m benchmarks.run --sizes small medium --output resultats.json
+    python -m benchmarks.run --baseline baseline.json --threshold 0.2
+    
+Chaque étape est mesurée séparément (temps réel, pic de RSS, documents par
+seconde) puis les résultats sont écrits en JSON. Avec --baseline, chaque mesure
+est comparée à une exécution de référence et le programme se termine avec le
+code 1 si une étape est plus lente que la référence au-delà du seuil.
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from benchmarks.fixtures import FORMATS, SIZES, generate_fixtures
+from src.analyzers.chunking import iter_docs
+from src.analyzers.nlp_pipeline import NLPPipeline
+from src.exporters.json_exporter import JsonExporter
+from src.extractors.extractor_factory import ExtractorFactory
+from src.models.analysis import Analysis
+
+try:
+    import resource
+except ImportError:  # Windows : pas de mesure du pic de RSS
+    resource = None
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Retourne le pic de RSS du processus courant en Mo (None si indisponible)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss est en octets sous macOS et en kilo-octets sous Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _current_rss_mb() -> Optional[float]:
+    """Retourne la RSS actuelle du processus en Mo (Linux uniquement, sinon le pic)."""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize() / (1024 * 1024)
+    except (OSError, AttributeError, ValueError):
+        return _peak_rss_mb()
+
+
+def _measure(stage: Callable, repeat: int, setup: Optional[Callable[[], Any]] = None) -> Dict:
+    """
+    Exécute une étape plusieurs fois et mesure son temps et sa mémoire.
+    
+    Args:
+        stage: Fonction exécutant l'étape une fois (sans argument, ou recevant
+            le résultat de setup)
+        repeat: Nombre d'exécutions
+        setup: Préparation des données d'entrée, exécutée hors chronométrage
+            avant chaque exécution
+        
+    Returns:
+        Dict: Meilleur temps, temps moyen, pic de RSS et surcoût mémoire de l'étape
+    """
+    rss_before = _current_rss_mb()
+    timings = []
+    for _ in range(repeat):
+        if setup is None:
+            start = time.perf_counter()
+            stage()
+        else:
+            prepared = setup()
+            start = time.perf_counter()
+            stage(prepared)
+        timings.append(time.perf_counter() - start)
+    peak = _peak_rss_mb()
+    
+    best = min(timings)
+    return {
+        'wall_s': best,
+        'wall_mean_s': sum(timings) / len(timings),
+        'docs_per_s': 1.0 / best if best > 0 else None,
+        'peak_rss_mb': peak,
+        'rss_delta_mb': peak - rss_before if peak is not None and rss_before is not None else None
+    }
+
+
+def _isolated_child(stage, repeat, setup, conn):
+    """Point d'entrée du processus fils de run_isolated."""
+    try:
+        conn.send(_measure(stage, repeat, setup))
+    except Exception as e:
+        conn.send({'error': f"{e.__class__.__name__}: {str(e)}"})
+    finally:
+        conn.close()
+
+
+def run_isolated(stage: Callable, repeat: int, setup: Optional[Callable[[], Any]] = None) -> Dict:
+    """
+    Mesure une étape dans un processus fils (fork) pour isoler son pic de RSS.
+    
+    Le fils hérite des données déjà préparées (documents extraits, Doc spaCy) et
+    son pic de RSS ne reflète que l'étape mesurée. Sans fork disponible, la
+    mesure est faite dans le processus courant.
+    
+    Args:
+        stage: Fonction exécutant l'étape une fois
+        repeat: Nombre d'exécutions
+        setup: Préparation non chronométrée de l'entrée de l'étape (voir _measure)
+        
+    Returns:
+        Dict: Mesures de l'étape (ou clé 'error' en cas d'échec)
+    """
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        try:
+            return _measure(stage, repeat, setup)
+        except Exception as e:
+            return {'error': f"{e.__class__.__name__}: {str(e)}"}
+    
+    context = multiprocessing.get_context('fork')
+    parent_conn, child_conn = context.Pipe(duplex=False)
+    process = context.Process(target=_isolated_child, args=(stage, repeat, setup, child_conn))
+    process.start()
+    child_conn.close()
+    try:
+        result = parent_conn.recv()
+    except EOFError:
+        result = {'error': f"processus interrompu (code {process.exitcode})"}
+    process.join()
+    return result
+
+
+def run_benchmarks(fixtures: Dict, pipeline: NLPPipeline, repeat: int, output_dir: Path) -> Dict:
+    """
+    Mesure l'extraction, chaque analyseur et l'export pour chaque fixture.
+    
+    Args:
+        fixtures: Chemins des fixtures indexés par (format, taille)
+        pipeline: Pipeline dont les analyseurs sont mesurés
+        repeat: Nombre d'exécutions de chaque étape
+        output_dir: Répertoire temporaire pour les fichiers exportés
+        
+    Returns:
+        Dict: Mesures indexées par 'etape/cible/format/taille'
+    """
+    results = {}
+    exporter = JsonExporter()
+    
+    for (file_format, size), path in sorted(fixtures.items()):
+        case = f'{file_format}/{size}'
+        extractor = ExtractorFactory.get_extractor(str(path))
+        print(f"[{case}] extraction ({path.stat().st_size / 1024:.0f} Ko)...")
+        
+        results[f'extract/{extractor.__class__.__name__}/{case}'] = dict(
+            run_isolated(lambda: extractor.extract(str(path)), repeat),
+            input_bytes=path.stat().st_size
+        )
+        
+        document = extractor.extract(str(path))
+        content_chars = len(document.content)
+        
+        # Le Doc spaCy partagé est mesuré comme une étape à part entière
+        docs = []
+        if document.content and any(a.requires_doc for a in pipeline.analyzers):
+            print(f"[{case}] analyse spaCy...")
+            results[f'analyze/spacy/{case}'] = dict(
+                run_isolated(lambda: list(iter_docs(pipeline.nlp, document.content,
+                                                    pipeline.max_chunk_chars)), repeat),
+                content_chars=content_chars
+            )
+            docs = list(iter_docs(pipeline.nlp, document.content, pipeline.max_chunk_chars))
+        
+        # Chaque analyseur reçoit l'analyse produite par les analyseurs précédents
+        analysis = Analysis()
+        for analyzer in pipeline.analyzers:
+            name = analyzer.__class__.__name__
+            print(f"[{case}] {name}...")
+            previous = analysis
+            
+            # Les analyseurs modifient l'analyse reçue : chaque exécution part
+            # d'une copie fraîche, préparée hors de la zone chronométrée
+            def setup(previous=previous):
+                return Analysis.from_dict(previous.to_dict())
+            
+            def stage(result, analyzer=analyzer):
+                if analyzer.requires_doc:
+                    for doc in docs:
+                        result = analyzer.analyze(document, result, doc=doc)
+                    return result
+                return analyzer.analyze(document, result)
+            
+            results[f'analyze/{name}/{case}'] = dict(
+                run_isolated(stage, repeat, setup),
+                content_chars=content_chars
+            )
+            analysis = stage(setup())
+        
+        print(f"[{case}] export JSON...")
+        output_path = output_dir / f'{file_format}_{size}.json'
+        results[f'export/JsonExporter/{case}'] = dict(
+            run_isolated(lambda: exporter.export(document, analysis, str(output_path)), repeat),
+            content_chars=content_chars
+        )
+    
+    return results
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> list:
+    """
+    Compare les mesures à une exécution de référence.
+    
+    Args:
+        results: Mesures de l'exécution courante
+        baseline: Mesures de référence
+        threshold: Ralentissement relatif toléré (0.2 = 20 %)
+        
+    Returns:
+        list: Régressions sous forme de (clé, temps de référence, temps courant, ratio)
+    """
+    regressions = []
+    for key, current in sorted(results.items()):
+        reference = baseline.get(key)
+        if not reference or 'wall_s' not in reference or 'wall_s' not in current:
+            continue
+        ratio = current['wall_s'] / reference['wall_s'] if reference['wall_s'] > 0 else 1.0
+        marker = ''
+        if ratio > 1.0 + threshold:
+            regressions.append((key, reference['wall_s'], current['wall_s'], ratio))
+            marker = '  <-- RÉGRESSION'
+        print(f"  {key:<55} {reference['wall_s']:>9.4f} s -> {current['wall_s']:>9.4f} s "
+              f"(x{ratio:.2f}){marker}")
+    return regressions
+
+
+def main():
+    """Point d'entrée du banc d'essai."""
+    parser = argparse.ArgumentParser(
+        description="Banc d'essai des extracteurs, analyseurs et exportateurs",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=['small', 'medium'],
+                        help='Tailles de fixtures (par défaut: small medium)')
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=FORMATS,
+                        help='Formats à mesurer (par défaut: tous)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Nombre d\'exécutions par étape, le meilleur temps est retenu (par défaut: 3)')
+    parser.add_argument('--model', type=str, default='fr_core_news_sm',
+                        help='Modèle spaCy à utiliser (par défaut: fr_core_news_sm)')
+    parser.add_argument('--fixtures-dir', type=str, default=None,
+                        help='Répertoire des fixtures, réutilisées si présentes (par défaut: temporaire)')
+    parser.add_argument('-o', '--output', type=str, default='benchmark_results.json',
+                        help='Fichier JSON des résultats (par défaut: benchmark_results.json)')
+    parser.add_argument('--baseline', type=str, default=None,
+                        help='Fichier JSON de référence à comparer')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Ralentissement toléré par rapport à la référence (par défaut: 0.2)')
+    args = parser.parse_args()
+    
+    pipeline = NLPPipeline(model_name=args.model)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fixtures_dir = args.fixtures_dir or str(Path(tmp_dir) / 'fixtures')
+        print(f"Génération des fixtures dans {fixtures_dir}...")
+        fixtures = generate_fixtures(fixtures_dir, args.sizes, args.formats)
+        
+        # Chargement du modèle hors mesure, hérité par les processus fils
+        pipeline.nlp
+        
+        results = run_benchmarks(fixtures, pipeline, args.repeat, Path(tmp_dir))
+    
+    report = {
+        'meta': {
+            'date': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'model': args.model,
+            'pipeline': pipeline.get_config(),
+            'repeat': args.repeat,
+            'sizes': {size: SIZES[size] for size in args.sizes}
+        },
+        'results': results
+    }
+    
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n✓ Résultats écrits dans: {output_path.absolute()}")
+    
+    errors = {key: value['error'] for key, value in results.items() if 'error' in value}
+    for key, error in errors.items():
+        print(f"Erreur pour {key}: {error}", file=sys.stderr)
+    
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f).get('results', {})
+        print(f"\nComparaison avec {args.baseline} (seuil: +{args.threshold:.0%}):")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n✗ {len(regressions)} régression(s) détectée(s)", file=sys.stderr)
+            sys.exit(1)
+        print("\n✓ Aucune régression")
+
+
+if __name__ == '__main__':
+    main()
+
@@ -0,0 +1,128 @@
+"""Vérification des imports et du temps de démarrage de la CLI.
+
+Usage:
+    python -m benchmarks.startup
+    
+Chaque vérification est exécutée dans un interpréteur neuf :
+- l'import de main.py (et donc `main.py --help`) ne charge aucune dépendance lourde ;
+- l'extraction d'un format ne charge que le backend configuré pour ce format.
+Le programme se termine avec le code 1 si une dépendance inattendue est importée.
+Les mêmes vérifications sont exécutées par la suite de tests (tests/test_startup.py).
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from benchmarks.fixtures import FORMATS, generate_fixtures
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Dépendances coûteuses à importer
+HEAVY_MODULES = ['pdfplumber', 'ebooklib', 'bs4', 'docx', 'chardet', 'lxml', 'spacy', 'textblob',
+                 'pyarrow', 'numpy']
+
+# Configurations d'extraction vérifiées : format, backend, options passées à
+# ExtractorFactory.configure et dépendances autorisées. La première configuration
+# de chaque format est celle par défaut : ni python-docx (DOCX lu en flux) ni
+# BeautifulSoup (HTML et EPUB analysés par lxml) n'y sont chargés.
+# (BeautifulSoup importe lui-même chardet pour deviner les encodages, et lxml s'il
+# est installé pour enregistrer ses analyseurs)
+EXTRACTION_CASES = [
+    ('txt', 'chardet', {}, {'chardet'}),
+    ('pdf', 'pdfplumber', {}, {'pdfplumber'}),
+    ('epub', 'lxml', {}, {'ebooklib', 'lxml'}),
+    ('epub', 'bs4', {'backend': 'bs4'}, {'ebooklib', 'lxml', 'bs4', 'chardet'}),
+    ('html', 'lxml', {}, {'lxml'}),
+    ('html', 'bs4', {'backend': 'bs4'}, {'bs4', 'chardet', 'lxml'}),
+    ('docx', 'streaming', {}, {'lxml'}),
+    ('docx', 'python-docx', {'streaming': False}, {'docx', 'lxml'})
+]
+
+_PROBE = """
+import json, sys
+{code}
+print(json.dumps([m for m in {heavy!r} if m in sys.modules]))
+"""
+
+
+def imported_heavy_modules(code: str) -> list:
+    """
+    Exécute du code dans un interpréteur neuf et liste les dépendances lourdes chargées.
+    
+    Args:
+        code: Code Python à exécuter depuis la racine du dépôt
+        
+    Returns:
+        list: Dépendances lourdes présentes dans sys.modules après exécution
+    """
+    result = subprocess.run(
+        [sys.executable, '-c', _PROBE.format(code=code, heavy=HEAVY_MODULES)],
+        cwd=str(ROOT), capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def extraction_probe(path: str, file_format: str, options: dict) -> str:
+    """
+    Construit le code qui extrait un fichier avec les options d'extracteur données.
+    
+    Args:
+        path: Chemin du fichier à extraire
+        file_format: Extension du fichier
+        options: Options de l'extracteur (vide : configuration par défaut)
+        
+    Returns:
+        str: Code à passer à imported_heavy_modules
+    """
+    return (
+        'from src.extractors.extractor_factory import ExtractorFactory\n'
+        + (f'ExtractorFactory.configure({file_format!r}, **{options!r})\n' if options else '')
+        + f'ExtractorFactory.get_extractor({path!r}).extract({path!r})'
+    )
+
+
+def time_help(repeat: int = 5) -> float:
+    """Retourne le meilleur temps d'exécution de `main.py --help` en secondes."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, 'main.py', '--help'], cwd=str(ROOT),
+                       capture_output=True, check=True)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    """Point d'entrée de la vérification."""
+    failures = []
+    
+    loaded = imported_heavy_modules('import main')
+    print(f"import main: {', '.join(loaded) or 'aucune dépendance lourde'}")
+    if loaded:
+        failures.append(('main', loaded))
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fixtures = generate_fixtures(tmp_dir, ['small'], FORMATS)
+        for file_format, backend, options, allowed in EXTRACTION_CASES:
+            path = str(fixtures[(file_format, 'small')])
+            loaded = imported_heavy_modules(extraction_probe(path, file_format, options))
+            unexpected = sorted(set(loaded) - allowed)
+            print(f"extraction {file_format} ({backend}): {', '.join(loaded) or 'aucune'}"
+                  + (f"  <-- inattendu: {', '.join(unexpected)}" if unexpected else ''))
+            if unexpected:
+                failures.append((f'{file_format}/{backend}', unexpected))
+    
+    print(f"main.py --help: {time_help() * 1000:.0f} ms")
+    
+    if failures:
+        print(f"\n✗ {len(failures)} import(s) inattendu(s)", file=sys.stderr)
+        sys.exit(1)
+    print("\n✓ Imports différés respectés")
+
+
+if __name__ == '__main__':
+    main()
+
@@ -2,11 +2,460 @@
 """Point d'entrée principal du parseur de documents."""
 
 import argparse
+import atexit
+import cProfile
+import glob
 import sys
+import time
 from pathlib import Path
 from src.extractors.extractor_factory import ExtractorFactory
-from src.analyzers.nlp_pipeline import NLPPipeline
+from src.analyzers.nlp_pipeline import DEFAULT_LANGUAGE_MODELS, NLPPipeline
+from src.analyzers.language_detector import LanguageDetector
 from src.exporters.json_exporter import JsonExporter
+from src.exporters.ndjson_exporter import NdjsonExporter
+from src.exporters.parquet_exporter import ParquetExporter
+from src.cache.result_cache import ResultCache
+from src.dedup.minhash_index import MinHashIndex
+from src.index.analysis_index import AnalysisIndex
+from src.instrumentation.stage_timer import Instrumentation
+
+
+def collect_files(inputs, manifest=None) -> list:
+    """
+    Construit la liste des fichiers à traiter en mode lot.
+    
+    Args:
+        inputs: Fichiers, répertoires (parcourus récursivement) ou motifs glob
+        manifest: Fichier texte listant un chemin par ligne (optionnel)
+        
+    Returns:
+        list: Chemins des fichiers supportés, sans doublons, dans l'ordre
+    """
+    candidates = []
+    entries = list(inputs)
+    
+    if manifest:
+        with open(manifest, 'r', encoding='utf-8') as f:
+            entries.extend(line.strip() for line in f if line.strip() and not line.startswith('#'))
+    
+    for entry in entries:
+        path = Path(entry)
+        if path.is_dir():
+            candidates.extend(sorted(p for p in path.rglob('*') if p.is_file()))
+        elif path.exists():
+            candidates.append(path)
+        else:
+            candidates.extend(Path(p) for p in sorted(glob.glob(entry, recursive=True)))
+    
+    files = []
+    seen = set()
+    for path in candidates:
+        key = path.resolve()
+        if key not in seen and ExtractorFactory.is_supported(str(path)):
+            seen.add(key)
+            files.append(path)
+    
+    return files
+
+
+def extract_document(file_path, instrumentation=None):
+    """
+    Extrait un document, en mesurant l'extraction si l'instrumentation est active.
+    
+    Args:
+        file_path: Chemin du fichier à extraire
+        instrumentation: Collecteur des mesures (optionnel)
+        
+    Returns:
+        Document: Document extrait
+    """
+    extractor = ExtractorFactory.get_extractor(str(file_path))
+    if instrumentation is None:
+        return extractor.extract(str(file_path))
+    
+    # Même identifiant que Document.file_path pour rattacher la mesure à l'analyse
+    document_id = str(Path(file_path).absolute())
+    try:
+        with instrumentation.measure('extract', extractor.__class__.__name__, document_id) as info:
+            document = extractor.extract(str(file_path))
+            info['document_chars'] = len(document.content)
+    except Exception:
+        # Aucune analyse ne retirera cette mesure : elle s'accumulerait en mode lot
+        instrumentation.discard(document_id)
+        raise
+    return document
+
+
+def iter_documents(files, instrumentation=None):
+    """
+    Extrait les documents un par un, en ignorant les fichiers illisibles.
+    
+    Args:
+        files: Chemins des fichiers à extraire
+        instrumentation: Collecteur des mesures (optionnel)
+        
+    Yields:
+        Document: Documents extraits
+    """
+    for file_path in files:
+        try:
+            document = extract_document(file_path, instrumentation)
+        except Exception as e:
+            print(f"Erreur lors de l'extraction de {file_path}: {str(e)}", file=sys.stderr)
+            continue
+        yield document
+
+
+def create_instrumentation(args):
+    """
+    Crée l'instrumentation si --timings est demandé.
+    
+    Args:
+        args: Arguments de la ligne de commande
+        
+    Returns:
+        Instrumentation: Collecteur des mesures, ou None si désactivé
+    """
+    if not args.timings:
+        return None
+    return Instrumentation(attach_to_analysis=True)
+
+
+def print_timings(timings):
+    """Affiche les mesures par étape (temps réel, temps CPU, surcoût mémoire)."""
+    for key, timing in timings.items():
+        memory = timing.get('peak_rss_delta_bytes')
+        memory_text = f", +{memory / (1024 * 1024):.1f} Mo" if memory else ''
+        print(f"  - {key}: {timing['wall_s']:.3f} s (CPU {timing['cpu_s']:.3f} s{memory_text})")
+
+
+def dump_profile(profiler, output_path):
+    """Arrête le profilage et écrit les statistiques pstats."""
+    profiler.disable()
+    profiler.dump_stats(output_path)
+    print(f"✓ Profil d'exécution écrit dans: {output_path}")
+
+
+def open_cache(args):
+    """
+    Ouvre le cache de résultats si --cache-dir est fourni.
+    
+    Args:
+        args: Arguments de la ligne de commande
+        
+    Returns:
+        ResultCache: Cache ouvert, ou None si le cache est désactivé
+    """
+    if not args.cache_dir:
+        return None
+    return ResultCache(args.cache_dir, max_size_bytes=args.cache_max_size * 1024 * 1024)
+
+
+def open_index(args):
+    """
+    Ouvre l'index des entités, relations et catégories si --index est fourni.
+    
+    Args:
+        args: Arguments de la ligne de commande
+        
+    Returns:
+        AnalysisIndex: Index ouvert, ou None si l'indexation est désactivée
+    """
+    if not args.index:
+        return None
+    return AnalysisIndex(args.index)
+
+
+def create_exporter(args):
+    """
+    Crée l'exportateur correspondant à --format.
+    
+    Args:
+        args: Arguments de la ligne de commande
+        
+    Returns:
+        BaseExporter: JsonExporter (un fichier par document), NdjsonExporter (flux
+            unique) ou ParquetExporter (tables colonnaires)
+    """
+    if args.format == 'ndjson':
+        max_file_bytes = args.rotate_size * 1024 * 1024 if args.rotate_size else None
+        return NdjsonExporter(compression=args.compression, max_file_bytes=max_file_bytes)
+    if args.format in ('parquet', 'arrow'):
+        return ParquetExporter(file_format=args.format, compression=args.compression or 'auto')
+    return JsonExporter()
+
+
+def parse_language_models(args):
+    """
+    Modèles spaCy par langue, complétés par les options --language-model.
+    
+    Args:
+        args: Arguments de la ligne de commande
+        
+    Returns:
+        Dict[str, str]: Langue -> modèle, ou None pour les modèles par défaut
+    """
+    if not args.language_model:
+        return None
+    models = dict(DEFAULT_LANGUAGE_MODELS)
+    models.update(mapping.split('=', 1) for mapping in args.language_model)
+    return models
+
+
+def create_pipeline(args, instrumentation=None, cache=None):
+    """
+    Crée le pipeline NLP, en mode incrémental si --incremental est demandé,
+    avec un modèle par langue si --detect-language est demandé et avec l'index
+    des quasi-doublons si --dedup-index est fourni.
+    
+    Args:
+        args: Arguments de la ligne de commande
+        instrumentation: Collecteur des mesures (optionnel)
+        cache: Cache de résultats, qui conserve aussi les résultats par chapitre
+        
+    Returns:
+        NLPPipeline: Pipeline configuré
+    """
+    segment_store = cache if args.incremental else None
+    language_detector = LanguageDetector() if args.detect_language else None
+    duplicate_index = None
+    if args.dedup_index:
+        duplicate_index = MinHashIndex(args.dedup_index, threshold=args.dedup_threshold)
+    return NLPPipeline(model_name=args.model, instrumentation=instrumentation,
+                       segment_store=segment_store, language_detector=language_detector,
+                       language_models=parse_language_models(args), duplicate_index=duplicate_index)
+
+
+def print_index_stats(index):
+    """Affiche la taille de l'index des entités, relations et catégories."""
+    stats = index.stats()
+    print(f"Index: {stats['documents']} document(s), {stats['entities']} entités distinctes, "
+          f"{stats['relations']} relations, {stats['categories']} catégories")
+
+
+def print_cache_stats(cache):
+    """Affiche les statistiques d'utilisation du cache."""
+    stats = cache.stats()
+    print(f"Cache: {stats['hits']} succès, {stats['misses']} échecs "
+          f"(taux {stats['hit_rate']:.0%}), {stats['entries']} entrées, "
+          f"{stats['size_bytes'] / (1024 * 1024):.1f} Mo")
+
+
+def cache_config(config: dict, file_path) -> dict:
+    """
+    Configuration hachée dans la clé de cache d'un fichier.
+    
+    Les options de l'extracteur (backend HTML, workers EPUB, options PDF...)
+    changent le texte extrait : elles s'ajoutent à la configuration du pipeline.
+    
+    Args:
+        config: Configuration du pipeline (voir NLPPipeline.get_config)
+        file_path: Chemin du fichier
+        
+    Returns:
+        dict: Configuration du pipeline et options de l'extracteur du fichier
+    """
+    return dict(config, extractor=ExtractorFactory.get_options(Path(file_path).suffix))
+
+
+def iter_batch_results(files, pipeline, args, cache=None):
+    """
+    Produit les résultats d'un lot, en réutilisant le cache lorsque c'est possible.
+    
+    Les documents trouvés dans le cache sont produits directement, sans extraction
+    ni analyse ; les autres passent par le pipeline puis sont ajoutés au cache.
+    
+    Args:
+        files: Chemins des fichiers à traiter
+        pipeline: Pipeline NLP partagé par tout le lot
+        args: Arguments de la ligne de commande
+        cache: Cache de résultats (optionnel)
+        
+    Yields:
+        Tuple[Document, Analysis]: Chaque document avec son analyse
+    """
+    pending = []
+    cache_keys = {}
+    config = pipeline.get_config()
+    
+    for file_path in files:
+        if cache is None:
+            pending.append(file_path)
+            continue
+        try:
+            key = cache.make_key(str(file_path), cache_config(config, file_path))
+        except OSError as e:
+            print(f"Erreur lors de la lecture de {file_path}: {str(e)}", file=sys.stderr)
+            continue
+        cached = cache.get(key, str(file_path))
+        if cached:
+            yield cached
+        else:
+            cache_keys[str(Path(file_path).absolute())] = key
+            pending.append(file_path)
+    
+    results = pipeline.analyze_batch(
+        iter_documents(pending, pipeline.instrumentation),
+        batch_size=args.batch_size,
+        n_process=args.workers
+    )
+    for document, analysis in results:
+        key = cache_keys.get(document.file_path)
+        if key:
+            cache.put(key, document, analysis)
+        yield document, analysis
+
+
+def run_batch(files, args):
+    """
+    Analyse un lot de fichiers avec un seul pipeline et exporte un JSON par document
+    (ou une sortie unique pour tout le lot avec --format ndjson, parquet ou arrow).
+    
+    Args:
+        files: Chemins des fichiers à traiter
+        args: Arguments de la ligne de commande
+    """
+    print(f"Mode lot: {len(files)} fichier(s) à traiter "
+          f"({args.workers} processus, lots de {args.batch_size})")
+    
+    instrumentation = create_instrumentation(args)
+    stage_totals = {}
+    if instrumentation:
+        # Cumul par étape sur l'ensemble du lot
+        def accumulate(record):
+            total = stage_totals.setdefault(record.key, {'wall_s': 0.0, 'cpu_s': 0.0})
+            total['wall_s'] += record.wall_s
+            total['cpu_s'] += record.cpu_s
+        instrumentation.add_hook(accumulate)
+    
+    exporter = create_exporter(args)
+    cache = open_cache(args)
+    index = open_index(args)
+    pipeline = create_pipeline(args, instrumentation, cache)
+    output_dir = Path(args.output_dir) if args.output_dir else None
+    stream_path = None
+    if args.format != 'json':
+        # Sortie unique pour tout le lot : flux NDJSON ou répertoire de tables
+        stream_path = args.output or str((output_dir or Path('.')) / f'resultats.{args.format}')
+    used_outputs = set()
+    processed = 0
+    duplicates = 0
+    
+    start = time.perf_counter()
+    for document, analysis in iter_batch_results(files, pipeline, args, cache):
+        processed += 1
+        duplicate = ''
+        if analysis.duplicate_of:
+            duplicates += 1
+            duplicate = f", doublon de {Path(analysis.duplicate_of['file_path']).name}"
+        print(f"✓ {document.title} ({len(document.content)} caractères, "
+              f"{len(analysis.entities)} entités{duplicate})")
+        
+        if index:
+            index.add(document, analysis)
+        
+        if args.no_export:
+            continue
+        
+        if stream_path:
+            exporter.export(document, analysis, stream_path)
+            continue
+        
+        source = Path(document.file_path)
+        output_path = (output_dir / source.name if output_dir else source).with_suffix('.json')
+        # Éviter d'écraser la sortie d'un autre document portant le même nom
+        counter = 1
+        while output_path in used_outputs:
+            output_path = output_path.with_name(f"{source.stem}_{counter}.json")
+            counter += 1
+        used_outputs.add(output_path)
+        
+        exporter.export(document, analysis, str(output_path))
+    
+    if stream_path:
+        exporter.close()
+        for exported_file in exporter.files:
+            print(f"✓ Résultats exportés dans: {exported_file}")
+    
+    elapsed = time.perf_counter() - start
+    throughput = processed / elapsed if elapsed > 0 else 0.0
+    print(f"\n✓ {processed}/{len(files)} document(s) traité(s) en {elapsed:.2f} s "
+          f"({throughput:.2f} docs/s)")
+    if pipeline.duplicate_index is not None:
+        print(f"Quasi-doublons: {duplicates} document(s) ayant repris l'analyse d'un autre document")
+        pipeline.duplicate_index.close()
+    
+    if index:
+        print_index_stats(index)
+        index.close()
+    
+    if stage_totals:
+        print("Temps cumulés par étape:")
+        print_timings(stage_totals)
+    
+    if cache:
+        print_cache_stats(cache)
+        cache.close()
+
+
+def run_query(args):
+    """
+    Interroge l'index (--index) et affiche les documents correspondants.
+    
+    Args:
+        args: Arguments de la ligne de commande
+    """
+    index = AnalysisIndex(args.index)
+    try:
+        if args.find_entity is not None or args.entity_label is not None:
+            results = index.find_entity(args.find_entity, args.entity_label,
+                                        prefix=args.prefix, limit=args.limit)
+            lines = [f"{r['file_path']}: {r['text']} [{r['label']}] ×{r['count']}" for r in results]
+        elif args.find_category is not None:
+            results = index.find_category(args.find_category, limit=args.limit)
+            lines = [f"{r['file_path']}: {r['category']} (rang {r['rank'] + 1})" for r in results]
+        else:
+            results = index.find_relation(*args.find_relation, relation_type=args.relation_type,
+                                          limit=args.limit)
+            lines = [f"{r['file_path']}: {r['entity1']} --[{r['relation_type']}]--> {r['entity2']}"
+                     for r in results]
+    finally:
+        index.close()
+    
+    for line in lines:
+        print(line)
+    print(f"\n✓ {len(lines)} résultat(s)")
+
+
+def run_service(args):
+    """
+    Lance le service d'ingestion jusqu'à l'interruption (Ctrl+C).
+    
+    Args:
+        args: Arguments de la ligne de commande
+    """
+    # Import différé : le service n'est chargé que si --serve est demandé
+    import asyncio
+    from src.service.ingestion_service import IngestionService
+    
+    service = IngestionService(
+        model_name=args.model,
+        nlp_workers=args.workers,
+        extract_workers=args.extract_workers,
+        queue_size=args.queue_size,
+        output_dir=args.output_dir,
+        cache_dir=args.cache_dir,
+        cache_max_size_bytes=args.cache_max_size * 1024 * 1024,
+        incremental=args.incremental,
+        detect_language=args.detect_language,
+        language_models=parse_language_models(args),
+        dedup_index=args.dedup_index,
+        dedup_threshold=args.dedup_threshold
+    )
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n✓ Service arrêté")
 
 
 def main():
@@ -19,20 +468,30 @@ Exemples:
   python main.py document.pdf
   python main.py document.txt -o resultat.json
   python main.py document.pdf --no-export
+  python main.py corpus/ --output-dir resultats/ --workers 4
+  python main.py "archives/**/*.pdf" --manifest liste.txt
+  python main.py corpus/ --format ndjson --compression gzip -o resultats.ndjson
+  python main.py corpus/ --format parquet -o tables/
+  python main.py --serve --port 8080 --workers 2
+  python main.py corpus/ --index index.sqlite3 --no-export
+  python main.py --index index.sqlite3 --find-entity Paris --entity-label LOC
+  python main.py --index index.sqlite3 --find-relation "Marie Curie" Paris
         """
     )
     
     parser.add_argument(
         'file',
         type=str,
-        help='Chemin vers le fichier à analyser'
+        nargs='*',
+        help='Fichier à analyser, ou fichiers, répertoires et motifs glob en mode lot'
     )
     
     parser.add_argument(
         '-o', '--output',
         type=str,
         default=None,
-        help='Chemin du fichier de sortie JSON (par défaut: nom_du_fichier_analyse.json)'
+        help='Chemin du fichier de sortie JSON (par défaut: nom_du_fichier_analyse.json), '
+             'ou de la sortie unique du lot (NDJSON, Parquet, Arrow)'
     )
     
     parser.add_argument(
@@ -41,6 +500,30 @@ Exemples:
         help='Ne pas exporter les résultats, les afficher uniquement'
     )
     
+    parser.add_argument(
+        '--format',
+        choices=['json', 'ndjson', 'parquet', 'arrow'],
+        default='json',
+        help="Format d'export: un JSON indenté par document, un flux NDJSON compact, ou des "
+             "tables colonnaires Parquet/Arrow (répertoire, nécessite pyarrow) (par défaut: json)"
+    )
+    
+    parser.add_argument(
+        '--compression',
+        choices=['gzip', 'zstd'],
+        default=None,
+        help='Compression du flux NDJSON (zstd nécessite le paquet zstandard) '
+             'ou des tables Parquet/Arrow (par défaut: zstd pour Parquet, aucune pour NDJSON '
+             'et Arrow)'
+    )
+    
+    parser.add_argument(
+        '--rotate-size',
+        type=int,
+        default=None,
+        help='Taille en Mo au-delà de laquelle le flux NDJSON change de fichier'
+    )
+    
     parser.add_argument(
         '--model',
         type=str,
@@ -48,12 +531,293 @@ Exemples:
         help='Modèle spaCy à utiliser (par défaut: fr_core_news_sm)'
     )
     
+    parser.add_argument(
+        '--detect-language',
+        action='store_true',
+        help='Détecter la langue de chaque document et l\'analyser avec le modèle de cette '
+             'langue (--model pour les autres langues)'
+    )
+    
+    parser.add_argument(
+        '--language-model',
+        action='append',
+        default=None,
+        metavar='LANGUE=MODELE',
+        help='Modèle spaCy à utiliser pour une langue détectée, ex: en=en_core_web_md '
+             '(répétable, avec --detect-language)'
+    )
+    
+    parser.add_argument(
+        '--manifest',
+        type=str,
+        default=None,
+        help='Fichier listant les chemins à traiter (un par ligne), active le mode lot'
+    )
+    
+    parser.add_argument(
+        '--output-dir',
+        type=str,
+        default=None,
+        help='Répertoire de sortie des JSON en mode lot (par défaut: à côté de chaque fichier)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Nombre de processus spaCy en mode lot ou dans le service (par défaut: 1)'
+    )
+    
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=32,
+        help='Nombre de documents par lot envoyé à spaCy (par défaut: 32)'
+    )
+    
+    parser.add_argument(
+        '--pdf-workers',
+        type=int,
+        default=1,
+        help="Nombre de processus pour l'extraction des pages PDF (par défaut: 1)"
+    )
+    
+    parser.add_argument(
+        '--pdf-parallel-min-pages',
+        type=int,
+        default=200,
+        help='Nombre minimal de pages pour paralléliser un PDF (par défaut: 200)'
+    )
+    
+    parser.add_argument(
+        '--epub-workers',
+        type=int,
+        default=1,
+        help="Nombre de processus pour l'analyse HTML des chapitres EPUB (par défaut: 1)"
+    )
+    
+    parser.add_argument(
+        '--html-backend',
+        choices=['auto', 'lxml', 'bs4'],
+        default='auto',
+        help="Backend d'extraction HTML et EPUB (par défaut: auto, lxml si disponible)"
+    )
+    
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help="Lancer le service d'ingestion HTTP local au lieu de traiter des fichiers"
+    )
+    
+    parser.add_argument(
+        '--host',
+        type=str,
+        default='127.0.0.1',
+        help="Adresse d'écoute du service (par défaut: 127.0.0.1)"
+    )
+    
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=8080,
+        help="Port d'écoute du service (par défaut: 8080)"
+    )
+    
+    parser.add_argument(
+        '--queue-size',
+        type=int,
+        default=100,
+        help='Nombre maximal de demandes en attente dans le service (par défaut: 100)'
+    )
+    
+    parser.add_argument(
+        '--extract-workers',
+        type=int,
+        default=4,
+        help="Nombre de threads d'extraction du service (par défaut: 4)"
+    )
+    
+    parser.add_argument(
+        '--timings',
+        action='store_true',
+        help='Mesurer chaque étape (temps, mémoire) et ajouter un bloc "timings" aux exports'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        type=str,
+        default=None,
+        metavar='FICHIER',
+        help="Écrire un profil cProfile de l'exécution (lisible avec pstats)"
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=None,
+        help='Répertoire du cache de résultats (désactivé par défaut)'
+    )
+    
+    parser.add_argument(
+        '--cache-max-size',
+        type=int,
+        default=1024,
+        help='Taille maximale du cache en Mo (par défaut: 1024)'
+    )
+    
+    parser.add_argument(
+        '--dedup-index',
+        type=str,
+        default=None,
+        help='Fichier de l\'index des quasi-doublons : un document proche d\'un document '
+             'déjà analysé reprend son analyse (désactivé par défaut)'
+    )
+    
+    parser.add_argument(
+        '--dedup-threshold',
+        type=float,
+        default=0.8,
+        help='Similarité (Jaccard estimée) à partir de laquelle un document est un doublon '
+             '(par défaut: 0.8)'
+    )
+    
+    parser.add_argument(
+        '--index',
+        type=str,
+        default=None,
+        help='Fichier de l\'index des entités, relations et catégories : alimenté par '
+             'l\'analyse, interrogé par --find-entity, --find-category ou --find-relation'
+    )
+    
+    parser.add_argument(
+        '--find-entity',
+        type=str,
+        default=None,
+        metavar='TEXTE',
+        help='Lister les documents de l\'index mentionnant cette entité'
+    )
+    
+    parser.add_argument(
+        '--entity-label',
+        type=str,
+        default=None,
+        help='Restreindre --find-entity à un label (ex: PER, LOC), ou lister toutes les '
+             'entités de ce label'
+    )
+    
+    parser.add_argument(
+        '--prefix',
+        action='store_true',
+        help='Rechercher avec --find-entity les entités commençant par le texte donné'
+    )
+    
+    parser.add_argument(
+        '--find-category',
+        type=str,
+        default=None,
+        metavar='CATEGORIE',
+        help='Lister les documents de l\'index classés dans cette catégorie'
+    )
+    
+    parser.add_argument(
+        '--find-relation',
+        type=str,
+        nargs='+',
+        default=None,
+        metavar='ENTITE',
+        help='Lister les documents de l\'index reliant deux entités (ou impliquant une entité)'
+    )
+    
+    parser.add_argument(
+        '--relation-type',
+        type=str,
+        default=None,
+        help='Restreindre --find-relation à un type de relation'
+    )
+    
+    parser.add_argument(
+        '--limit',
+        type=int,
+        default=None,
+        help='Nombre maximal de résultats d\'une recherche dans l\'index'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Analyser les EPUB chapitre par chapitre et ne réanalyser que les chapitres '
+             'modifiés (nécessite --cache-dir)'
+    )
+    
     args = parser.parse_args()
     
+    if args.profile:
+        # Le profil est écrit à la sortie du programme, y compris en cas d'erreur
+        profiler = cProfile.Profile()
+        atexit.register(dump_profile, profiler, args.profile)
+        profiler.enable()
+    
+    ExtractorFactory.configure(
+        'pdf',
+        max_workers=args.pdf_workers,
+        parallel_min_pages=args.pdf_parallel_min_pages
+    )
+    for extension in ('html', 'htm'):
+        ExtractorFactory.configure(extension, backend=args.html_backend)
+    ExtractorFactory.configure('epub', max_workers=args.epub_workers, backend=args.html_backend)
+    
+    if args.incremental and not args.cache_dir:
+        parser.error("l'option --incremental nécessite --cache-dir")
+    
+    if args.language_model and not args.detect_language:
+        parser.error("l'option --language-model nécessite --detect-language")
+    if any('=' not in mapping for mapping in args.language_model or []):
+        parser.error("l'option --language-model attend LANGUE=MODELE")
+    
+    if args.serve:
+        run_service(args)
+        return
+    
+    queries = [args.find_entity, args.entity_label, args.find_category, args.find_relation]
+    if any(query is not None for query in queries):
+        if not args.index:
+            parser.error("les recherches dans l'index nécessitent --index")
+        if args.find_relation is not None and len(args.find_relation) > 2:
+            parser.error("l'option --find-relation attend une ou deux entités")
+        if not Path(args.index).exists():
+            print(f"Erreur: L'index '{args.index}' n'existe pas.", file=sys.stderr)
+            sys.exit(1)
+        run_query(args)
+        return
+    
+    if not args.file and not args.manifest:
+        parser.error('au moins un fichier, répertoire, motif ou --manifest est requis')
+    
+    # Mode lot : plusieurs entrées, un répertoire, un motif glob ou un manifeste
+    if (args.manifest or len(args.file) > 1 or Path(args.file[0]).is_dir()
+            or glob.has_magic(args.file[0])):
+        if args.output and args.format == 'json':
+            parser.error("l'option -o n'est pas disponible en mode lot avec --format json, "
+                         "utilisez --output-dir")
+        try:
+            files = collect_files(args.file, args.manifest)
+        except OSError as e:
+            print(f"Erreur: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+        if not files:
+            print("Erreur: Aucun fichier supporté trouvé.", file=sys.stderr)
+            sys.exit(1)
+        try:
+            run_batch(files, args)
+        except Exception as e:
+            print(f"Erreur: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+        return
+    
     # Vérifier que le fichier existe
-    file_path = Path(args.file)
+    file_path = Path(args.file[0])
     if not file_path.exists():
-        print(f"Erreur: Le fichier '{args.file}' n'existe pas.", file=sys.stderr)
+        print(f"Erreur: Le fichier '{args.file[0]}' n'existe pas.", file=sys.stderr)
         sys.exit(1)
     
     # Vérifier que le format est supporté
@@ -63,17 +827,30 @@ Exemples:
         sys.exit(1)
     
     try:
-        # 1. Extraction du contenu
-        print(f"Extraction du contenu depuis {file_path.name}...")
-        extractor = ExtractorFactory.get_extractor(str(file_path))
-        document = extractor.extract(str(file_path))
-        print(f"✓ Contenu extrait ({len(document.content)} caractères)")
-        
-        # 2. Analyse NLP
-        print("Analyse NLP en cours...")
-        pipeline = NLPPipeline(model_name=args.model)
-        analysis = pipeline.analyze(document)
-        print("✓ Analyse terminée")
+        instrumentation = create_instrumentation(args)
+        cache = open_cache(args)
+        pipeline = create_pipeline(args, instrumentation, cache)
+        cached = None
+        if cache:
+            cache_key = cache.make_key(str(file_path), cache_config(pipeline.get_config(), file_path))
+            cached = cache.get(cache_key, str(file_path))
+        
+        if cached:
+            document, analysis = cached
+            print("✓ Résultats récupérés depuis le cache")
+        else:
+            # 1. Extraction du contenu
+            print(f"Extraction du contenu depuis {file_path.name}...")
+            document = extract_document(file_path, instrumentation)
+            print(f"✓ Contenu extrait ({len(document.content)} caractères)")
+            
+            # 2. Analyse NLP
+            print("Analyse NLP en cours...")
+            analysis = pipeline.analyze(document)
+            print("✓ Analyse terminée")
+            
+            if cache:
+                cache.put(cache_key, document, analysis)
         
         # 3. Affichage des résultats
         print("\n" + "="*60)
@@ -84,6 +861,9 @@ Exemples:
             print(f"Auteur: {document.author}")
         print(f"Type: {document.file_type}")
         print(f"Langue détectée: {analysis.language or 'Non détectée'}")
+        if analysis.duplicate_of:
+            print(f"Doublon de: {analysis.duplicate_of['file_path']} "
+                  f"(similarité {analysis.duplicate_of['similarity']:.2f})")
         print(f"Nombre de mots: {analysis.word_count or 'N/A'}")
         print(f"Nombre de phrases: {analysis.sentence_count or 'N/A'}")
         
@@ -111,6 +891,10 @@ Exemples:
             if len(analysis.relations) > 5:
                 print(f"  ... et {len(analysis.relations) - 5} autres")
         
+        if analysis.timings:
+            print("\nTemps par étape:")
+            print_timings(analysis.timings)
+        
         print("="*60 + "\n")
         
         # 4. Export JSON
@@ -118,12 +902,26 @@ Exemples:
             if args.output:
                 output_path = args.output
             else:
-                output_path = file_path.with_suffix('.json')
+                output_path = file_path.with_suffix('.' + args.format)
             
-            exporter = JsonExporter()
+            exporter = create_exporter(args)
             exported_file = exporter.export(document, analysis, str(output_path))
+            if args.format != 'json':
+                exporter.close()
             print(f"✓ Résultats exportés dans: {exported_file}")
         
+        index = open_index(args)
+        if index:
+            index.add(document, analysis)
+            print_index_stats(index)
+            index.close()
+        
+        if cache:
+            print_cache_stats(cache)
+            cache.close()
+        if pipeline.duplicate_index is not None:
+            pipeline.duplicate_index.close()
+        
     except Exception as e:
         print(f"Erreur: {str(e)}", file=sys.stderr)
         sys.exit(1)
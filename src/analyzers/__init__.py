@@ -3,16 +3,22 @@
 from .base_analyzer import BaseAnalyzer
 from .entity_analyzer import EntityAnalyzer
 from .sentiment_analyzer import SentimentAnalyzer
+from .sentiment_lexicon import SentimentLexicon
 from .category_analyzer import CategoryAnalyzer
 from .relation_analyzer import RelationAnalyzer
+from .language_detector import LanguageDetector
 from .nlp_pipeline import NLPPipeline
+from .model_registry import load_model
 
 __all__ = [
     'BaseAnalyzer',
     'EntityAnalyzer',
     'SentimentAnalyzer',
+    'SentimentLexicon',
     'CategoryAnalyzer',
     'RelationAnalyzer',
-    'NLPPipeline'
+    'LanguageDetector',
+    'NLPPipeline',
+    'load_model'
 ]
 
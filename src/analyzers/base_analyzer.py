@@ -1,6 +1,7 @@
 """Classe abstraite de base pour tous les analyseurs."""
 
 from abc import ABC, abstractmethod
+from typing import FrozenSet, Optional
 from src.models.document import Document
 from src.models.analysis import Analysis
 
@@ -8,14 +9,25 @@ from src.models.analysis import Analysis
 class BaseAnalyzer(ABC):
     """Interface abstraite pour tous les analyseurs NLP."""
     
+    # Indique si l'analyseur a besoin du Doc spaCy partagé par le pipeline
+    requires_doc: bool = False
+    
+    # Attributs du Doc lus par l'analyseur (ex: 'doc.ents', 'token.pos'), permettant
+    # au pipeline de ne charger que les composants spaCy utiles (None: tous)
+    spacy_attributes: Optional[FrozenSet[str]] = None
+    
+    # Version de l'algorithme, à incrémenter dès que les résultats produits changent
+    version: str = '1.0'
+    
     @abstractmethod
-    def analyze(self, document: Document, analysis: Analysis) -> Analysis:
+    def analyze(self, document: Document, analysis: Analysis, doc=None) -> Analysis:
         """
         Analyse un document et met à jour l'objet Analysis.
         
         Args:
             document: Document à analyser
             analysis: Objet Analysis à mettre à jour
+            doc: Doc spaCy déjà calculé par le pipeline (None si indisponible)
             
         Returns:
             Analysis: Objet Analysis mis à jour avec les résultats
@@ -1,8 +1,8 @@
 """Analyseur pour la catégorisation de documents."""
 
-import re
-from collections import Counter
+from typing import Dict, List, Optional
 from src.analyzers.base_analyzer import BaseAnalyzer
+from src.analyzers.keyword_matcher import KeywordMatcher
 from src.models.document import Document
 from src.models.analysis import Analysis
 
@@ -28,13 +28,36 @@ class CategoryAnalyzer(BaseAnalyzer):
                    'laboratoire', 'scientifique', 'étude', 'publication']
     }
     
-    def analyze(self, document: Document, analysis: Analysis) -> Analysis:
+    # Automate compilé une seule fois au chargement de la classe
+    _DEFAULT_MATCHER = KeywordMatcher(CATEGORY_KEYWORDS)
+    
+    def __init__(self, category_keywords: Optional[Dict[str, List[str]]] = None,
+                 keywords_file: Optional[str] = None):
+        """
+        Initialise l'analyseur de catégories.
+        
+        Args:
+            category_keywords: Taxonomie catégorie -> mots-clés (par défaut: CATEGORY_KEYWORDS)
+            keywords_file: Fichier de taxonomie (JSON ou TSV) à charger à la place
+        """
+        if keywords_file:
+            self.matcher = KeywordMatcher.from_file(keywords_file)
+        elif category_keywords is not None:
+            self.matcher = KeywordMatcher(category_keywords)
+        elif self.CATEGORY_KEYWORDS is CategoryAnalyzer.CATEGORY_KEYWORDS:
+            self.matcher = self._DEFAULT_MATCHER
+        else:
+            # Sous-classe redéfinissant CATEGORY_KEYWORDS
+            self.matcher = KeywordMatcher(self.CATEGORY_KEYWORDS)
+    
+    def analyze(self, document: Document, analysis: Analysis, doc=None) -> Analysis:
         """
         Catégorise le document en fonction de son contenu.
         
         Args:
             document: Document à analyser
             analysis: Objet Analysis à mettre à jour
+            doc: Doc spaCy partagé par le pipeline (non utilisé)
             
         Returns:
             Analysis: Objet Analysis mis à jour avec les catégories
@@ -42,28 +65,44 @@ class CategoryAnalyzer(BaseAnalyzer):
         if not document.content:
             return analysis
         
-        content_lower = document.content.lower()
-        category_scores = {}
+        return self.apply_scores(analysis, self.score(document))
+    
+    def score(self, document: Document) -> Dict[str, int]:
+        """
+        Calcule le score de chaque catégorie (nombre d'occurrences de ses mots-clés).
         
-        # Calcul du score pour chaque catégorie
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            score = 0
-            for keyword in keywords:
-                # Compter les occurrences du mot-clé
-                count = len(re.findall(r'\b' + re.escape(keyword) + r'\b', content_lower))
-                score += count
+        Les scores sont additifs : ceux de plusieurs segments d'un document
+        peuvent être sommés (voir NLPPipeline, mode incrémental).
+        
+        Args:
+            document: Document (ou segment de document) à évaluer
             
-            if score > 0:
-                category_scores[category] = score
+        Returns:
+            Dict[str, int]: Score par catégorie (uniquement les scores non nuls)
+        """
+        # Calcul du score de toutes les catégories en une seule passe
+        return self.matcher.score(document.content.lower())
+    
+    def apply_scores(self, analysis: Analysis, category_scores: Dict[str, int]) -> Analysis:
+        """
+        Retient les catégories dont le score est significatif.
         
+        Args:
+            analysis: Objet Analysis à mettre à jour
+            category_scores: Score par catégorie
+            
+        Returns:
+            Analysis: Objet Analysis mis à jour avec les catégories
+        """
         # Sélection des catégories avec un score significatif
         if category_scores:
             max_score = max(category_scores.values())
             threshold = max_score * 0.3  # Au moins 30% du score maximum
             
+            # Ordre de déclaration des catégories, quel que soit l'ordre des scores reçus
             analysis.categories = [
-                category for category, score in category_scores.items() 
-                if score >= threshold
+                category for category in self.matcher.categories
+                if category_scores.get(category, 0) >= threshold
             ]
             # Trier par score décroissant
             analysis.categories.sort(key=lambda c: category_scores[c], reverse=True)
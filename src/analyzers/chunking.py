@@ -0,0 +1,99 @@
+"""Découpage des longs documents en fenêtres bornées pour spaCy."""
+
+import re
+from typing import Iterator, Tuple
+
+# Taille maximale d'une fenêtre (bien en dessous du max_length de spaCy, 1 000 000)
+DEFAULT_CHUNK_CHARS = 100_000
+
+# Clé de Doc.user_data contenant la position du bloc dans le contenu d'origine
+CHAR_OFFSET_KEY = 'char_offset'
+
+_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+_SENTENCE_BREAK = re.compile(r'(?<=[.!?…])\s+')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def split_text(text: str, max_chars: int = DEFAULT_CHUNK_CHARS) -> Iterator[Tuple[int, str]]:
+    """
+    Découpe un texte en blocs d'au plus max_chars caractères.
+    
+    Les coupures se font de préférence entre paragraphes, puis entre phrases,
+    puis sur un espace ; un mot plus long que max_chars est coupé brutalement.
+    Les espaces de séparation ne sont inclus dans aucun bloc.
+    
+    Args:
+        text: Texte à découper
+        max_chars: Taille maximale d'un bloc
+        
+    Yields:
+        Tuple[int, str]: Position du bloc dans le texte d'origine et texte du bloc
+    """
+    start = 0
+    length = len(text)
+    
+    while start < length:
+        # Ignorer les espaces entre deux blocs
+        while start < length and text[start].isspace():
+            start += 1
+        if start >= length:
+            break
+        
+        end = start + max_chars
+        if end >= length:
+            yield start, text[start:]
+            break
+        
+        cut = None
+        for separator in (_PARAGRAPH_BREAK, _SENTENCE_BREAK, _WHITESPACE):
+            # Dernier séparateur dans la seconde moitié de la fenêtre
+            last = None
+            for match in separator.finditer(text, start + max_chars // 2, end):
+                last = match
+            if last is not None:
+                cut = last.start()
+                break
+        
+        if cut is None or cut <= start:
+            cut = end
+        
+        yield start, text[start:cut]
+        start = cut
+
+
+def iter_docs(nlp, text: str, max_chars: int = DEFAULT_CHUNK_CHARS,
+              batch_size: int = 4) -> Iterator:
+    """
+    Analyse un texte avec spaCy, par fenêtres bornées s'il est trop long.
+    
+    Chaque Doc produit porte sa position dans le texte d'origine dans
+    doc.user_data[CHAR_OFFSET_KEY], afin de recaler les positions des entités.
+    
+    Args:
+        nlp: Modèle spaCy
+        text: Texte à analyser
+        max_chars: Taille maximale d'une fenêtre
+        batch_size: Nombre de fenêtres envoyées ensemble à nlp.pipe
+        
+    Yields:
+        Doc: Doc spaCy de chaque fenêtre, dans l'ordre du texte
+    """
+    if len(text) <= max_chars:
+        doc = nlp(text)
+        doc.user_data[CHAR_OFFSET_KEY] = 0
+        yield doc
+        return
+    
+    for doc, offset in nlp.pipe(
+        ((chunk, offset) for offset, chunk in split_text(text, max_chars)),
+        as_tuples=True,
+        batch_size=batch_size
+    ):
+        doc.user_data[CHAR_OFFSET_KEY] = offset
+        yield doc
+
+
+def get_offset(doc) -> int:
+    """Retourne la position d'un Doc dans le contenu d'origine (0 s'il n'a pas été découpé)."""
+    return doc.user_data.get(CHAR_OFFSET_KEY, 0)
+
@@ -1,15 +1,21 @@
 """Analyseur pour l'extraction d'entités nommées."""
 
-import spacy
 from typing import Optional
 from src.analyzers.base_analyzer import BaseAnalyzer
+from src.analyzers.model_registry import load_model
+from src.analyzers.chunking import iter_docs, get_offset
 from src.models.document import Document
-from src.models.analysis import Analysis, Entity
+from src.models.analysis import Analysis
 
 
 class EntityAnalyzer(BaseAnalyzer):
     """Analyseur pour extraire les entités nommées d'un document."""
     
+    requires_doc = True
+    
+    # Entités, et phrases pour sentence_count (le parser n'est pas nécessaire)
+    spacy_attributes = frozenset(['doc.ents', 'doc.sents'])
+    
     def __init__(self, model_name: str = 'fr_core_news_sm'):
         """
         Initialise l'analyseur d'entités.
@@ -17,23 +23,22 @@ class EntityAnalyzer(BaseAnalyzer):
         Args:
             model_name: Nom du modèle spaCy à utiliser (par défaut: fr_core_news_sm)
         """
-        try:
-            self.nlp = spacy.load(model_name)
-        except OSError:
-            # Fallback sur le modèle anglais si le modèle français n'est pas disponible
-            try:
-                self.nlp = spacy.load('en_core_web_sm')
-            except OSError:
-                # Si aucun modèle n'est disponible, on utilisera un modèle minimal
-                self.nlp = spacy.load('xx_ent_wiki_sm')
+        self.model_name = model_name
     
-    def analyze(self, document: Document, analysis: Analysis) -> Analysis:
+    @property
+    def nlp(self):
+        """Modèle spaCy, chargé au premier usage et partagé avec les autres analyseurs."""
+        return load_model(self.model_name)
+    
+    def analyze(self, document: Document, analysis: Analysis, doc=None) -> Analysis:
         """
         Extrait les entités nommées du document.
         
         Args:
             document: Document à analyser
             analysis: Objet Analysis à mettre à jour
+            doc: Doc spaCy partagé par le pipeline, éventuellement un bloc d'un long
+                document (analysé ici par blocs si absent)
             
         Returns:
             Analysis: Objet Analysis mis à jour avec les entités extraites
@@ -41,26 +46,40 @@ class EntityAnalyzer(BaseAnalyzer):
         if not document.content:
             return analysis
         
-        doc = self.nlp(document.content)
+        # Les textes d'entités sont relus dans le contenu au lieu d'être copiés
+        if analysis.entities.content is None:
+            analysis.entities.content = document.content
+        
+        if doc is None:
+            for chunk_doc in iter_docs(self.nlp, document.content):
+                self._analyze_doc(chunk_doc, analysis)
+        else:
+            self._analyze_doc(doc, analysis)
+        
+        return analysis
+    
+    def _analyze_doc(self, doc, analysis: Analysis):
+        """
+        Ajoute à l'analyse les entités et les comptages d'un Doc (ou d'un bloc).
+        
+        Args:
+            doc: Doc spaCy, dont la position dans le contenu est donnée par get_offset
+            analysis: Objet Analysis à mettre à jour
+        """
+        offset = get_offset(doc)
         
-        # Extraction des entités nommées
+        # Extraction des entités nommées, positions recalées sur le contenu d'origine
+        # (spaCy ne fournit pas de score de confiance par défaut)
+        entities = analysis.entities
         for ent in doc.ents:
-            entity = Entity(
-                text=ent.text,
-                label=ent.label_,
-                start=ent.start_char,
-                end=ent.end_char,
-                confidence=None  # spaCy ne fournit pas de score de confiance par défaut
-            )
-            analysis.entities.append(entity)
+            entities.add(ent.text, ent.label_, ent.start_char + offset, ent.end_char + offset)
         
-        # Détection de la langue
-        if hasattr(doc, 'lang_'):
+        # Langue du modèle, sauf si le pipeline a déjà fixé la langue détectée
+        if hasattr(doc, 'lang_') and not analysis.language:
             analysis.language = doc.lang_
         
-        # Comptage des mots et phrases
-        analysis.word_count = len([token for token in doc if not token.is_punct and not token.is_space])
-        analysis.sentence_count = len(list(doc.sents))
-        
-        return analysis
+        # Comptage des mots et phrases, cumulés d'un bloc à l'autre
+        word_count = len([token for token in doc if not token.is_punct and not token.is_space])
+        analysis.word_count = (analysis.word_count or 0) + word_count
+        analysis.sentence_count = (analysis.sentence_count or 0) + len(list(doc.sents))
 
@@ -0,0 +1,184 @@
+"""Recherche de mots-clés en une seule passe sur le texte."""
+
+import json
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+
+class KeywordMatcher:
+    """
+    Compte les occurrences d'un ensemble de mots-clés en une seule passe.
+    
+    Les mots-clés sont compilés en une expression régulière unique organisée
+    en trie : le coût par position du texte dépend de la longueur des mots-clés
+    et non de leur nombre, ce qui permet de charger des taxonomies de
+    plusieurs milliers de termes. La sémantique reste celle de
+    ``\\b<mot-clé>\\b`` appliqué séparément pour chaque mot-clé au texte en
+    minuscules : l'expression est une assertion avant (les correspondances
+    peuvent se chevaucher) qui retient le plus long mot-clé commençant à chaque
+    position, et les mots-clés plus courts qu'il contient (« intelligence »
+    dans « intelligence artificielle ») sont comptés eux aussi.
+    """
+    
+    def __init__(self, category_keywords: Dict[str, Iterable[str]]):
+        """
+        Compile la taxonomie de mots-clés.
+        
+        Args:
+            category_keywords: Dictionnaire catégorie -> liste de mots-clés
+        """
+        self.categories: List[str] = list(category_keywords)
+        self.keyword_categories: Dict[str, List[str]] = {}
+        
+        for category, keywords in category_keywords.items():
+            for keyword in keywords:
+                keyword = keyword.strip().lower()
+                if not keyword:
+                    continue
+                categories = self.keyword_categories.setdefault(keyword, [])
+                if category not in categories:
+                    categories.append(category)
+        
+        # Mots-clés reconnus lorsqu'un mot-clé est trouvé : lui-même et ses préfixes
+        # suivis d'une limite de mot (la limite ne dépend que des caractères du mot-clé)
+        self._prefix_keywords: Dict[str, List[str]] = {
+            keyword: [keyword] + [
+                keyword[:end] for end in range(len(keyword) - 1, 0, -1)
+                if keyword[:end] in self.keyword_categories and self._is_boundary(keyword, end)
+            ]
+            for keyword in self.keyword_categories
+        }
+        
+        self.pattern = None
+        if self.keyword_categories:
+            trie = self._build_trie(self.keyword_categories)
+            self.pattern = re.compile(r'\b(?=(' + self._trie_to_regex(trie) + r')\b)')
+    
+    @classmethod
+    def from_file(cls, file_path: str) -> 'KeywordMatcher':
+        """
+        Charge une taxonomie depuis un fichier.
+        
+        Formats acceptés :
+            - JSON : ``{"catégorie": ["mot1", "mot2", ...], ...}``
+            - Texte : une ligne ``mot-clé<TAB>catégorie`` par terme
+              (les lignes vides ou commençant par ``#`` sont ignorées)
+            
+        Args:
+            file_path: Chemin vers le fichier de taxonomie
+            
+        Returns:
+            KeywordMatcher: Matcher compilé
+            
+        Raises:
+            FileNotFoundError: Si le fichier n'existe pas
+            ValueError: Si le fichier est mal formé
+        """
+        path = Path(file_path)
+        
+        if not path.exists():
+            raise FileNotFoundError(f"Le fichier {file_path} n'existe pas.")
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            if path.suffix.lower() == '.json':
+                data = json.load(f)
+                if not isinstance(data, dict):
+                    raise ValueError("La taxonomie JSON doit être un objet catégorie -> mots-clés.")
+                return cls(data)
+            
+            category_keywords: Dict[str, List[str]] = {}
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                parts = line.split('\t')
+                if len(parts) != 2:
+                    raise ValueError(
+                        f"Ligne {line_number} invalide dans {file_path}: "
+                        f"format attendu 'mot-clé<TAB>catégorie'"
+                    )
+                keyword, category = parts
+                category_keywords.setdefault(category.strip(), []).append(keyword)
+        
+        return cls(category_keywords)
+    
+    def count_keywords(self, text: str) -> Counter:
+        """
+        Compte les occurrences de chaque mot-clé dans le texte.
+        
+        Args:
+            text: Texte déjà converti en minuscules
+            
+        Returns:
+            Counter: Nombre d'occurrences par mot-clé trouvé
+        """
+        counts: Counter = Counter()
+        if self.pattern is None:
+            return counts
+        
+        # Fin de la dernière occurrence comptée de chaque mot-clé : comme une recherche
+        # séparée, deux occurrences d'un même mot-clé ne se chevauchent pas
+        last_end: Dict[str, int] = {}
+        for match in self.pattern.finditer(text):
+            start = match.start()
+            for keyword in self._prefix_keywords[match.group(1)]:
+                if start >= last_end.get(keyword, 0):
+                    counts[keyword] += 1
+                    last_end[keyword] = start + len(keyword)
+        return counts
+    
+    def score(self, text: str) -> Dict[str, int]:
+        """
+        Calcule le score de chaque catégorie en une seule passe.
+        
+        Args:
+            text: Texte déjà converti en minuscules
+            
+        Returns:
+            Dict[str, int]: Score par catégorie (uniquement les scores non nuls)
+        """
+        scores: Dict[str, int] = {}
+        for keyword, count in self.count_keywords(text).items():
+            for category in self.keyword_categories[keyword]:
+                scores[category] = scores.get(category, 0) + count
+        
+        # Conserver l'ordre de déclaration des catégories
+        return {category: scores[category] for category in self.categories if category in scores}
+    
+    @staticmethod
+    def _is_boundary(keyword: str, end: int) -> bool:
+        """Indique si \\b est vérifié entre keyword[end - 1] et keyword[end]."""
+        return bool(re.match(r'\w', keyword[end - 1])) != bool(re.match(r'\w', keyword[end]))
+    
+    @staticmethod
+    def _build_trie(keywords: Iterable[str]) -> dict:
+        """Construit un trie caractère par caractère ('' marque une fin de mot)."""
+        trie: dict = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = {}
+        return trie
+    
+    @classmethod
+    def _trie_to_regex(cls, node: dict) -> str:
+        """Convertit un nœud du trie en expression régulière (alternatives les plus longues d'abord)."""
+        is_end = '' in node
+        branches = [
+            re.escape(char) + cls._trie_to_regex(child)
+            for char, child in sorted(node.items())
+            if char != ''
+        ]
+        
+        if not branches:
+            return ''
+        
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if is_end:
+            # Quantificateur gourmand : le mot-clé le plus long est essayé en premier
+            body = ('(?:' + body + ')' if len(branches) == 1 else body) + '?'
+        return body
+
@@ -0,0 +1,186 @@
+"""Détection rapide de la langue d'un texte par n-grammes de caractères."""
+
+import json
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Optional
+
+# Textes de référence servant à construire les profils de n-grammes de chaque langue
+LANGUAGE_SAMPLES = {
+    'fr': (
+        "Le présent rapport décrit les résultats de l'étude menée au cours de l'année "
+        "dernière par les équipes de recherche. Les données ont été collectées auprès des "
+        "entreprises de la région, puis analysées afin de mieux comprendre leurs besoins. "
+        "Il est apparu que la plupart des sociétés souhaitent développer leurs activités à "
+        "l'international, mais qu'elles manquent souvent de moyens pour le faire. Nous "
+        "recommandons donc la mise en place d'un programme d'accompagnement qui permettra "
+        "aux dirigeants de bénéficier de conseils adaptés à leur situation. Cette démarche "
+        "doit être conduite avec les collectivités locales et les chambres de commerce. "
+        "Elle était très attendue par les acteurs économiques, qui ont exprimé leur "
+        "satisfaction lors des réunions organisées cette semaine. La ville a également "
+        "annoncé que les travaux du nouveau quartier commenceront au printemps prochain."
+    ),
+    'en': (
+        "This report describes the results of the study carried out over the last year "
+        "by the research teams. The data were collected from companies in the region and "
+        "then analysed in order to better understand their needs. It appeared that most "
+        "businesses would like to expand their activities abroad, but they often lack the "
+        "resources to do so. We therefore recommend setting up a support programme which "
+        "will allow managers to receive advice that is suited to their situation. This "
+        "approach should be carried out with local authorities and chambers of commerce. "
+        "It was eagerly awaited by the business community, who expressed their "
+        "satisfaction during the meetings held this week. The city has also announced "
+        "that work on the new district will begin next spring, with the highest standards."
+    ),
+    'de': (
+        "Der vorliegende Bericht beschreibt die Ergebnisse der Studie, die im vergangenen "
+        "Jahr von den Forschungsteams durchgeführt wurde. Die Daten wurden bei Unternehmen "
+        "der Region erhoben und anschließend ausgewertet, um ihre Bedürfnisse besser zu "
+        "verstehen. Es hat sich gezeigt, dass die meisten Firmen ihre Tätigkeit im Ausland "
+        "ausbauen möchten, dafür aber häufig nicht über die nötigen Mittel verfügen. Wir "
+        "empfehlen daher die Einrichtung eines Förderprogramms, das den Geschäftsführern "
+        "eine auf ihre Lage zugeschnittene Beratung ermöglicht. Die Stadt hat außerdem "
+        "angekündigt, dass die Arbeiten im neuen Viertel im nächsten Frühjahr beginnen."
+    ),
+    'es': (
+        "El presente informe describe los resultados del estudio realizado durante el año "
+        "pasado por los equipos de investigación. Los datos se recogieron en las empresas "
+        "de la región y después se analizaron para comprender mejor sus necesidades. Se "
+        "observó que la mayoría de las sociedades desean desarrollar sus actividades en el "
+        "extranjero, pero que a menudo carecen de medios para hacerlo. Por lo tanto, "
+        "recomendamos poner en marcha un programa de acompañamiento que permita a los "
+        "directivos recibir consejos adaptados a su situación. La ciudad también anunció "
+        "que las obras del nuevo barrio comenzarán la próxima primavera."
+    ),
+    'it': (
+        "La presente relazione descrive i risultati dello studio condotto nel corso "
+        "dell'anno scorso dai gruppi di ricerca. I dati sono stati raccolti presso le "
+        "aziende della regione e poi analizzati per comprendere meglio le loro esigenze. "
+        "È emerso che la maggior parte delle società desidera sviluppare le proprie "
+        "attività all'estero, ma spesso non dispone dei mezzi per farlo. Raccomandiamo "
+        "quindi l'avvio di un programma di accompagnamento che consenta ai dirigenti di "
+        "ricevere consigli adatti alla loro situazione. La città ha inoltre annunciato che "
+        "i lavori del nuovo quartiere inizieranno la prossima primavera."
+    )
+}
+
+_NON_LETTERS = re.compile(r"[^\w']+|[\d_]+")
+
+
+class LanguageDetector:
+    """
+    Détecteur de langue par profils de n-grammes de caractères.
+    
+    Seul un préfixe du texte (sample_chars caractères) est examiné : la détection
+    coûte quelques millisecondes quelle que soit la taille du document. Tout objet
+    offrant une méthode detect(text) -> Optional[str] peut être utilisé à sa place
+    par le pipeline.
+    """
+    
+    def __init__(self, samples: Optional[Dict[str, str]] = None, ngram: int = 3,
+                 sample_chars: int = 2000, min_letters: int = 20):
+        """
+        Construit les profils de chaque langue.
+        
+        Args:
+            samples: Langue -> texte de référence (par défaut: LANGUAGE_SAMPLES)
+            ngram: Longueur des n-grammes de caractères
+            sample_chars: Nombre de caractères examinés au début de chaque texte
+            min_letters: Nombre minimal de lettres en dessous duquel aucune langue
+                n'est retournée
+        """
+        self.ngram = ngram
+        self.sample_chars = sample_chars
+        self.min_letters = min_letters
+        
+        # Fréquences normalisées des n-grammes de chaque langue
+        self._profiles: Dict[str, Dict[str, float]] = {
+            language: self._normalize(self._ngrams(text))
+            for language, text in (samples or LANGUAGE_SAMPLES).items()
+        }
+    
+    @classmethod
+    def from_file(cls, file_path: str, **kwargs) -> 'LanguageDetector':
+        """
+        Construit un détecteur depuis un fichier JSON ``{"langue": "texte de référence", ...}``.
+        
+        Args:
+            file_path: Chemin vers le fichier des textes de référence
+            **kwargs: Autres paramètres du détecteur
+            
+        Returns:
+            LanguageDetector: Détecteur construit
+            
+        Raises:
+            FileNotFoundError: Si le fichier n'existe pas
+            ValueError: Si le fichier est mal formé
+        """
+        path = Path(file_path)
+        
+        if not path.exists():
+            raise FileNotFoundError(f"Le fichier {file_path} n'existe pas.")
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            samples = json.load(f)
+        if not isinstance(samples, dict) or not all(isinstance(v, str) for v in samples.values()):
+            raise ValueError("Le fichier de langues doit être un objet langue -> texte de référence.")
+        return cls(samples, **kwargs)
+    
+    @property
+    def languages(self):
+        """Langues reconnues par le détecteur."""
+        return list(self._profiles)
+    
+    def detect(self, text: str) -> Optional[str]:
+        """
+        Détecte la langue d'un texte à partir de son préfixe.
+        
+        Args:
+            text: Texte à examiner
+            
+        Returns:
+            Optional[str]: Code de la langue la plus probable, ou None si le texte
+            est trop court
+        """
+        scores = self.scores(text)
+        if not scores:
+            return None
+        return max(scores, key=scores.get)
+    
+    def scores(self, text: str) -> Dict[str, float]:
+        """
+        Calcule la similarité cosinus entre les n-grammes du préfixe et chaque langue.
+        
+        Args:
+            text: Texte à examiner
+            
+        Returns:
+            Dict[str, float]: Score de chaque langue (vide si le texte est trop court)
+        """
+        sample = text[:self.sample_chars]
+        if sum(char.isalpha() for char in sample) < self.min_letters:
+            return {}
+        
+        vector = self._normalize(self._ngrams(sample))
+        return {
+            language: sum(weight * profile.get(gram, 0.0) for gram, weight in vector.items())
+            for language, profile in self._profiles.items()
+        }
+    
+    def _ngrams(self, text: str) -> Counter:
+        """Compte les n-grammes de caractères des mots du texte (bornés par des espaces)."""
+        counts = Counter()
+        n = self.ngram
+        for word in _NON_LETTERS.sub(' ', text.lower()).split():
+            padded = f' {word} '
+            counts.update(padded[i:i + n] for i in range(len(padded) - n + 1))
+        return counts
+    
+    @staticmethod
+    def _normalize(counts: Counter) -> Dict[str, float]:
+        """Normalise des comptages en vecteur de norme 1 (indépendant de la longueur du texte)."""
+        norm = math.sqrt(sum(count * count for count in counts.values())) or 1.0
+        return {gram: count / norm for gram, count in counts.items()}
+
@@ -0,0 +1,144 @@
+"""Registre des modèles spaCy partagés au sein d'un processus."""
+
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# Modèles de repli, essayés dans l'ordre si le modèle demandé est absent
+FALLBACK_MODELS = ['en_core_web_sm', 'xx_ent_wiki_sm']
+
+# Attributs produits par les composants des pipelines entraînés de spaCy
+COMPONENT_ATTRIBUTES = {
+    'tagger': frozenset(['token.tag']),
+    'morphologizer': frozenset(['token.morph', 'token.pos']),
+    'attribute_ruler': frozenset(['token.pos', 'token.tag', 'token.morph']),
+    'lemmatizer': frozenset(['token.lemma']),
+    'trainable_lemmatizer': frozenset(['token.lemma']),
+    'parser': frozenset(['token.dep', 'token.head', 'token.is_sent_start', 'doc.sents']),
+    'senter': frozenset(['token.is_sent_start', 'doc.sents']),
+    'ner': frozenset(['doc.ents', 'token.ent_iob', 'token.ent_type'])
+}
+
+# Attributs dont un composant a besoin en entrée
+COMPONENT_REQUIRES = {
+    'attribute_ruler': frozenset(['token.tag']),
+    'lemmatizer': frozenset(['token.pos'])
+}
+
+# Limites de phrases : fournies par le composant le moins coûteux disponible
+# (parser s'il est conservé, sinon senter, sinon un sentencizer à base de règles)
+SENTENCE_ATTRIBUTES = frozenset(['doc.sents', 'token.is_sent_start'])
+
+# Modèles déjà chargés, indexés par nom de modèle demandé et attributs utilisés
+_models: Dict[Tuple[str, Optional[FrozenSet[str]]], 'spacy.language.Language'] = {}
+
+
+def components_to_exclude(attributes: Iterable[str]) -> List[str]:
+    """
+    Détermine les composants spaCy inutiles pour produire les attributs demandés.
+    
+    Seuls les composants standards des pipelines entraînés (COMPONENT_ATTRIBUTES)
+    peuvent être exclus : un composant personnalisé est toujours conservé.
+    
+    Args:
+        attributes: Attributs lus par les analyseurs (ex: 'doc.ents', 'token.pos')
+        
+    Returns:
+        List[str]: Noms des composants à exclure au chargement
+    """
+    attributes = frozenset(attributes)
+    needed = set(attributes - SENTENCE_ATTRIBUTES)
+    kept = set()
+    
+    # Fermeture transitive : un composant conservé peut en exiger d'autres
+    changed = True
+    while changed:
+        changed = False
+        for name, assigns in COMPONENT_ATTRIBUTES.items():
+            if name not in kept and assigns & needed:
+                kept.add(name)
+                needed |= COMPONENT_REQUIRES.get(name, frozenset())
+                changed = True
+    
+    if attributes & SENTENCE_ATTRIBUTES and 'parser' not in kept:
+        kept.add('senter')
+    
+    return sorted(set(COMPONENT_ATTRIBUTES) - kept)
+
+
+def load_model(model_name: str = 'fr_core_news_sm', attributes: Optional[Iterable[str]] = None,
+               fallbacks: Optional[List[str]] = None):
+    """
+    Retourne le modèle spaCy demandé, en le chargeant une seule fois par processus.
+    
+    Le registre sert de réserve de modèles : plusieurs modèles (un par langue, par
+    exemple) peuvent y rester chargés simultanément.
+    
+    Args:
+        model_name: Nom du modèle spaCy à utiliser
+        attributes: Attributs du Doc réellement utilisés ; les composants inutiles
+            sont alors exclus du chargement (None: modèle complet)
+        fallbacks: Modèles de repli essayés si le modèle est absent
+            (par défaut: FALLBACK_MODELS, liste vide pour n'en essayer aucun)
+            
+    Returns:
+        Language: Modèle spaCy chargé (ou modèle de repli si indisponible)
+        
+    Raises:
+        OSError: Si aucun modèle (ni de repli) n'est installé
+    """
+    key = (model_name, frozenset(attributes) if attributes is not None else None)
+    
+    if key not in _models:
+        # Import différé : spaCy n'est chargé que lorsqu'un modèle est réellement utilisé
+        import spacy
+        
+        exclude = components_to_exclude(key[1]) if key[1] is not None else []
+        try:
+            nlp = spacy.load(model_name, exclude=exclude)
+        except OSError:
+            # Fallback sur le modèle anglais puis sur le modèle multilingue
+            nlp = None
+            for fallback in (FALLBACK_MODELS if fallbacks is None else fallbacks):
+                try:
+                    nlp = spacy.load(fallback, exclude=exclude)
+                    break
+                except OSError:
+                    continue
+            if nlp is None:
+                raise
+        if key[1] is not None:
+            _complete_pipeline(nlp, key[1])
+        _models[key] = nlp
+    
+    return _models[key]
+
+
+def _complete_pipeline(nlp, attributes: FrozenSet[str]):
+    """
+    Ajuste un modèle chargé partiellement aux attributs demandés.
+    
+    Les limites de phrases sont assurées par senter (activé s'il est présent) ou
+    par un sentencizer lorsque le parser a été exclu, et les composants tok2vec
+    dont plus aucun composant actif n'utilise la sortie sont désactivés.
+    
+    Args:
+        nlp: Modèle spaCy chargé avec exclude
+        attributes: Attributs du Doc utilisés
+    """
+    if attributes & SENTENCE_ATTRIBUTES and not any(
+        'token.is_sent_start' in nlp.get_pipe_meta(name).assigns for name in nlp.pipe_names
+    ):
+        if 'senter' in nlp.disabled:
+            nlp.enable_pipe('senter')
+        else:
+            nlp.add_pipe('sentencizer')
+    
+    for name in nlp.pipe_names:
+        listeners = getattr(nlp.get_pipe(name), 'listening_components', None)
+        if listeners is not None and not set(listeners) & set(nlp.pipe_names):
+            nlp.disable_pipe(name)
+
+
+def clear_models():
+    """Vide le registre (utile pour libérer la mémoire entre deux lots)."""
+    _models.clear()
+
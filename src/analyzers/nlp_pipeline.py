@@ -1,25 +1,68 @@
 """Pipeline NLP orchestrant tous les analyseurs."""
 
-from typing import List
+import hashlib
+import json
+from collections import deque
+from contextlib import nullcontext
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 from src.analyzers.base_analyzer import BaseAnalyzer
 from src.analyzers.entity_analyzer import EntityAnalyzer
-from src.analyzers.sentiment_analyzer import SentimentAnalyzer
+from src.analyzers.sentiment_analyzer import SEGMENT_KEY, SentimentAnalyzer
 from src.analyzers.category_analyzer import CategoryAnalyzer
 from src.analyzers.relation_analyzer import RelationAnalyzer
+from src.analyzers.model_registry import load_model
+from src.analyzers.chunking import DEFAULT_CHUNK_CHARS, iter_docs
 from src.models.document import Document
-from src.models.analysis import Analysis
+from src.models.analysis import Analysis, Relation
+from src.instrumentation.stage_timer import Instrumentation
+
+# Modèle spaCy utilisé pour chaque langue détectée
+DEFAULT_LANGUAGE_MODELS = {
+    'fr': 'fr_core_news_sm',
+    'en': 'en_core_web_sm',
+    'de': 'de_core_news_sm',
+    'es': 'es_core_news_sm',
+    'it': 'it_core_news_sm'
+}
+
+# En mode lot avec détection de langue, nombre de lots de nlp.pipe regroupés par langue
+LANGUAGE_WINDOW_BATCHES = 8
 
 
 class NLPPipeline:
     """Pipeline pour orchestrer tous les analyseurs NLP."""
     
-    def __init__(self, model_name: str = 'fr_core_news_sm'):
+    def __init__(self, model_name: str = 'fr_core_news_sm', max_chunk_chars: int = DEFAULT_CHUNK_CHARS,
+                 instrumentation: Optional[Instrumentation] = None, segment_store=None,
+                 language_detector=None, language_models: Optional[Dict[str, str]] = None,
+                 duplicate_index=None):
         """
         Initialise le pipeline NLP avec tous les analyseurs.
         
         Args:
             model_name: Nom du modèle spaCy à utiliser
+            max_chunk_chars: Taille au-delà de laquelle un document est analysé par blocs
+            instrumentation: Collecteur des mesures de temps et de mémoire (optionnel)
+            segment_store: Stockage des résultats par segment (get_segment/put_segment,
+                ex: ResultCache) activant le mode incrémental pour les documents
+                découpés en segments (chapitres EPUB)
+            language_detector: Détecteur de langue (méthode detect(text), ex:
+                LanguageDetector) ; chaque document est alors analysé par le modèle
+                de sa langue, et analysis.language reçoit la langue détectée
+            language_models: Langue -> modèle spaCy (par défaut: DEFAULT_LANGUAGE_MODELS) ;
+                model_name est utilisé pour les autres langues et les modèles absents
+            duplicate_index: Index des quasi-doublons (ex: MinHashIndex) ; un document
+                proche d'un document déjà analysé reprend son analyse sans passer
+                par spaCy, et analysis.duplicate_of désigne le document canonique
         """
+        self.model_name = model_name
+        self.max_chunk_chars = max_chunk_chars
+        self.instrumentation = instrumentation
+        self.segment_store = segment_store
+        self.language_detector = language_detector
+        self.language_models = dict(DEFAULT_LANGUAGE_MODELS if language_models is None else language_models)
+        self._missing_models = set()
+        self.duplicate_index = duplicate_index
         self.analyzers: List[BaseAnalyzer] = [
             EntityAnalyzer(model_name),
             SentimentAnalyzer(),
@@ -27,6 +70,63 @@ class NLPPipeline:
             RelationAnalyzer(model_name)
         ]
     
+    @property
+    def nlp(self):
+        """
+        Modèle spaCy, chargé une seule fois au premier usage et partagé par tous les analyseurs.
+        
+        Seuls les composants utiles aux analyseurs configurés sont chargés : sans
+        RelationAnalyzer, par exemple, le parser est exclu.
+        """
+        return load_model(self.model_name, self._spacy_attributes())
+    
+    def _spacy_attributes(self) -> Optional[FrozenSet[str]]:
+        """Attributs du Doc lus par les analyseurs configurés (None si l'un d'eux ne les déclare pas)."""
+        attributes = set()
+        for analyzer in self.analyzers:
+            if analyzer.requires_doc:
+                if analyzer.spacy_attributes is None:
+                    return None
+                attributes |= analyzer.spacy_attributes
+        return frozenset(attributes)
+    
+    def _route(self, document: Document) -> Tuple[Optional[str], str]:
+        """
+        Détecte la langue du document et choisit le modèle spaCy correspondant.
+        
+        Args:
+            document: Document à analyser
+            
+        Returns:
+            Tuple[Optional[str], str]: Langue détectée (None sans détecteur ou si le
+            texte est trop court) et nom du modèle à utiliser
+        """
+        if self.language_detector is None or not document.content:
+            return None, self.model_name
+        
+        with self._measure('language', self.language_detector.__class__.__name__, document):
+            language = self.language_detector.detect(document.content)
+        return language, self.language_models.get(language, self.model_name)
+    
+    def _model(self, model_name: str):
+        """
+        Retourne le modèle spaCy chargé pour ce nom (modèle principal s'il n'est pas installé).
+        
+        Args:
+            model_name: Nom du modèle choisi pour le document
+            
+        Returns:
+            Language: Modèle spaCy, gardé chargé dans le registre
+        """
+        if model_name != self.model_name and model_name not in self._missing_models:
+            try:
+                # Pas de modèle de repli : un modèle de langue absent est remplacé par model_name
+                return load_model(model_name, self._spacy_attributes(), fallbacks=[])
+            except OSError:
+                print(f"Modèle {model_name} non disponible, utilisation de {self.model_name}")
+                self._missing_models.add(model_name)
+        return self.nlp
+    
     def analyze(self, document: Document) -> Analysis:
         """
         Analyse un document avec tous les analyseurs configurés.
@@ -37,18 +137,484 @@ class NLPPipeline:
         Returns:
             Analysis: Objet Analysis contenant tous les résultats
         """
-        analysis = Analysis()
+        match = self._match_duplicate(document)
+        if match is not None:
+            analysis = self._reuse_analysis(match)
+            if analysis is not None:
+                return self._finish(document, analysis)
+        
+        language, model_name = self._route(document)
+        
+        if self._is_segmented(document):
+            analysis = self._analyze_segmented(document, model_name, language)
+        elif self._needs_doc() and self._is_long(document):
+            analysis = self._analyze_chunked(document, model_name=model_name, language=language)
+        else:
+            doc = None
+            if document.content and self._needs_doc():
+                # Le document n'est analysé par spaCy qu'une seule fois
+                # (le modèle est chargé avant la mesure)
+                nlp = self._model(model_name)
+                with self._measure('spacy', model_name, document):
+                    doc = nlp(document.content)
+            analysis = self._run_analyzers(document, doc, language)
+        
+        if match is None:
+            self._remember(document, analysis)
+        return self._finish(document, analysis, language)
+    
+    def analyze_batch(self, documents: Iterable[Document], batch_size: int = 32,
+                      n_process: int = 1) -> Iterator[Tuple[Document, Analysis]]:
+        """
+        Analyse un flux de documents en les faisant passer par nlp.pipe.
+        
+        Args:
+            documents: Documents à analyser (peut être un générateur)
+            batch_size: Nombre de documents envoyés à spaCy par lot
+            n_process: Nombre de processus spaCy en parallèle
+            
+        Yields:
+            Tuple[Document, Analysis]: Chaque document avec son analyse, dans l'ordre
+            
+        Note:
+            Avec l'instrumentation, le temps de nlp.pipe n'est pas attribuable à un
+            document précis : seuls les analyseurs (et l'analyse par blocs des longs
+            documents) sont mesurés.
+            
+            Avec un détecteur de langue, les documents sont lus par fenêtres de
+            batch_size * LANGUAGE_WINDOW_BATCHES et regroupés par modèle : chaque
+            modèle traite sa part de la fenêtre avec nlp.pipe (avec n_process > 1,
+            les processus spaCy sont relancés pour chaque groupe).
+            
+            Avec un index des quasi-doublons, seuls les documents canoniques passent
+            par spaCy ; un doublon est produit à sa place dans le flux, une fois
+            l'analyse de son canonique (toujours antérieur) disponible.
+        """
+        if self.duplicate_index is None:
+            yield from self._analyze_stream(documents, batch_size, n_process)
+            return
+        
+        queue = deque()
+        
+        def originals():
+            for document in documents:
+                match = self._match_duplicate(document)
+                queue.append((document, match))
+                if match is None:
+                    yield document
+        
+        for document, analysis in self._analyze_stream(originals(), batch_size, n_process):
+            # Avec n_process > 1, le document revient en copie : comparaison par chemin
+            while queue[0][0].file_path != document.file_path:
+                yield self._analyze_duplicate(*queue.popleft())
+            queue.popleft()
+            self._remember(document, analysis)
+            yield document, analysis
+        while queue:
+            yield self._analyze_duplicate(*queue.popleft())
+    
+    def _analyze_stream(self, documents: Iterable[Document], batch_size: int,
+                        n_process: int) -> Iterator[Tuple[Document, Analysis]]:
+        """Analyse un flux de documents avec nlp.pipe (voir analyze_batch)."""
+        if not self._needs_doc():
+            for document in documents:
+                language, _ = self._route(document)
+                yield document, self._finish(document, self._run_analyzers(document, language=language), language)
+            return
+        
+        if self.language_detector is not None:
+            window = []
+            for document in documents:
+                window.append(document)
+                if len(window) >= batch_size * LANGUAGE_WINDOW_BATCHES:
+                    yield from self._analyze_window(window, batch_size, n_process)
+                    window = []
+            if window:
+                yield from self._analyze_window(window, batch_size, n_process)
+            return
+        
+        # Le document voyage comme contexte : seul le texte part dans les processus spaCy.
+        # Les documents trop longs (ou analysés par segments) sont remplacés par un
+        # texte vide puis analysés à part.
+        docs = self.nlp.pipe(
+            ((document.content if not self._is_long(document) and not self._is_segmented(document) else '',
+              document)
+             for document in documents),
+            as_tuples=True,
+            batch_size=batch_size,
+            n_process=n_process
+        )
+        for doc, document in docs:
+            if self._is_segmented(document):
+                yield document, self._finish(document, self._analyze_segmented(document))
+            elif self._is_long(document):
+                yield document, self._finish(document, self._analyze_chunked(document))
+            else:
+                yield document, self._finish(document, self._run_analyzers(document, doc))
+    
+    def _analyze_window(self, window: List[Document], batch_size: int,
+                        n_process: int) -> Iterator[Tuple[Document, Analysis]]:
+        """
+        Analyse une fenêtre de documents en regroupant par modèle les passages dans nlp.pipe.
+        
+        Args:
+            window: Documents de la fenêtre
+            batch_size: Nombre de documents envoyés à spaCy par lot
+            n_process: Nombre de processus spaCy en parallèle
+            
+        Yields:
+            Tuple[Document, Analysis]: Chaque document avec son analyse, dans l'ordre
+        """
+        routes = [self._route(document) for document in window]
+        
+        # Les documents longs ou segmentés sont analysés à part, avec le modèle de leur langue
+        groups: Dict[str, List[int]] = {}
+        for index, (document, (_, model_name)) in enumerate(zip(window, routes)):
+            if not self._is_long(document) and not self._is_segmented(document):
+                groups.setdefault(model_name, []).append(index)
+        
+        docs = {}
+        for model_name, indices in groups.items():
+            texts = (window[index].content or '' for index in indices)
+            pipe = self._model(model_name).pipe(texts, batch_size=batch_size, n_process=n_process)
+            docs.update(zip(indices, pipe))
+        
+        for index, document in enumerate(window):
+            language, model_name = routes[index]
+            if self._is_segmented(document):
+                analysis = self._analyze_segmented(document, model_name, language)
+            elif self._is_long(document):
+                analysis = self._analyze_chunked(document, model_name=model_name, language=language)
+            else:
+                analysis = self._run_analyzers(document, docs.pop(index), language)
+            yield document, self._finish(document, analysis, language)
+    
+    def _match_duplicate(self, document: Document) -> Optional[Dict]:
+        """
+        Recherche le document canonique dont le document est un quasi-doublon.
+        
+        Un document sans canonique est enregistré dans l'index comme canonique ;
+        un doublon en est retiré (il a pu être canonique lors d'un traitement
+        précédent).
+        
+        Args:
+            document: Document à analyser
+            
+        Returns:
+            Optional[Dict]: {'file_path', 'similarity'} du document canonique, ou None
+        """
+        if self.duplicate_index is None or not document.content:
+            return None
+        
+        with self._measure('dedup', self.duplicate_index.__class__.__name__, document):
+            signature = self.duplicate_index.signature(document.content)
+            if signature is None:
+                return None
+            # L'analyse d'un canonique n'est réutilisable qu'avec la même configuration
+            config = json.dumps(self.get_config(), sort_keys=True)
+            match = self.duplicate_index.find(signature, config, exclude=document.file_path)
+            if match is None:
+                self.duplicate_index.add(document.file_path, signature, config)
+            else:
+                self.duplicate_index.remove(document.file_path)
+        return match
+    
+    def _reuse_analysis(self, match: Dict) -> Optional[Analysis]:
+        """
+        Reprend l'analyse du document canonique pour un quasi-doublon.
+        
+        Les positions des entités restent celles du contenu du document canonique.
+        
+        Args:
+            match: Document canonique retourné par _match_duplicate
+            
+        Returns:
+            Optional[Analysis]: Analyse du canonique marquée duplicate_of, ou None si
+            elle n'est pas disponible
+        """
+        analysis = self.duplicate_index.get_analysis(match['file_path'])
+        if analysis is not None:
+            analysis.duplicate_of = match
+        return analysis
+    
+    def _analyze_duplicate(self, document: Document, match: Optional[Dict]) -> Tuple[Document, Analysis]:
+        """Produit le résultat d'un doublon mis en attente par analyze_batch (analysé s'il le faut)."""
+        analysis = self._reuse_analysis(match)
+        if analysis is None:
+            # Analyse du canonique indisponible : le doublon est analysé normalement
+            return document, self.analyze(document)
+        return document, self._finish(document, analysis)
+    
+    def _remember(self, document: Document, analysis: Analysis):
+        """Conserve l'analyse d'un document canonique pour ses futurs doublons."""
+        if self.duplicate_index is not None and document.content:
+            self.duplicate_index.set_analysis(document.file_path, analysis)
+    
+    def _is_long(self, document: Document) -> bool:
+        """Indique si le document doit être analysé par blocs."""
+        return bool(document.content) and len(document.content) > self.max_chunk_chars
+    
+    def _analyze_chunked(self, document: Document, segment_only: bool = False,
+                         model_name: Optional[str] = None, language: Optional[str] = None) -> Analysis:
+        """
+        Analyse un long document par blocs bornés, à mémoire constante.
+        
+        Les analyseurs utilisant le Doc spaCy sont appliqués bloc par bloc (les
+        positions des entités sont recalées sur le contenu d'origine), puis les
+        autres analyseurs sont appliqués une fois sur le document complet.
+        
+        Args:
+            document: Document à analyser
+            segment_only: N'appliquer que les analyseurs utilisant le Doc spaCy
+                (analyse d'un segment en mode incrémental)
+            model_name: Modèle choisi pour la langue du document (par défaut: model_name)
+            language: Langue détectée du document (None: langue du modèle)
+            
+        Returns:
+            Analysis: Objet Analysis contenant tous les résultats
+        """
+        model_name = model_name or self.model_name
+        analysis = Analysis(language=language)
+        doc_analyzers = [a for a in self.analyzers if a.requires_doc]
+        docs = iter_docs(self._model(model_name), document.content, self.max_chunk_chars)
+        
+        while True:
+            with self._measure('spacy', model_name, document):
+                doc = next(docs, None)
+            if doc is None:
+                break
+            for analyzer in doc_analyzers:
+                analysis = self._apply_analyzer(analyzer, document, analysis, doc)
+        
+        if not segment_only:
+            for analyzer in self.analyzers:
+                if not analyzer.requires_doc:
+                    analysis = self._apply_analyzer(analyzer, document, analysis)
+        
+        return analysis
+    
+    def _is_segmented(self, document: Document) -> bool:
+        """Indique si le document doit être analysé segment par segment (mode incrémental)."""
+        return (self.segment_store is not None and bool(document.content)
+                and bool(document.metadata.get('segments')))
+    
+    def _analyze_segmented(self, document: Document, model_name: Optional[str] = None,
+                           language: Optional[str] = None) -> Analysis:
+        """
+        Analyse un document segment par segment, en réutilisant les résultats stockés.
+        
+        Chaque segment (ex: chapitre) est identifié par le hash de son texte : un
+        segment inchangé n'est pas réanalysé, ses entités, relations, comptages,
+        sentiment et scores de catégories sont relus dans segment_store. Les
+        résultats sont ensuite fusionnés en recalant les positions sur le contenu
+        complet. Les autres analyseurs portent sur tout le document.
+        
+        Args:
+            document: Document dont metadata['segments'] décrit les segments
+            model_name: Modèle choisi pour la langue du document (par défaut: model_name)
+            language: Langue détectée du document (None: langue du modèle)
+            
+        Returns:
+            Analysis: Objet Analysis contenant tous les résultats
+        """
+        model_name = model_name or self.model_name
+        config_digest = hashlib.sha256(
+            json.dumps(self.get_config(), sort_keys=True).encode('utf-8')
+        ).hexdigest()
+        if model_name != self.model_name:
+            # Les résultats d'un segment dépendent du modèle de langue utilisé
+            config_digest = f"{config_digest}:{model_name}"
+        if language:
+            # ... ainsi que le lexique de sentiment choisi pour la langue détectée
+            config_digest = f"{config_digest}:{language}"
+        
+        analysis = Analysis(language=language)
+        analysis.entities.content = document.content
+        seen_relations = set()
+        category_scores: Dict[str, Dict[str, int]] = {}
+        
+        for segment in document.metadata['segments']:
+            key = hashlib.sha256(f"{segment['hash']}:{config_digest}".encode('utf-8')).hexdigest()
+            result = self.segment_store.get_segment(key)
+            if result is None:
+                text = document.content[segment['start']:segment['end']]
+                result = self._analyze_segment(document, text, model_name, language)
+                self.segment_store.put_segment(key, result)
+            
+            # Fusion : positions recalées, relations dédupliquées, comptages et scores cumulés
+            offset = segment['start']
+            for entity in result['entities']:
+                analysis.entities.add(entity['text'], entity['label'], entity['start'] + offset,
+                                      entity['end'] + offset, entity['confidence'])
+            for relation in result['relations']:
+                relation_key = RelationAnalyzer._relation_key(
+                    relation['entity1'], relation['entity2'], relation['relation_type']
+                )
+                if relation_key not in seen_relations:
+                    seen_relations.add(relation_key)
+                    analysis.relations.append(Relation(**relation))
+            for count in ('word_count', 'sentence_count'):
+                if result[count] is not None:
+                    setattr(analysis, count, (getattr(analysis, count) or 0) + result[count])
+            if result['language']:
+                analysis.language = result['language']
+            if result.get('sentiment'):
+                analysis.sentiment = SentimentAnalyzer.merge(analysis.sentiment, result['sentiment'], offset,
+                                                             len(document.content))
+            for name, scores in result['scores'].items():
+                totals = category_scores.setdefault(name, {})
+                for category, score in scores.items():
+                    totals[category] = totals.get(category, 0) + score
+        
+        for analyzer in self.analyzers:
+            if hasattr(analyzer, 'apply_scores'):
+                analysis = analyzer.apply_scores(
+                    analysis, category_scores.get(analyzer.__class__.__name__, {})
+                )
+            elif not analyzer.requires_doc:
+                analysis = self._apply_analyzer(analyzer, document, analysis)
+        
+        return analysis
+    
+    def _analyze_segment(self, document: Document, text: str, model_name: Optional[str] = None,
+                         language: Optional[str] = None) -> Dict:
+        """
+        Analyse le texte d'un segment et retourne ses résultats sérialisables.
+        
+        Args:
+            document: Document auquel appartient le segment
+            text: Texte du segment
+            model_name: Modèle choisi pour la langue du document (par défaut: model_name)
+            language: Langue détectée du document (None: langue du modèle)
+            
+        Returns:
+            Dict: Entités et relations (positions relatives au segment), comptages,
+            langue, sentiment et scores des analyseurs à scores additifs
+        """
+        segment = Document(content=text, file_path=document.file_path, file_type=document.file_type,
+                           title=document.title, metadata={SEGMENT_KEY: True})
+        analysis = self._analyze_chunked(segment, segment_only=True, model_name=model_name, language=language)
+        return {
+            'entities': analysis.entities.to_dicts(),
+            'relations': [
+                {'entity1': r.entity1, 'entity2': r.entity2,
+                 'relation_type': r.relation_type, 'confidence': r.confidence}
+                for r in analysis.relations
+            ],
+            'word_count': analysis.word_count,
+            'sentence_count': analysis.sentence_count,
+            'language': analysis.language,
+            'sentiment': analysis.sentiment,
+            'scores': {
+                analyzer.__class__.__name__: analyzer.score(segment)
+                for analyzer in self.analyzers if hasattr(analyzer, 'apply_scores')
+            }
+        }
+    
+    def _needs_doc(self) -> bool:
+        """Indique si au moins un analyseur configuré utilise le Doc spaCy."""
+        return any(analyzer.requires_doc for analyzer in self.analyzers)
+    
+    def _run_analyzers(self, document: Document, doc=None, language: Optional[str] = None) -> Analysis:
+        """
+        Applique tous les analyseurs au document en partageant le Doc spaCy.
+        
+        Args:
+            document: Document à analyser
+            doc: Doc spaCy déjà calculé (None si aucun analyseur n'en a besoin)
+            language: Langue détectée du document (None: langue du modèle)
+            
+        Returns:
+            Analysis: Objet Analysis contenant tous les résultats
+        """
+        # La langue détectée est connue des analyseurs (ex: lexique de sentiment)
+        analysis = Analysis(language=language)
         
         # Appliquer chaque analyseur dans l'ordre
         for analyzer in self.analyzers:
-            try:
-                analysis = analyzer.analyze(document, analysis)
-            except Exception as e:
-                print(f"Erreur lors de l'analyse avec {analyzer.__class__.__name__}: {str(e)}")
-                # Continuer avec les autres analyseurs même en cas d'erreur
+            analysis = self._apply_analyzer(analyzer, document, analysis, doc)
+        
+        return analysis
+    
+    def _apply_analyzer(self, analyzer: BaseAnalyzer, document: Document,
+                        analysis: Analysis, doc=None) -> Analysis:
+        """
+        Applique un analyseur en lui transmettant le Doc spaCy s'il en a besoin.
         
+        Args:
+            analyzer: Analyseur à appliquer
+            document: Document à analyser
+            analysis: Objet Analysis à mettre à jour
+            doc: Doc spaCy (ou bloc) déjà calculé
+            
+        Returns:
+            Analysis: Objet Analysis mis à jour (inchangé en cas d'erreur)
+        """
+        try:
+            with self._measure('analyze', analyzer.__class__.__name__, document):
+                if analyzer.requires_doc:
+                    return analyzer.analyze(document, analysis, doc=doc)
+                return analyzer.analyze(document, analysis)
+        except Exception as e:
+            print(f"Erreur lors de l'analyse avec {analyzer.__class__.__name__}: {str(e)}")
+            # Continuer avec les autres analyseurs même en cas d'erreur
+            return analysis
+    
+    def _measure(self, stage: str, name: str, document: Document):
+        """Retourne le contexte de mesure d'une étape (sans effet sans instrumentation)."""
+        if self.instrumentation is None:
+            return nullcontext()
+        return self.instrumentation.measure(stage, name, document.file_path, len(document.content or ''))
+    
+    def _finish(self, document: Document, analysis: Analysis, language: Optional[str] = None) -> Analysis:
+        """
+        Rattache à l'analyse la langue détectée et les mesures collectées pour le document.
+        
+        Args:
+            document: Document analysé
+            analysis: Résultat de l'analyse
+            language: Langue détectée (None: langue du modèle, fixée par les analyseurs)
+            
+        Returns:
+            Analysis: Analyse, complétée du bloc 'timings' si l'instrumentation l'exige
+        """
+        if language:
+            analysis.language = language
+        if self.instrumentation is not None:
+            # Les mesures sont toujours retirées pour ne pas s'accumuler en mode lot
+            timings = self.instrumentation.pop_timings(document.file_path)
+            if self.instrumentation.attach_to_analysis:
+                analysis.timings = timings
         return analysis
     
+    def get_config(self) -> dict:
+        """
+        Décrit la configuration du pipeline (modèle et analyseurs avec leur version).
+        
+        Returns:
+            dict: Configuration sérialisable, utilisée notamment comme clé de cache
+        """
+        config = {
+            'model_name': self.model_name,
+            'analyzers': [
+                {'name': analyzer.__class__.__name__, 'version': analyzer.version}
+                for analyzer in self.analyzers
+            ]
+        }
+        attributes = self._spacy_attributes()
+        if attributes is not None:
+            # Les composants chargés (ex: phrases du parser ou du senter) influent sur les résultats
+            config['spacy_attributes'] = sorted(attributes)
+        if self.segment_store is not None:
+            # Les résultats par segment dépendent du découpage en blocs
+            config['segmented'] = True
+            config['max_chunk_chars'] = self.max_chunk_chars
+        if self.language_detector is not None:
+            # Le modèle utilisé dépend de la langue détectée
+            config['language_detector'] = self.language_detector.__class__.__name__
+            config['language_models'] = self.language_models
+        return config
+    
     def add_analyzer(self, analyzer: BaseAnalyzer):
         """
         Ajoute un analyseur personnalisé au pipeline.
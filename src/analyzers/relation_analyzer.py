@@ -1,8 +1,9 @@
 """Analyseur pour l'extraction de relations entre entités."""
 
-import spacy
-from typing import List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from src.analyzers.base_analyzer import BaseAnalyzer
+from src.analyzers.model_registry import load_model
+from src.analyzers.chunking import iter_docs
 from src.models.document import Document
 from src.models.analysis import Analysis, Relation
 
@@ -10,28 +11,40 @@ from src.models.analysis import Analysis, Relation
 class RelationAnalyzer(BaseAnalyzer):
     """Analyseur pour extraire les relations entre entités."""
     
-    def __init__(self, model_name: str = 'fr_core_news_sm'):
+    requires_doc = True
+    
+    # Catégories grammaticales (verbes) et phrases issues de l'analyse syntaxique
+    spacy_attributes = frozenset(['doc.ents', 'doc.sents', 'token.pos', 'token.dep'])
+    
+    # Mots indiquant une association ou une conjonction entre deux entités
+    ASSOCIATION_WORDS = frozenset(['de', 'du', 'des', 'à', 'au', 'aux', 'pour', 'avec'])
+    CONJUNCTION_WORDS = frozenset(['et', 'ou'])
+    
+    def __init__(self, model_name: str = 'fr_core_news_sm', max_token_distance: int = 50):
         """
         Initialise l'analyseur de relations.
         
         Args:
             model_name: Nom du modèle spaCy à utiliser
+            max_token_distance: Nombre maximal de tokens séparant deux entités liées
         """
-        try:
-            self.nlp = spacy.load(model_name)
-        except OSError:
-            try:
-                self.nlp = spacy.load('en_core_web_sm')
-            except OSError:
-                self.nlp = spacy.load('xx_ent_wiki_sm')
+        self.model_name = model_name
+        self.max_token_distance = max_token_distance
     
-    def analyze(self, document: Document, analysis: Analysis) -> Analysis:
+    @property
+    def nlp(self):
+        """Modèle spaCy, chargé au premier usage et partagé avec les autres analyseurs."""
+        return load_model(self.model_name)
+    
+    def analyze(self, document: Document, analysis: Analysis, doc=None) -> Analysis:
         """
         Extrait les relations entre entités du document.
         
         Args:
             document: Document à analyser
             analysis: Objet Analysis à mettre à jour
+            doc: Doc spaCy partagé par le pipeline, éventuellement un bloc d'un long
+                document (analysé ici par blocs si absent)
             
         Returns:
             Analysis: Objet Analysis mis à jour avec les relations
@@ -39,86 +52,138 @@ class RelationAnalyzer(BaseAnalyzer):
         if not document.content or not analysis.entities:
             return analysis
         
-        doc = self.nlp(document.content)
-        
         # Créer un set des entités pour recherche rapide
-        entity_texts = {ent.text.lower() for ent in analysis.entities}
+        entity_texts = {text.lower() for text in analysis.entities.iter_texts()}
         
-        # Extraire les relations basées sur les dépendances syntaxiques
-        relations = self._extract_relations_from_doc(doc, entity_texts)
+        # Relations déjà trouvées dans les blocs précédents, pour éviter les doublons
+        seen_relations = {
+            self._relation_key(r.entity1, r.entity2, r.relation_type) for r in analysis.relations
+        }
         
-        # Ajouter les relations à l'analyse
-        for relation in relations:
-            analysis.relations.append(relation)
+        # Extraire les relations basées sur les dépendances syntaxiques
+        docs = iter_docs(self.nlp, document.content) if doc is None else [doc]
+        for chunk_doc in docs:
+            relations = self._extract_relations_from_doc(chunk_doc, entity_texts, seen_relations)
+            
+            # Ajouter les relations à l'analyse
+            for relation in relations:
+                analysis.relations.append(relation)
         
         return analysis
     
-    def _extract_relations_from_doc(self, doc, entity_texts: Set[str]) -> List[Relation]:
+    @staticmethod
+    def _relation_key(text1: str, text2: str, relation_type: str) -> Tuple[str, str, str]:
+        """Clé unique d'une relation, indépendante de l'ordre des entités."""
+        return tuple(sorted([text1.lower(), text2.lower()]) + [relation_type])
+    
+    def _extract_relations_from_doc(self, doc, entity_texts: Set[str],
+                                    seen_relations: Optional[Set[Tuple[str, str, str]]] = None
+                                    ) -> List[Relation]:
         """
         Extrait les relations depuis le document parsé par spaCy.
         
         Args:
             doc: Document spaCy parsé
             entity_texts: Set des textes d'entités (en minuscules)
+            seen_relations: Clés des relations déjà connues (mis à jour sur place)
             
         Returns:
             List[Relation]: Liste des relations extraites
         """
         relations = []
-        seen_relations: Set[Tuple[str, str, str]] = set()
+        if seen_relations is None:
+            seen_relations = set()
         
         for sent in doc.sents:
-            # Trouver les entités dans cette phrase
+            # Trouver les entités dans cette phrase (déjà triées par position)
             sent_entities = [ent for ent in sent.ents if ent.text.lower() in entity_texts]
+            if len(sent_entities) < 2:
+                continue
+            
+            # Index des marqueurs de relation calculé une seule fois par phrase
+            next_marker, marker_types = self._build_marker_index(sent)
             
             # Chercher des relations entre entités proches
             for i, ent1 in enumerate(sent_entities):
                 for ent2 in sent_entities[i+1:]:
-                    # Vérifier si les entités sont proches (dans la même phrase)
-                    if abs(ent1.start - ent2.start) < 50:  # Distance maximale de 50 caractères
-                        # Déterminer le type de relation basé sur les dépendances
-                        relation_type = self._determine_relation_type(ent1, ent2, sent)
-                        
-                        if relation_type:
-                            # Créer une clé unique pour éviter les doublons
-                            key = tuple(sorted([ent1.text.lower(), ent2.text.lower()]) + [relation_type])
-                            if key not in seen_relations:
-                                seen_relations.add(key)
-                                relations.append(Relation(
-                                    entity1=ent1.text,
-                                    entity2=ent2.text,
-                                    relation_type=relation_type,
-                                    confidence=None
-                                ))
+                    # Les entités suivantes sont encore plus éloignées : arrêt anticipé
+                    if ent2.start - ent1.end >= self.max_token_distance:
+                        break
+                    
+                    # Déterminer le type de relation basé sur les tokens intermédiaires
+                    relation_type = self._determine_relation_type(
+                        ent1, ent2, sent.start, next_marker, marker_types
+                    )
+                    
+                    if relation_type:
+                        # Créer une clé unique pour éviter les doublons
+                        key = self._relation_key(ent1.text, ent2.text, relation_type)
+                        if key not in seen_relations:
+                            seen_relations.add(key)
+                            relations.append(Relation(
+                                entity1=ent1.text,
+                                entity2=ent2.text,
+                                relation_type=relation_type,
+                                confidence=None
+                            ))
         
         return relations
     
-    def _determine_relation_type(self, ent1, ent2, sent) -> str:
+    def _build_marker_index(self, sent) -> Tuple[List[int], Dict[int, str]]:
         """
-        Détermine le type de relation entre deux entités.
+        Indexe les tokens marqueurs de relation (verbes, connecteurs) d'une phrase.
+        
+        Args:
+            sent: Phrase spaCy
+            
+        Returns:
+            Tuple[List[int], Dict[int, str]]: Pour chaque position relative, position
+            du premier marqueur à partir de celle-ci (len(sent) si aucun), et type de
+            relation associé à chaque marqueur
+        """
+        length = len(sent)
+        marker_types: Dict[int, str] = {}
+        
+        for offset, token in enumerate(sent):
+            if token.pos_ == 'VERB':
+                marker_types[offset] = 'action'
+            else:
+                text = token.lower_
+                if text in self.ASSOCIATION_WORDS:
+                    marker_types[offset] = 'association'
+                elif text in self.CONJUNCTION_WORDS:
+                    marker_types[offset] = 'conjonction'
+        
+        # Parcours à rebours : position du prochain marqueur pour chaque token
+        next_marker = [length] * (length + 1)
+        for offset in range(length - 1, -1, -1):
+            next_marker[offset] = offset if offset in marker_types else next_marker[offset + 1]
+        
+        return next_marker, marker_types
+    
+    def _determine_relation_type(self, ent1, ent2, sent_start: int, next_marker: List[int],
+                                 marker_types: Dict[int, str]) -> Optional[str]:
+        """
+        Détermine le type de relation entre deux entités en temps constant.
         
         Args:
             ent1: Première entité
             ent2: Deuxième entité
-            sent: Phrase contenant les entités
+            sent_start: Position du premier token de la phrase dans le document
+            next_marker: Index des prochains marqueurs de la phrase
+            marker_types: Type de relation de chaque marqueur
             
         Returns:
             str: Type de relation ou None
         """
-        # Recherche de verbes ou prépositions entre les entités
-        start = min(ent1.end, ent2.end)
-        end = max(ent1.start, ent2.start)
+        # Le premier marqueur situé entre les entités détermine la relation
+        start = min(ent1.end, ent2.end) - sent_start
+        end = max(ent1.start, ent2.start) - sent_start
         
-        between_tokens = [token for token in sent if start <= token.i < end]
-        
-        # Types de relations basiques
-        for token in between_tokens:
-            if token.pos_ == 'VERB':
-                return 'action'
-            elif token.text.lower() in ['de', 'du', 'des', 'à', 'au', 'aux', 'pour', 'avec']:
-                return 'association'
-            elif token.text.lower() in ['et', 'ou']:
-                return 'conjonction'
+        if start < end:
+            marker = next_marker[start]
+            if marker < end:
+                return marker_types[marker]
         
         # Relation par défaut
         return 'relation'
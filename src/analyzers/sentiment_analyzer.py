@@ -1,49 +1,260 @@
 """Analyseur pour l'analyse de sentiment."""
 
-from textblob import TextBlob
+from itertools import zip_longest
+from typing import Dict, List, Optional
 from src.analyzers.base_analyzer import BaseAnalyzer
+from src.analyzers.chunking import get_offset
+from src.analyzers.sentiment_lexicon import SentimentLexicon
 from src.models.document import Document
 from src.models.analysis import Analysis
 
+# Marque d'un segment analysé isolément (mode incrémental) dans Document.metadata
+SEGMENT_KEY = 'segment'
+
 
 class SentimentAnalyzer(BaseAnalyzer):
-    """Analyseur pour déterminer le sentiment d'un document."""
+    """
+    Analyseur pour déterminer le sentiment d'un document.
+    
+    Les tokens du Doc spaCy partagé sont évalués d'un seul passage vectorisé sur
+    un lexique compilé, choisi selon la langue du document (analysis.language,
+    fixée par le pipeline ou le modèle) ; les documents d'une langue sans lexique
+    ne reçoivent pas de sentiment. La polarité est la moyenne des mots
+    du lexique ; elle est aussi calculée par section de section_chars caractères.
+    Pour les très longs documents, max_sentences borne le nombre de phrases
+    évaluées (échantillon réparti sur tout le document).
+    """
+    
+    requires_doc = True
     
-    def analyze(self, document: Document, analysis: Analysis) -> Analysis:
+    version = '2.2'
+    
+    def __init__(self, language: str = 'fr', lexicon_file: Optional[str] = None,
+                 max_sentences: Optional[int] = None, section_chars: int = 10_000):
+        """
+        Initialise l'analyseur de sentiment.
+        
+        Args:
+            language: Langue du lexique intégré utilisé quand la langue du document
+                n'est pas connue ('fr' ou 'en')
+            lexicon_file: Lexique (JSON ou TSV) à charger à la place des lexiques intégrés,
+                quelle que soit la langue du document
+            max_sentences: Nombre maximal de phrases évaluées par document (None: toutes)
+            section_chars: Taille en caractères des sections de la polarité par section
+        """
+        self.language = language
+        self.lexicon_file = lexicon_file
+        self.lexicon = (SentimentLexicon.from_file(lexicon_file) if lexicon_file
+                        else SentimentLexicon.for_language(language))
+        self.max_sentences = max_sentences
+        self.section_chars = section_chars
+        # Les phrases ne sont nécessaires que pour l'échantillonnage
+        self.spacy_attributes = frozenset(['doc.sents']) if max_sentences else frozenset()
+    
+    def analyze(self, document: Document, analysis: Analysis, doc=None) -> Analysis:
         """
         Analyse le sentiment du document.
         
+        Appelé bloc par bloc pour un long document, l'analyseur cumule les scores
+        dans analysis.sentiment.
+        
         Args:
             document: Document à analyser
             analysis: Objet Analysis à mettre à jour
-            
+            doc: Doc spaCy partagé par le pipeline, éventuellement un bloc d'un long
+                document (texte découpé par expression régulière si absent)
+                
         Returns:
             Analysis: Objet Analysis mis à jour avec le sentiment
         """
-        if not document.content:
+        lexicon = self._lexicon(analysis.language)
+        if not document.content or lexicon is None:
             return analysis
         
         try:
-            blob = TextBlob(document.content)
-            polarity = blob.sentiment.polarity  # -1 (négatif) à 1 (positif)
-            subjectivity = blob.sentiment.subjectivity  # 0 (objectif) à 1 (subjectif)
+            import numpy as np
             
-            # Détermination du label de sentiment
-            if polarity > 0.1:
-                sentiment_label = 'positif'
-            elif polarity < -0.1:
-                sentiment_label = 'négatif'
+            if doc is None:
+                words, positions = lexicon.tokenize(document.content)
+                polarity, subjectivity, matched = lexicon.score_words(words)
+                positions = np.array(positions, dtype=np.int64)
+                sentence_starts = None
+                offset = 0
+                budget = self.max_sentences
             else:
-                sentiment_label = 'neutre'
+                polarity, subjectivity, matched = lexicon.score_hashes(doc.to_array('LOWER'))
+                positions = doc.to_array('IDX').astype(np.int64)
+                sentence_starts = doc.to_array('SENT_START') == 1 if self.max_sentences else None
+                offset = get_offset(doc)
+                # Budget de phrases proportionnel à la part du document couverte par ce bloc
+                budget = self.max_sentences and max(
+                    1, round(self.max_sentences * len(doc.text) / len(document.content))
+                )
             
-            analysis.sentiment = {
-                'polarity': float(polarity),
-                'subjectivity': float(subjectivity),
-                'label': sentiment_label
-            }
+            if budget and sentence_starts is None:
+                sentence_starts = np.zeros(len(positions), dtype=bool)
+                sentence_starts[1:] = self._sentence_breaks(document.content, positions)
+            if budget and len(positions):
+                matched = matched & self._sample(sentence_starts, budget)
+            
+            sections = (positions + offset) // self.section_chars
+            section_count = -(-len(document.content) // self.section_chars)
+            partial = self._result(
+                int(matched.sum()),
+                float(polarity[matched].sum()),
+                float(subjectivity[matched].sum()),
+                np.bincount(sections[matched], weights=polarity[matched], minlength=section_count).tolist(),
+                np.bincount(sections[matched], minlength=section_count).tolist(),
+                self.section_chars
+            )
+            if document.metadata.get(SEGMENT_KEY):
+                # Un segment relu dans le cache peut changer de position : ses mots évalués
+                # sont conservés pour recalculer exactement les sections du document
+                partial['positions'] = (positions[matched] + offset).tolist()
+                partial['word_polarity'] = polarity[matched].tolist()
+            analysis.sentiment = self.merge(analysis.sentiment, partial)
         except Exception as e:
             # En cas d'erreur, on continue sans sentiment
             print(f"Erreur lors de l'analyse de sentiment: {str(e)}")
         
         return analysis
+    
+    def _lexicon(self, language: Optional[str]) -> Optional[SentimentLexicon]:
+        """
+        Retourne le lexique à utiliser pour un document.
+        
+        Args:
+            language: Langue du document (None: inconnue)
+            
+        Returns:
+            Optional[SentimentLexicon]: Lexique de la langue, lexique configuré si la
+            langue est inconnue ou si un fichier de lexique est imposé, None si la
+            langue n'a pas de lexique
+        """
+        if self.lexicon_file or not language or language == self.language:
+            return self.lexicon
+        try:
+            return SentimentLexicon.for_language(language)
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def _sentence_breaks(text: str, positions):
+        """Indique, pour chaque mot sauf le premier, s'il suit une fin de phrase (. ! ? …)."""
+        import numpy as np
+        
+        ends = np.array([i for i, char in enumerate(text) if char in '.!?…'], dtype=np.int64)
+        # Une fin de phrase sépare deux mots consécutifs si elle se trouve entre eux
+        return np.searchsorted(ends, positions[1:]) > np.searchsorted(ends, positions[:-1])
+    
+    @staticmethod
+    def _sample(sentence_starts, budget: int):
+        """
+        Sélectionne au plus budget phrases réparties régulièrement.
+        
+        Args:
+            sentence_starts: Pour chaque token, True s'il commence une phrase
+            budget: Nombre maximal de phrases retenues
+            
+        Returns:
+            Masque des tokens appartenant aux phrases retenues
+        """
+        import numpy as np
+        
+        sentence_ids = np.cumsum(sentence_starts) - (1 if sentence_starts[0] else 0)
+        count = int(sentence_ids[-1]) + 1
+        if count <= budget:
+            return np.ones(len(sentence_ids), dtype=bool)
+        chosen = np.unique(np.linspace(0, count - 1, budget).astype(np.int64))
+        return np.isin(sentence_ids, chosen)
+    
+    @classmethod
+    def merge(cls, sentiment: Optional[Dict], partial: Dict, offset: int = 0,
+              content_length: Optional[int] = None) -> Dict:
+        """
+        Cumule le sentiment d'un bloc ou d'un segment dans le sentiment du document.
+        
+        Args:
+            sentiment: Sentiment accumulé jusqu'ici (None pour le premier bloc)
+            partial: Sentiment du bloc ou du segment
+            offset: Position du segment dans le document, pour recaler ses sections
+                (un segment relu dans le cache a des sections relatives à son début)
+            content_length: Longueur du document : les sections d'un segment sont
+                recalculées à partir de ses mots évalués (None: simple décalage)
+            
+        Returns:
+            Dict: Sentiment cumulé
+        """
+        section_chars = partial['section_chars']
+        shift = offset // section_chars
+        if content_length is not None and 'positions' in partial:
+            partial, shift = cls._realign(partial, offset, content_length), 0
+        totals = cls._totals(partial, shift)
+        if sentiment:
+            previous = cls._totals(sentiment)
+            totals = [a + b for a, b in zip(totals[:3], previous[:3])] + [
+                [a + b for a, b in zip_longest(totals[i], previous[i], fillvalue=0)] for i in (3, 4)
+            ]
+        result = cls._result(*totals, section_chars)
+        # Les mots évalués d'un segment restent disponibles tant qu'il n'est pas recalé
+        if 'positions' in partial and (not sentiment or 'positions' in sentiment):
+            result['positions'] = (sentiment or {}).get('positions', []) + partial['positions']
+            result['word_polarity'] = (sentiment or {}).get('word_polarity', []) + partial['word_polarity']
+        return result
+    
+    @classmethod
+    def _realign(cls, partial: Dict, offset: int, content_length: Optional[int]) -> Dict:
+        """Recalcule les sections d'un segment à partir de ses mots évalués, placés à offset."""
+        import numpy as np
+        
+        section_chars = partial['section_chars']
+        positions = np.array(partial['positions'], dtype=np.int64) + offset
+        polarity = np.array(partial['word_polarity'], dtype=np.float64)
+        section_count = -(-content_length // section_chars)
+        sections = positions // section_chars
+        return cls._result(
+            partial['scored_words'],
+            partial['polarity'] * partial['scored_words'],
+            partial['subjectivity'] * partial['scored_words'],
+            np.bincount(sections, weights=polarity, minlength=section_count).tolist(),
+            np.bincount(sections, minlength=section_count).tolist(),
+            section_chars
+        )
+    
+    @staticmethod
+    def _totals(sentiment: Dict, shift: int = 0) -> List:
+        """Convertit un sentiment en sommes cumulables (sections décalées de shift)."""
+        words = sentiment['scored_words']
+        section_words = sentiment['section_words']
+        return [
+            words,
+            sentiment['polarity'] * words,
+            sentiment['subjectivity'] * words,
+            [0.0] * shift + [p * n for p, n in zip(sentiment['section_polarity'], section_words)],
+            [0] * shift + list(section_words)
+        ]
+    
+    @staticmethod
+    def _result(words: int, polarity_sum: float, subjectivity_sum: float,
+                section_sums: List[float], section_words: List[int], section_chars: int) -> Dict:
+        """Construit le sentiment (moyennes, label, polarité par section) à partir des sommes."""
+        polarity = polarity_sum / words if words else 0.0
+        
+        # Détermination du label de sentiment
+        if polarity > 0.1:
+            sentiment_label = 'positif'
+        elif polarity < -0.1:
+            sentiment_label = 'négatif'
+        else:
+            sentiment_label = 'neutre'
+        
+        return {
+            'polarity': float(polarity),
+            'subjectivity': float(subjectivity_sum / words if words else 0.0),
+            'label': sentiment_label,
+            'scored_words': int(words),
+            'section_chars': section_chars,
+            'section_polarity': [float(s / n) if n else 0.0 for s, n in zip(section_sums, section_words)],
+            'section_words': [int(n) for n in section_words]
+        }
 
@@ -0,0 +1,369 @@
+"""Lexiques de sentiment compilés pour une évaluation vectorisée des tokens."""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Lexique français : formes fléchies -> (polarité de -1 à 1, subjectivité de 0 à 1)
+FRENCH_LEXICON = {
+    # Évaluations générales positives
+    ('bon', 'bonne', 'bons', 'bonnes'): (0.6, 0.6),
+    ('bien',): (0.5, 0.5),
+    ('meilleur', 'meilleure', 'meilleurs', 'meilleures'): (0.8, 0.6),
+    ('excellent', 'excellente', 'excellents', 'excellentes'): (1.0, 1.0),
+    ('parfait', 'parfaite', 'parfaits', 'parfaites', 'parfaitement'): (1.0, 0.9),
+    ('super',): (0.8, 0.9),
+    ('génial', 'géniale', 'géniaux', 'géniales'): (0.9, 1.0),
+    ('formidable', 'formidables'): (0.9, 1.0),
+    ('magnifique', 'magnifiques'): (1.0, 1.0),
+    ('superbe', 'superbes'): (0.9, 1.0),
+    ('merveilleux', 'merveilleuse', 'merveilleuses'): (1.0, 1.0),
+    ('remarquable', 'remarquables'): (0.8, 0.8),
+    ('exceptionnel', 'exceptionnelle', 'exceptionnels', 'exceptionnelles'): (0.9, 0.9),
+    ('beau', 'belle', 'beaux', 'belles'): (0.7, 0.8),
+    ('joli', 'jolie', 'jolis', 'jolies'): (0.6, 0.8),
+    ('agréable', 'agréables'): (0.6, 0.7),
+    ('plaisant', 'plaisante', 'plaisants', 'plaisantes'): (0.5, 0.7),
+    ('intéressant', 'intéressante', 'intéressants', 'intéressantes'): (0.5, 0.6),
+    ('utile', 'utiles'): (0.4, 0.3),
+    ('efficace', 'efficaces', 'efficacement'): (0.6, 0.4),
+    ('performant', 'performante', 'performants', 'performantes'): (0.6, 0.4),
+    ('fiable', 'fiables'): (0.6, 0.4),
+    ('rapide', 'rapides', 'rapidement'): (0.3, 0.3),
+    ('simple', 'simples', 'simplement'): (0.2, 0.3),
+    ('facile', 'faciles', 'facilement'): (0.4, 0.4),
+    ('clair', 'claire', 'clairs', 'claires', 'clairement'): (0.3, 0.3),
+    ('positif', 'positive', 'positifs', 'positives'): (0.6, 0.5),
+    ('favorable', 'favorables'): (0.6, 0.5),
+    ('satisfait', 'satisfaite', 'satisfaits', 'satisfaites', 'satisfaisant', 'satisfaisante'): (0.6, 0.7),
+    ('content', 'contente', 'contents', 'contentes'): (0.6, 0.8),
+    ('heureux', 'heureuse', 'heureuses', 'heureusement'): (0.8, 0.9),
+    ('ravi', 'ravie', 'ravis', 'ravies'): (0.8, 0.9),
+    ('joyeux', 'joyeuse', 'joyeuses'): (0.8, 0.9),
+    ('enthousiaste', 'enthousiastes'): (0.7, 0.9),
+    ('fier', 'fière', 'fiers', 'fières'): (0.6, 0.8),
+    ('réussi', 'réussie', 'réussis', 'réussies', 'réussite', 'réussites'): (0.7, 0.5),
+    ('succès',): (0.7, 0.5),
+    ('victoire', 'victoires'): (0.6, 0.4),
+    ('progrès',): (0.5, 0.4),
+    ('amélioration', 'améliorations', 'amélioré', 'améliorée', 'améliorés', 'améliorées'): (0.5, 0.4),
+    ('avantage', 'avantages', 'avantageux', 'avantageuse'): (0.5, 0.4),
+    ('bénéfique', 'bénéfiques'): (0.6, 0.5),
+    ('qualité', 'qualités'): (0.4, 0.4),
+    ('confiance',): (0.5, 0.5),
+    ('espoir', 'espoirs'): (0.5, 0.7),
+    ('plaisir', 'plaisirs'): (0.7, 0.8),
+    ('joie', 'joies'): (0.8, 0.9),
+    ('bonheur',): (0.9, 0.9),
+    ('aimer', 'aime', 'aimes', 'aimons', 'aimez', 'aiment', 'aimé', 'aimée'): (0.6, 0.8),
+    ('adorer', 'adore', 'adores', 'adorons', 'adorez', 'adorent', 'adoré', 'adorée'): (0.9, 1.0),
+    ('apprécier', 'apprécie', 'apprécient', 'apprécié', 'appréciée', 'appréciable'): (0.6, 0.7),
+    ('recommander', 'recommande', 'recommandé', 'recommandée', 'recommandons'): (0.6, 0.6),
+    ('féliciter', 'félicite', 'félicitations', 'félicité'): (0.7, 0.7),
+    ('merci', 'remercie', 'remercions', 'remerciements'): (0.5, 0.5),
+    ('bravo',): (0.8, 0.9),
+    ('innovant', 'innovante', 'innovants', 'innovantes'): (0.5, 0.5),
+    ('solide', 'solides'): (0.4, 0.4),
+    ('sûr', 'sûre', 'sûrs', 'sûres'): (0.3, 0.4),
+    ('calme', 'calmes'): (0.3, 0.5),
+    ('sain', 'saine', 'sains', 'saines'): (0.4, 0.4),
+    ('gagnant', 'gagnante', 'gagnants', 'gagnantes', 'gagner', 'gagne', 'gagné'): (0.5, 0.4),
+    ('croissance',): (0.3, 0.2),
+    ('hausse',): (0.2, 0.2),
+    # Évaluations générales négatives
+    ('mauvais', 'mauvaise', 'mauvaises'): (-0.7, 0.7),
+    ('mal',): (-0.5, 0.5),
+    ('pire', 'pires'): (-0.9, 0.7),
+    ('nul', 'nulle', 'nuls', 'nulles'): (-0.8, 0.9),
+    ('horrible', 'horribles'): (-1.0, 1.0),
+    ('affreux', 'affreuse', 'affreuses'): (-0.9, 1.0),
+    ('terrible', 'terribles'): (-0.8, 0.9),
+    ('catastrophique', 'catastrophiques', 'catastrophe', 'catastrophes'): (-0.9, 0.8),
+    ('désastreux', 'désastreuse', 'désastreuses', 'désastre'): (-0.9, 0.8),
+    ('médiocre', 'médiocres'): (-0.6, 0.7),
+    ('décevant', 'décevante', 'décevants', 'décevantes', 'déception', 'déçu', 'déçue', 'déçus'): (-0.7, 0.8),
+    ('triste', 'tristes', 'tristesse'): (-0.6, 0.8),
+    ('malheureux', 'malheureuse', 'malheureuses', 'malheureusement'): (-0.6, 0.8),
+    ('désagréable', 'désagréables'): (-0.6, 0.7),
+    ('difficile', 'difficiles', 'difficilement', 'difficulté', 'difficultés'): (-0.4, 0.5),
+    ('compliqué', 'compliquée', 'compliqués', 'compliquées'): (-0.4, 0.5),
+    ('lent', 'lente', 'lents', 'lentes', 'lentement'): (-0.3, 0.4),
+    ('inutile', 'inutiles'): (-0.6, 0.6),
+    ('inefficace', 'inefficaces'): (-0.6, 0.5),
+    ('négatif', 'négative', 'négatifs', 'négatives'): (-0.6, 0.5),
+    ('défavorable', 'défavorables'): (-0.6, 0.5),
+    ('insatisfait', 'insatisfaite', 'insatisfaits', 'insatisfaisant', 'insatisfaisante'): (-0.6, 0.7),
+    ('mécontent', 'mécontente', 'mécontents', 'mécontentes'): (-0.6, 0.8),
+    ('inquiet', 'inquiète', 'inquiets', 'inquiètes', 'inquiétude', 'inquiétant', 'inquiétante'): (-0.5, 0.7),
+    ('peur', 'peurs'): (-0.6, 0.8),
+    ('colère',): (-0.7, 0.9),
+    ('haine', 'détester', 'déteste', 'détestent', 'détesté'): (-0.9, 1.0),
+    ('problème', 'problèmes', 'problématique'): (-0.4, 0.3),
+    ('erreur', 'erreurs'): (-0.4, 0.3),
+    ('échec', 'échecs', 'échoué', 'échouée'): (-0.7, 0.5),
+    ('défaite', 'défaites'): (-0.6, 0.4),
+    ('perte', 'pertes', 'perdu', 'perdue', 'perdus', 'perdre'): (-0.5, 0.4),
+    ('panne', 'pannes', 'défaillance', 'défaillances'): (-0.6, 0.4),
+    ('bug', 'bugs', 'bogue', 'bogues'): (-0.5, 0.4),
+    ('danger', 'dangers', 'dangereux', 'dangereuse', 'dangereuses'): (-0.6, 0.5),
+    ('risque', 'risques', 'risqué', 'risquée'): (-0.3, 0.4),
+    ('grave', 'graves', 'gravement'): (-0.6, 0.6),
+    ('crise', 'crises'): (-0.6, 0.4),
+    ('douleur', 'douleurs', 'douloureux', 'douloureuse'): (-0.6, 0.6),
+    ('malade', 'malades', 'maladie', 'maladies'): (-0.4, 0.3),
+    ('mort', 'morte', 'morts', 'décès'): (-0.6, 0.4),
+    ('violence', 'violent', 'violente', 'violents'): (-0.7, 0.6),
+    ('injuste', 'injustes', 'injustice'): (-0.7, 0.8),
+    ('faible', 'faibles', 'faiblesse'): (-0.3, 0.5),
+    ('pauvre', 'pauvres'): (-0.4, 0.5),
+    ('cher', 'chère', 'chers', 'chères', 'coûteux', 'coûteuse'): (-0.2, 0.4),
+    ('ennuyeux', 'ennuyeuse', 'ennuyeuses', 'ennui'): (-0.6, 0.8),
+    ('regretter', 'regrette', 'regrettable', 'regret', 'regrets'): (-0.5, 0.7),
+    ('critiquer', 'critique', 'critiques', 'critiqué'): (-0.3, 0.5),
+    ('baisse', 'chute', 'recul'): (-0.3, 0.2),
+    ('stupide', 'stupides', 'ridicule', 'ridicules'): (-0.8, 0.9)
+}
+
+# Mots inversant la polarité des deux mots suivants (« pas bon », « jamais satisfait »)
+FRENCH_NEGATIONS = ('pas', 'jamais', 'aucun', 'aucune', 'rien', 'ni', 'sans', 'guère')
+
+# Modificateurs multipliant la polarité du mot suivant
+FRENCH_INTENSIFIERS = {
+    'très': 1.3, 'vraiment': 1.3, 'trop': 1.2, 'extrêmement': 1.5, 'particulièrement': 1.3,
+    'totalement': 1.4, 'tellement': 1.3, 'si': 1.2, 'assez': 0.8, 'peu': 0.5, 'moins': 0.6
+}
+
+ENGLISH_NEGATIONS = ('no', 'not', "n't", 'never')
+
+ENGLISH_INTENSIFIERS = {
+    'very': 1.3, 'really': 1.3, 'extremely': 1.5, 'so': 1.2, 'too': 1.2, 'quite': 0.8,
+    'fairly': 0.8, 'slightly': 0.5
+}
+
+_WORD = re.compile(r"\w+(?:'\w+)*|n't")
+
+# Lexiques intégrés déjà compilés, par langue
+_LEXICONS: Dict[str, 'SentimentLexicon'] = {}
+
+
+class SentimentLexicon:
+    """
+    Lexique associant des mots à une polarité et une subjectivité.
+    
+    Le lexique est compilé une seule fois en tableaux triés d'empreintes de mots
+    (les mêmes que l'attribut LOWER de spaCy) : l'évaluation des tokens d'un Doc
+    se fait alors par une recherche vectorisée, sans boucle Python par token.
+    """
+    
+    def __init__(self, entries: Dict[str, Tuple[float, float]], negations: Iterable[str] = (),
+                 intensifiers: Optional[Dict[str, float]] = None):
+        """
+        Initialise le lexique.
+        
+        Args:
+            entries: Mot -> (polarité de -1 à 1, subjectivité de 0 à 1)
+            negations: Mots inversant la polarité des mots suivants
+            intensifiers: Mot -> facteur appliqué à la polarité du mot suivant
+        """
+        self.entries = {word.lower(): (float(p), float(s)) for word, (p, s) in entries.items()}
+        self.negations = frozenset(word.lower() for word in negations)
+        self.intensifiers = {word.lower(): float(f) for word, f in (intensifiers or {}).items()}
+        self._tables = None
+    
+    @classmethod
+    def for_language(cls, language: str) -> 'SentimentLexicon':
+        """
+        Retourne le lexique intégré d'une langue, compilé une seule fois par processus.
+        
+        Args:
+            language: 'fr' (lexique intégré) ou 'en' (lexique de TextBlob)
+            
+        Returns:
+            SentimentLexicon: Lexique de la langue
+            
+        Raises:
+            ValueError: Si aucun lexique n'est disponible pour cette langue
+        """
+        if language not in _LEXICONS:
+            if language == 'fr':
+                entries = {
+                    form: scores for forms, scores in FRENCH_LEXICON.items() for form in forms
+                }
+                _LEXICONS[language] = cls(entries, FRENCH_NEGATIONS, FRENCH_INTENSIFIERS)
+            elif language == 'en':
+                _LEXICONS[language] = cls(_load_textblob_entries(), ENGLISH_NEGATIONS, ENGLISH_INTENSIFIERS)
+            else:
+                raise ValueError(f"Aucun lexique de sentiment pour la langue '{language}' (fr, en).")
+        return _LEXICONS[language]
+    
+    @classmethod
+    def from_file(cls, file_path: str) -> 'SentimentLexicon':
+        """
+        Charge un lexique depuis un fichier.
+        
+        Formats acceptés :
+            - JSON : ``{"mot": [polarité, subjectivité], ...}``, ou un objet
+              ``{"words": {...}, "negations": [...], "intensifiers": {...}}``
+            - Texte : une ligne ``mot<TAB>polarité[<TAB>subjectivité]`` par mot
+              (les lignes vides ou commençant par ``#`` sont ignorées)
+              
+        Args:
+            file_path: Chemin vers le fichier du lexique
+            
+        Returns:
+            SentimentLexicon: Lexique chargé
+            
+        Raises:
+            FileNotFoundError: Si le fichier n'existe pas
+            ValueError: Si le fichier est mal formé
+        """
+        path = Path(file_path)
+        
+        if not path.exists():
+            raise FileNotFoundError(f"Le fichier {file_path} n'existe pas.")
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            if path.suffix.lower() == '.json':
+                data = json.load(f)
+                if not isinstance(data, dict):
+                    raise ValueError("Le lexique JSON doit être un objet mot -> [polarité, subjectivité].")
+                if 'words' in data:
+                    return cls(data['words'], data.get('negations', ()), data.get('intensifiers'))
+                return cls(data)
+            
+            entries: Dict[str, Tuple[float, float]] = {}
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                parts = line.split('\t')
+                try:
+                    if len(parts) not in (2, 3):
+                        raise ValueError
+                    entries[parts[0]] = (float(parts[1]), float(parts[2]) if len(parts) == 3 else 0.0)
+                except ValueError:
+                    raise ValueError(
+                        f"Ligne {line_number} invalide dans {file_path}: "
+                        f"format attendu 'mot<TAB>polarité[<TAB>subjectivité]'"
+                    )
+        
+        return cls(entries)
+    
+    def tokenize(self, text: str) -> Tuple[List[str], List[int]]:
+        """
+        Découpe un texte en mots (utilisé lorsqu'aucun Doc spaCy n'est disponible).
+        
+        Args:
+            text: Texte à découper
+            
+        Returns:
+            Tuple[List[str], List[int]]: Mots en minuscules et leur position dans le texte
+        """
+        words, positions = [], []
+        for match in _WORD.finditer(text):
+            words.append(match.group().lower())
+            positions.append(match.start())
+        return words, positions
+    
+    def score_hashes(self, hashes):
+        """
+        Évalue une séquence de tokens donnés par leur empreinte (Doc.to_array('LOWER')).
+        
+        Args:
+            hashes: Tableau numpy uint64 des empreintes des tokens en minuscules
+            
+        Returns:
+            Tuple: Tableaux (polarité, subjectivité, mots du lexique) alignés sur les
+            tokens, la polarité tenant compte des négations et modificateurs précédents
+        """
+        import numpy as np
+        
+        keys, polarity, subjectivity, factors = self._compile()
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if not len(hashes) or not len(keys):
+            empty = np.zeros(len(hashes))
+            return empty, empty, np.zeros(len(hashes), dtype=bool)
+        
+        index = np.minimum(np.searchsorted(keys, hashes), len(keys) - 1)
+        found = keys[index] == hashes
+        matched = found & ~np.isnan(polarity[index])
+        token_polarity = np.where(matched, polarity[index], 0.0)
+        token_subjectivity = np.where(matched, subjectivity[index], 0.0)
+        token_factors = np.where(found, factors[index], 1.0)
+        
+        # Modificateur (« très ») : facteur appliqué au mot suivant
+        token_polarity[1:] *= np.where(token_factors[:-1] > 0, token_factors[:-1], 1.0)
+        
+        # Négation (facteur nul dans la table) : inversion atténuée des deux mots suivants
+        negation = token_factors == 0
+        negated = np.zeros(len(hashes), dtype=bool)
+        negated[1:] |= negation[:-1]
+        negated[2:] |= negation[:-2]
+        token_polarity = np.where(negated, token_polarity * -0.5, token_polarity)
+        
+        return np.clip(token_polarity, -1.0, 1.0), token_subjectivity, matched
+    
+    def score_words(self, words: List[str]):
+        """
+        Évalue une séquence de mots (en minuscules).
+        
+        Args:
+            words: Mots à évaluer
+            
+        Returns:
+            Tuple: Mêmes tableaux que score_hashes
+        """
+        from spacy.strings import hash_string
+        
+        return self.score_hashes([hash_string(word) for word in words])
+    
+    def _compile(self):
+        """Construit (une seule fois) les tableaux triés d'empreintes et de scores."""
+        if self._tables is None:
+            import numpy as np
+            from spacy.strings import hash_string
+            
+            # Chaque mot porte ses scores (NaN : mot sans polarité) et son facteur
+            # de modificateur (0 : négation, 1 : sans effet)
+            rows: Dict[int, List[float]] = {}
+            for word, (p, s) in self.entries.items():
+                rows[hash_string(word)] = [p, s, 1.0]
+            for word, factor in self.intensifiers.items():
+                rows.setdefault(hash_string(word), [np.nan, 0.0, 1.0])[2] = factor
+            for word in self.negations:
+                rows.setdefault(hash_string(word), [np.nan, 0.0, 1.0])[2] = 0.0
+            
+            keys = np.array(sorted(rows), dtype=np.uint64)
+            values = np.array([rows[int(key)] for key in keys], dtype=float).reshape(-1, 3)
+            self._tables = (keys, values[:, 0], values[:, 1], values[:, 2])
+        return self._tables
+
+
+def _load_textblob_entries() -> Dict[str, Tuple[float, float]]:
+    """
+    Lit le lexique anglais fourni avec TextBlob (moyenne des sens de chaque mot).
+    
+    Returns:
+        Dict[str, Tuple[float, float]]: Mot -> (polarité, subjectivité)
+        
+    Raises:
+        ValueError: Si TextBlob n'est pas installé
+    """
+    try:
+        import textblob
+    except ImportError:
+        raise ValueError("Le lexique de sentiment anglais nécessite le paquet textblob.")
+    import xml.etree.ElementTree as ElementTree
+    
+    path = Path(textblob.__file__).parent / 'en' / 'en-sentiment.xml'
+    senses: Dict[str, List[Tuple[float, float]]] = {}
+    for word in ElementTree.parse(str(path)).getroot().iter('word'):
+        senses.setdefault(word.get('form').lower(), []).append(
+            (float(word.get('polarity', 0.0)), float(word.get('subjectivity', 0.0)))
+        )
+    return {
+        form: (sum(p for p, _ in values) / len(values), sum(s for _, s in values) / len(values))
+        for form, values in senses.items()
+    }
+
@@ -0,0 +1,6 @@
+"""Cache des résultats d'extraction et d'analyse."""
+
+from .result_cache import ResultCache
+
+__all__ = ['ResultCache']
+
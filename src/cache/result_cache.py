@@ -0,0 +1,229 @@
+"""Cache disque des résultats d'extraction et d'analyse."""
+
+import hashlib
+import json
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Optional, Tuple
+from src.models.document import Document
+from src.models.analysis import Analysis
+
+
+class ResultCache:
+    """
+    Cache SQLite associant l'empreinte d'un fichier à son Document et son Analysis.
+    
+    La clé combine le hash SHA-256 du contenu du fichier et la configuration du
+    pipeline (modèle spaCy, analyseurs et leurs versions) : un même fichier
+    présent dans plusieurs dossiers ou retraité après un incident n'est extrait
+    et analysé qu'une seule fois. Les entrées les moins récemment utilisées sont
+    évincées lorsque la taille totale dépasse la limite configurée.
+    
+    Les résultats par segment du mode incrémental (chapitres EPUB) sont stockés
+    dans la même table, sous une clé dérivée du hash du texte du segment.
+    """
+    
+    def __init__(self, cache_dir: str, max_size_bytes: int = 1024 * 1024 * 1024):
+        """
+        Ouvre (ou crée) le cache.
+        
+        Args:
+            cache_dir: Répertoire contenant la base SQLite du cache
+            max_size_bytes: Taille maximale des entrées stockées (par défaut: 1 Go)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        
+        self._conn = sqlite3.connect(str(self.cache_dir / 'results.sqlite3'))
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            'key TEXT PRIMARY KEY, '
+            'document BLOB NOT NULL, '
+            'analysis BLOB NOT NULL, '
+            'size INTEGER NOT NULL, '
+            'last_access REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_last_access ON entries(last_access)')
+        self._conn.commit()
+        # Taille totale tenue à jour à chaque écriture : l'éviction ne reparcourt pas la table
+        self._size = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+    
+    @staticmethod
+    def make_key(file_path: str, config: dict) -> str:
+        """
+        Calcule la clé de cache d'un fichier pour une configuration donnée.
+        
+        Args:
+            file_path: Chemin vers le fichier source
+            config: Configuration du pipeline (voir NLPPipeline.get_config)
+            
+        Returns:
+            str: Clé hexadécimale
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        
+        # L'extension fait partie de la clé : elle détermine l'extracteur utilisé
+        digest.update(Path(file_path).suffix.lower().encode('utf-8'))
+        digest.update(json.dumps(config, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+    
+    def get(self, key: str, file_path: Optional[str] = None) -> Optional[Tuple[Document, Analysis]]:
+        """
+        Recherche une entrée du cache.
+        
+        Args:
+            key: Clé calculée par make_key
+            file_path: Chemin du fichier demandé, reporté dans le Document retourné
+            
+        Returns:
+            Optional[Tuple[Document, Analysis]]: Résultats en cache, ou None
+        """
+        row = self._conn.execute(
+            'SELECT document, analysis FROM entries WHERE key = ?', (key,)
+        ).fetchone()
+        
+        if row is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        self._conn.execute('UPDATE entries SET last_access = ? WHERE key = ?', (time.time(), key))
+        self._conn.commit()
+        
+        document = Document.from_dict(json.loads(zlib.decompress(row[0])))
+        analysis = Analysis.from_dict(json.loads(zlib.decompress(row[1])))
+        
+        if file_path is not None:
+            # Le même contenu peut provenir d'un autre emplacement
+            path = Path(file_path)
+            if document.title == Path(document.file_path).name:
+                document.title = path.name
+            document.file_path = str(path.absolute())
+        
+        return document, analysis
+    
+    def put(self, key: str, document: Document, analysis: Analysis):
+        """
+        Enregistre les résultats d'un document puis applique la politique d'éviction.
+        
+        Args:
+            key: Clé calculée par make_key
+            document: Document extrait
+            analysis: Analyse du document
+        """
+        document_blob = zlib.compress(
+            json.dumps(document.to_dict(), ensure_ascii=False, default=str).encode('utf-8')
+        )
+        analysis_data = analysis.to_dict()
+        # Les mesures de performance concernent l'exécution d'origine, pas les résultats
+        analysis_data.pop('timings', None)
+        analysis_blob = zlib.compress(
+            json.dumps(analysis_data, ensure_ascii=False, default=str).encode('utf-8')
+        )
+        self._store(key, document_blob, analysis_blob)
+    
+    def get_segment(self, key: str) -> Optional[dict]:
+        """
+        Recherche les résultats d'analyse d'un segment de document (mode incrémental).
+        
+        Args:
+            key: Clé du segment (hash du texte et configuration du pipeline)
+            
+        Returns:
+            Optional[dict]: Résultats du segment, ou None
+        """
+        row = self._conn.execute(
+            'SELECT analysis FROM entries WHERE key = ?', (key,)
+        ).fetchone()
+        
+        if row is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        self._conn.execute('UPDATE entries SET last_access = ? WHERE key = ?', (time.time(), key))
+        self._conn.commit()
+        return json.loads(zlib.decompress(row[0]))
+    
+    def put_segment(self, key: str, result: dict):
+        """
+        Enregistre les résultats d'analyse d'un segment (sans document associé).
+        
+        Args:
+            key: Clé du segment
+            result: Résultats sérialisables du segment
+        """
+        analysis_blob = zlib.compress(
+            json.dumps(result, ensure_ascii=False, default=str).encode('utf-8')
+        )
+        self._store(key, b'', analysis_blob)
+    
+    def _store(self, key: str, document_blob: bytes, analysis_blob: bytes):
+        """Écrit une entrée, met à jour la taille totale puis applique la politique d'éviction."""
+        size = len(document_blob) + len(analysis_blob)
+        previous = self._conn.execute('SELECT size FROM entries WHERE key = ?', (key,)).fetchone()
+        
+        self._conn.execute(
+            'INSERT OR REPLACE INTO entries (key, document, analysis, size, last_access) '
+            'VALUES (?, ?, ?, ?, ?)',
+            (key, document_blob, analysis_blob, size, time.time())
+        )
+        self._size += size - (previous[0] if previous else 0)
+        self._evict()
+        self._conn.commit()
+    
+    def _evict(self):
+        """Supprime les entrées les moins récemment utilisées au-delà de la taille maximale."""
+        if self._size <= self.max_size_bytes:
+            return
+        
+        # Parcours paresseux de l'index last_access : seules les entrées évincées sont lues
+        cursor = self._conn.execute('SELECT key, size FROM entries ORDER BY last_access')
+        evicted = []
+        for key, size in cursor:
+            if self._size <= self.max_size_bytes:
+                break
+            evicted.append((key,))
+            self._size -= size
+        cursor.close()
+        
+        self._conn.executemany('DELETE FROM entries WHERE key = ?', evicted)
+    
+    def stats(self) -> dict:
+        """
+        Retourne les statistiques d'utilisation du cache.
+        
+        Returns:
+            dict: Succès, échecs, taux de succès, nombre d'entrées et taille totale
+        """
+        entries = self._conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+        lookups = self.hits + self.misses
+        
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': entries,
+            'size_bytes': self._size
+        }
+    
+    def clear(self):
+        """Vide le cache et remet les statistiques à zéro."""
+        self._conn.execute('DELETE FROM entries')
+        self._conn.commit()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def close(self):
+        """Ferme la connexion à la base du cache."""
+        self._conn.close()
+
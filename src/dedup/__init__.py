@@ -0,0 +1,6 @@
+"""Détection des quasi-doublons avant l'analyse NLP."""
+
+from .minhash_index import MinHashIndex
+
+__all__ = ['MinHashIndex']
+
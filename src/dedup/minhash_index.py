@@ -0,0 +1,241 @@
+"""Index MinHash/LSH des documents déjà analysés, pour repérer les quasi-doublons."""
+
+import json
+import re
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import Dict, Optional
+from src.models.analysis import Analysis
+
+_WORD = re.compile(r'\w+')
+
+# Hachage universel (a * x + b) mod p des empreintes 32 bits des shingles
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Nombre de shingles traités à la fois lors du calcul d'une signature
+_BLOCK_SHINGLES = 4096
+
+
+class MinHashIndex:
+    """
+    Index SQLite de signatures MinHash, interrogé par LSH (locality-sensitive hashing).
+    
+    Chaque document canonique est représenté par la signature MinHash des
+    shingles (suites de shingle_words mots) de son contenu normalisé. La
+    signature est découpée en bandes : deux documents partageant une bande sont
+    candidats, puis retenus si la similarité de Jaccard estimée (part des
+    valeurs égales des signatures) atteint le seuil. L'analyse du document
+    canonique est conservée pour être réutilisée par ses doublons.
+    """
+    
+    def __init__(self, path: Optional[str] = None, threshold: float = 0.8, num_perm: int = 128,
+                 bands: int = 16, shingle_words: int = 5, seed: int = 1):
+        """
+        Ouvre (ou crée) l'index.
+        
+        Args:
+            path: Fichier SQLite de l'index (None: index en mémoire, limité au processus)
+            threshold: Similarité de Jaccard estimée à partir de laquelle un document
+                est un doublon
+            num_perm: Nombre de fonctions de hachage de la signature
+            bands: Nombre de bandes LSH (num_perm doit en être un multiple)
+            shingle_words: Nombre de mots par shingle
+            seed: Graine des fonctions de hachage (fixe pour qu'un index reste valide)
+            
+        Raises:
+            ValueError: Si num_perm n'est pas un multiple de bands
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) doit être un multiple de bands ({bands}).")
+        
+        import numpy as np
+        
+        self.path = path
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_words = shingle_words
+        
+        # a < 2**31 et x < 2**32 : a * x + b ne dépasse pas la capacité d'un uint64
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, 1 << 31, size=num_perm).astype(np.uint64)
+        self._b = generator.randint(0, 1 << 31, size=num_perm).astype(np.uint64)
+        
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path) if path is not None else ':memory:')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS documents ('
+            'file_path TEXT PRIMARY KEY, '
+            'signature BLOB NOT NULL, '
+            'config TEXT NOT NULL, '
+            'analysis BLOB)'
+        )
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS bands ('
+            'band INTEGER NOT NULL, '
+            'bucket BLOB NOT NULL, '
+            'file_path TEXT NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_bucket ON bands(band, bucket)')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_band_path ON bands(file_path)')
+        self._conn.commit()
+    
+    def signature(self, text: str):
+        """
+        Calcule la signature MinHash d'un texte.
+        
+        Le texte est mis en minuscules et réduit à ses mots : la ponctuation, les
+        espaces et la mise en forme propres à chaque format sont ignorés.
+        
+        Args:
+            text: Contenu du document
+            
+        Returns:
+            Signature (tableau numpy de num_perm entiers), ou None si le texte
+            compte moins de shingle_words mots
+        """
+        import numpy as np
+        
+        words = _WORD.findall(text.lower())
+        if len(words) < self.shingle_words:
+            return None
+        
+        # Empreinte de chaque mot, puis de chaque shingle (combinaison polynomiale)
+        word_hashes = np.fromiter((zlib.crc32(word.encode('utf-8')) for word in words),
+                                  dtype=np.uint64, count=len(words))
+        count = len(words) - self.shingle_words + 1
+        shingles = np.zeros(count, dtype=np.uint64)
+        for i in range(self.shingle_words):
+            shingles = shingles * np.uint64(1_000_003) + word_hashes[i:i + count]
+        shingles = np.unique(shingles & np.uint64(_MAX_HASH))
+        
+        signature = np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        for start in range(0, len(shingles), _BLOCK_SHINGLES):
+            block = shingles[start:start + _BLOCK_SHINGLES, None]
+            hashes = (block * self._a + self._b) % np.uint64(_MERSENNE_PRIME) & np.uint64(_MAX_HASH)
+            np.minimum(signature, hashes.min(axis=0), out=signature)
+        return signature.astype(np.uint32)
+    
+    def find(self, signature, config: str = '', exclude: Optional[str] = None) -> Optional[Dict]:
+        """
+        Recherche le document canonique le plus proche d'une signature.
+        
+        Args:
+            signature: Signature calculée par signature()
+            config: Configuration d'analyse : seuls les documents analysés avec la
+                même configuration peuvent servir de canonique
+            exclude: Chemin à ignorer (le document lui-même, analysé lors d'un
+                traitement précédent)
+                
+        Returns:
+            Optional[Dict]: {'file_path', 'similarity'} du document canonique, ou
+            None si aucun document n'atteint le seuil
+        """
+        import numpy as np
+        
+        candidates = set()
+        for band, bucket in enumerate(self._buckets(signature)):
+            rows = self._conn.execute(
+                'SELECT file_path FROM bands WHERE band = ? AND bucket = ?', (band, bucket)
+            ).fetchall()
+            candidates.update(row[0] for row in rows)
+        candidates.discard(exclude)
+        
+        best = None
+        for file_path in sorted(candidates):
+            row = self._conn.execute(
+                'SELECT signature FROM documents WHERE file_path = ? AND config = ?', (file_path, config)
+            ).fetchone()
+            if row is None:
+                continue
+            similarity = float(np.mean(np.frombuffer(row[0], dtype='<u4') == signature))
+            if similarity >= self.threshold and (best is None or similarity > best['similarity']):
+                best = {'file_path': file_path, 'similarity': similarity}
+        return best
+    
+    def add(self, file_path: str, signature, config: str = ''):
+        """
+        Enregistre un document canonique (son analyse est ajoutée par set_analysis).
+        
+        Args:
+            file_path: Chemin du document
+            signature: Signature calculée par signature()
+            config: Configuration d'analyse du document
+        """
+        self._conn.execute('DELETE FROM bands WHERE file_path = ?', (file_path,))
+        self._conn.execute(
+            'INSERT OR REPLACE INTO documents (file_path, signature, config, analysis) '
+            'VALUES (?, ?, ?, NULL)',
+            (file_path, signature.astype('<u4').tobytes(), config)
+        )
+        self._conn.executemany(
+            'INSERT INTO bands (band, bucket, file_path) VALUES (?, ?, ?)',
+            [(band, bucket, file_path) for band, bucket in enumerate(self._buckets(signature))]
+        )
+        self._conn.commit()
+    
+    def remove(self, file_path: str):
+        """
+        Retire un document de l'index (par exemple devenu le doublon d'un autre).
+        
+        Args:
+            file_path: Chemin du document
+        """
+        self._conn.execute('DELETE FROM bands WHERE file_path = ?', (file_path,))
+        self._conn.execute('DELETE FROM documents WHERE file_path = ?', (file_path,))
+        self._conn.commit()
+    
+    def set_analysis(self, file_path: str, analysis: Analysis):
+        """
+        Conserve l'analyse d'un document canonique (sans effet s'il n'est pas indexé).
+        
+        Args:
+            file_path: Chemin du document
+            analysis: Analyse du document
+        """
+        data = analysis.to_dict()
+        # Les mesures de performance concernent l'exécution d'origine, pas les résultats
+        data.pop('timings', None)
+        blob = zlib.compress(json.dumps(data, ensure_ascii=False, default=str).encode('utf-8'))
+        self._conn.execute('UPDATE documents SET analysis = ? WHERE file_path = ?', (blob, file_path))
+        self._conn.commit()
+    
+    def get_analysis(self, file_path: str) -> Optional[Analysis]:
+        """
+        Retourne l'analyse conservée d'un document canonique.
+        
+        Args:
+            file_path: Chemin du document
+            
+        Returns:
+            Optional[Analysis]: Analyse du document, ou None si elle n'est pas (encore) connue
+        """
+        row = self._conn.execute(
+            'SELECT analysis FROM documents WHERE file_path = ?', (file_path,)
+        ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return Analysis.from_dict(json.loads(zlib.decompress(row[0])))
+    
+    def stats(self) -> dict:
+        """
+        Retourne la taille de l'index.
+        
+        Returns:
+            dict: Nombre de documents canoniques indexés
+        """
+        return {'documents': self._conn.execute('SELECT COUNT(*) FROM documents').fetchone()[0]}
+    
+    def close(self):
+        """Ferme la connexion à la base de l'index."""
+        self._conn.close()
+    
+    def _buckets(self, signature):
+        """Découpe une signature en bandes de rows valeurs (clés des compartiments LSH)."""
+        data = signature.astype('<u4')
+        return [data[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
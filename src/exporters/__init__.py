@@ -2,6 +2,8 @@
 
 from .base_exporter import BaseExporter
 from .json_exporter import JsonExporter
+from .ndjson_exporter import NdjsonExporter
+from .parquet_exporter import ParquetExporter
 
-__all__ = ['BaseExporter', 'JsonExporter']
+__all__ = ['BaseExporter', 'JsonExporter', 'NdjsonExporter', 'ParquetExporter']
 
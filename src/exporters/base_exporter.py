@@ -1,9 +1,13 @@
 """Classe abstraite de base pour tous les exportateurs."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from src.models.document import Document
 from src.models.analysis import Analysis
 
+# Métadonnées propres au pipeline, non exportées (découpage en segments du mode incrémental)
+INTERNAL_METADATA_KEYS = frozenset(['segments'])
+
 
 class BaseExporter(ABC):
     """Interface abstraite pour tous les exportateurs."""
@@ -22,4 +26,43 @@ class BaseExporter(ABC):
             str: Chemin du fichier créé
         """
         pass
+    
+    def build_export_data(self, document: Document, analysis: Analysis) -> dict:
+        """
+        Construit l'enregistrement exporté pour un document et son analyse.
+        
+        Args:
+            document: Document à exporter
+            analysis: Analyse à exporter
+            
+        Returns:
+            dict: Données du document, de l'analyse et date d'export
+        """
+        return {
+            'document': {
+                'file_path': document.file_path,
+                'file_type': document.file_type,
+                'title': document.title,
+                'author': document.author,
+                'date': document.date.isoformat() if document.date else None,
+                'metadata': self.exported_metadata(document),
+                'content_length': len(document.content),
+                'content_preview': document.content[:500] if document.content else None  # Aperçu des 500 premiers caractères
+            },
+            'analysis': analysis.to_dict(),
+            'export_date': datetime.now().isoformat()
+        }
+    
+    @staticmethod
+    def exported_metadata(document: Document) -> dict:
+        """
+        Retourne les métadonnées du document à exporter, sans les clés internes au pipeline.
+        
+        Args:
+            document: Document à exporter
+            
+        Returns:
+            dict: Métadonnées exportées
+        """
+        return {key: value for key, value in document.metadata.items() if key not in INTERNAL_METADATA_KEYS}
 
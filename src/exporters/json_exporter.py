@@ -2,7 +2,6 @@
 
 import json
 from pathlib import Path
-from datetime import datetime
 from src.exporters.base_exporter import BaseExporter
 from src.models.document import Document
 from src.models.analysis import Analysis
@@ -29,20 +28,7 @@ class JsonExporter(BaseExporter):
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Préparer les données à exporter
-        export_data = {
-            'document': {
-                'file_path': document.file_path,
-                'file_type': document.file_type,
-                'title': document.title,
-                'author': document.author,
-                'date': document.date.isoformat() if document.date else None,
-                'metadata': document.metadata,
-                'content_length': len(document.content),
-                'content_preview': document.content[:500] if document.content else None  # Aperçu des 500 premiers caractères
-            },
-            'analysis': analysis.to_dict(),
-            'export_date': datetime.now().isoformat()
-        }
+        export_data = self.build_export_data(document, analysis)
         
         # Écrire le fichier JSON
         with open(output_path, 'w', encoding='utf-8') as f:
@@ -0,0 +1,210 @@
+"""Exportateur en flux NDJSON (un enregistrement JSON compact par ligne)."""
+
+import gzip
+import json
+from datetime import date, time
+from pathlib import Path
+from typing import List, Optional
+from src.exporters.base_exporter import BaseExporter
+from src.models.document import Document
+from src.models.analysis import Analysis
+
+try:
+    import orjson
+except ImportError:  # orjson est optionnel : le module json sert de repli
+    orjson = None
+
+
+def _encode_default(value):
+    """
+    Convertit une valeur que JSON ne sait pas représenter.
+    
+    Utilisée par orjson comme par json, pour que le flux ne dépende pas du
+    sérialiseur installé : les dates sont écrites au format ISO 8601.
+    
+    Args:
+        value: Valeur à convertir
+        
+    Returns:
+        str: Représentation textuelle de la valeur
+    """
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+class NdjsonExporter(BaseExporter):
+    """
+    Exportateur ajoutant chaque document à un flux NDJSON unique.
+    
+    Les enregistrements sont sérialisés sur une ligne (orjson si disponible),
+    accumulés en mémoire puis écrits par lots. Le flux peut être compressé
+    (gzip ou zstd) et découpé en plusieurs fichiers au-delà d'une taille donnée.
+    """
+    
+    COMPRESSIONS = (None, 'gzip', 'zstd')
+    
+    # Extension ajoutée au nom du fichier selon la compression
+    _SUFFIXES = {None: '', 'gzip': '.gz', 'zstd': '.zst'}
+    
+    def __init__(self, compression: Optional[str] = None, buffer_records: int = 500,
+                 max_file_bytes: Optional[int] = None):
+        """
+        Initialise l'exportateur NDJSON.
+        
+        Args:
+            compression: None, 'gzip' ou 'zstd' (nécessite le paquet zstandard)
+            buffer_records: Nombre d'enregistrements accumulés avant chaque écriture
+            max_file_bytes: Taille (non compressée) au-delà de laquelle un nouveau
+                fichier est commencé ; None pour un fichier unique
+                
+        Raises:
+            ValueError: Si la compression est inconnue ou indisponible
+        """
+        if compression not in self.COMPRESSIONS:
+            raise ValueError(
+                f"Compression '{compression}' inconnue. Compressions disponibles: gzip, zstd"
+            )
+        if compression == 'zstd':
+            try:
+                import zstandard
+            except ImportError:
+                raise ValueError("La compression 'zstd' nécessite le paquet zstandard.")
+        
+        self.compression = compression
+        self.buffer_records = max(1, buffer_records)
+        self.max_file_bytes = max_file_bytes
+        
+        self._base_path: Optional[Path] = None
+        self._stream = None
+        self._part = 0
+        self._file_bytes = 0
+        self._buffer: List[bytes] = []
+        self._buffer_bytes = 0
+        self.files: List[str] = []
+    
+    def export(self, document: Document, analysis: Analysis, output_path: str) -> str:
+        """
+        Ajoute un document et son analyse au flux NDJSON.
+        
+        L'enregistrement peut rester en mémoire jusqu'au prochain lot : appeler
+        close() (ou utiliser l'exportateur comme gestionnaire de contexte) pour
+        garantir son écriture.
+        
+        Args:
+            document: Document à exporter
+            analysis: Analyse à exporter
+            output_path: Chemin du flux (le suffixe de compression est ajouté)
+            
+        Returns:
+            str: Chemin du fichier recevant l'enregistrement
+        """
+        base_path = Path(output_path)
+        if base_path != self._base_path:
+            self.close()
+            self._base_path = base_path
+            self._file_bytes = 0
+            self._part = self._first_free_part() if self.max_file_bytes else 0
+        
+        record = self.serialize(self.build_export_data(document, analysis))
+        
+        # Rotation avant d'ajouter un enregistrement qui ferait dépasser la taille maximale
+        if (self.max_file_bytes and self._file_bytes + self._buffer_bytes > 0
+                and self._file_bytes + self._buffer_bytes + len(record) > self.max_file_bytes):
+            self.flush()
+            self._close_stream()
+            self._part += 1
+            self._file_bytes = 0
+        
+        self._buffer.append(record)
+        self._buffer_bytes += len(record)
+        if len(self._buffer) >= self.buffer_records:
+            self.flush()
+        
+        return str(self._part_path(self._part).absolute())
+    
+    @staticmethod
+    def serialize(data: dict) -> bytes:
+        """
+        Sérialise un enregistrement en une ligne JSON compacte terminée par un saut de ligne.
+        
+        Args:
+            data: Enregistrement à sérialiser
+            
+        Returns:
+            bytes: Ligne JSON encodée en UTF-8
+        """
+        if orjson is not None:
+            # Les dates passent par _encode_default plutôt que par l'encodage natif d'orjson
+            return orjson.dumps(
+                data,
+                default=_encode_default,
+                option=(orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+                        | orjson.OPT_PASSTHROUGH_DATETIME)
+            )
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'),
+                          default=_encode_default).encode('utf-8') + b'\n'
+    
+    def flush(self):
+        """Écrit les enregistrements en attente dans le fichier courant."""
+        if not self._buffer:
+            return
+        
+        if self._stream is None:
+            self._open_stream()
+        
+        self._stream.write(b''.join(self._buffer))
+        self._file_bytes += self._buffer_bytes
+        self._buffer = []
+        self._buffer_bytes = 0
+    
+    def close(self):
+        """Écrit les enregistrements en attente et ferme le fichier courant."""
+        self.flush()
+        self._close_stream()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _part_path(self, part: int) -> Path:
+        """Retourne le chemin du fichier numéro part du flux."""
+        suffix = self._SUFFIXES[self.compression]
+        if not self.max_file_bytes:
+            return self._base_path.with_name(self._base_path.name + suffix)
+        return self._base_path.with_name(
+            f"{self._base_path.stem}-{part:05d}{self._base_path.suffix}{suffix}"
+        )
+    
+    def _first_free_part(self) -> int:
+        """Retourne le premier numéro de fichier non utilisé (les fichiers existants sont conservés)."""
+        part = 0
+        while self._part_path(part).exists():
+            part += 1
+        return part
+    
+    def _open_stream(self):
+        """Ouvre le fichier courant en ajout, avec la compression demandée."""
+        path = self._part_path(self._part)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # En ajout, gzip et zstd écrivent un nouveau membre/trame, lisible à la suite des précédents
+        if self.compression == 'gzip':
+            self._stream = gzip.open(path, 'ab', compresslevel=6)
+        elif self.compression == 'zstd':
+            import zstandard
+            self._stream = zstandard.ZstdCompressor().stream_writer(open(path, 'ab'), closefd=True)
+        else:
+            self._stream = open(path, 'ab', buffering=1024 * 1024)
+        
+        if str(path.absolute()) not in self.files:
+            self.files.append(str(path.absolute()))
+    
+    def _close_stream(self):
+        """Ferme le fichier courant s'il est ouvert."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
@@ -0,0 +1,264 @@
+"""Exportateur colonnaire (Parquet ou Arrow IPC) des documents et de leurs analyses."""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from src.exporters.base_exporter import BaseExporter
+from src.models.document import Document
+from src.models.analysis import Analysis
+
+
+def document_id(document: Document) -> str:
+    """Retourne l'identifiant stable d'un document (empreinte de son chemin)."""
+    return hashlib.sha1(document.file_path.encode('utf-8')).hexdigest()[:16]
+
+
+def _schemas(pa) -> Dict:
+    """Retourne les schémas des tables exportées, reliées par la colonne doc_id."""
+    label = pa.dictionary(pa.int32(), pa.string())
+    return {
+        'documents': pa.schema([
+            ('doc_id', pa.string()),
+            ('file_path', pa.string()),
+            ('file_type', label),
+            ('title', pa.string()),
+            ('author', pa.string()),
+            ('date', pa.timestamp('us')),
+            ('metadata', pa.string()),
+            ('content_length', pa.int64()),
+            ('language', label),
+            ('word_count', pa.int64()),
+            ('sentence_count', pa.int64()),
+            ('sentiment_label', label),
+            ('sentiment_polarity', pa.float64()),
+            ('sentiment_subjectivity', pa.float64()),
+            ('sentiment_section_polarity', pa.list_(pa.float64())),
+            ('duplicate_of', pa.string()),
+            ('duplicate_similarity', pa.float64()),
+            ('export_date', pa.timestamp('us'))
+        ]),
+        'entities': pa.schema([
+            ('doc_id', pa.string()),
+            ('text', pa.string()),
+            ('label', label),
+            ('start', pa.int64()),
+            ('end', pa.int64()),
+            ('confidence', pa.float64())
+        ]),
+        'relations': pa.schema([
+            ('doc_id', pa.string()),
+            ('entity1', pa.string()),
+            ('entity2', pa.string()),
+            ('relation_type', label),
+            ('confidence', pa.float64())
+        ]),
+        'categories': pa.schema([
+            ('doc_id', pa.string()),
+            ('category', label),
+            ('rank', pa.int32())
+        ])
+    }
+
+
+class ParquetExporter(BaseExporter):
+    """
+    Exportateur écrivant des tables plates (documents, entités, relations, catégories).
+    
+    Les lignes de nombreux documents sont accumulées colonne par colonne puis
+    écrites par groupes de lignes, ce qui permet ensuite de ne lire que les
+    colonnes utiles (Parquet) ou de projeter les fichiers en mémoire (Arrow).
+    """
+    
+    FORMATS = ('parquet', 'arrow')
+    
+    _EXTENSIONS = {'parquet': '.parquet', 'arrow': '.arrow'}
+    
+    # Compression retenue avec 'auto' : un fichier Arrow compressé doit être
+    # décompressé à la lecture et ne peut plus être projeté en mémoire sans copie
+    _DEFAULT_COMPRESSIONS = {'parquet': 'zstd', 'arrow': None}
+    
+    def __init__(self, file_format: str = 'parquet', row_group_rows: int = 100_000,
+                 compression: Optional[str] = 'auto'):
+        """
+        Initialise l'exportateur colonnaire.
+        
+        Args:
+            file_format: 'parquet' ou 'arrow' (fichier Arrow IPC, projetable en mémoire)
+            row_group_rows: Nombre de lignes accumulées par table avant d'écrire un groupe
+            compression: Codec de compression des fichiers, None pour aucun ou 'auto'
+                (zstd pour Parquet, aucune pour Arrow afin de garder la lecture sans copie)
+            
+        Raises:
+            ValueError: Si le format est inconnu ou si pyarrow n'est pas installé
+        """
+        if file_format not in self.FORMATS:
+            raise ValueError(
+                f"Format colonnaire '{file_format}' inconnu. Formats disponibles: {', '.join(self.FORMATS)}"
+            )
+        try:
+            # Import différé : pyarrow n'est chargé que si l'export colonnaire est utilisé
+            import pyarrow
+        except ImportError:
+            raise ValueError("L'export colonnaire nécessite le paquet pyarrow.")
+        if compression == 'auto':
+            compression = self._DEFAULT_COMPRESSIONS[file_format]
+        if file_format == 'arrow' and compression not in (None, 'lz4', 'zstd'):
+            raise ValueError(f"Compression '{compression}' non supportée par le format Arrow (lz4 ou zstd).")
+        
+        self.file_format = file_format
+        self.row_group_rows = max(1, row_group_rows)
+        self.compression = compression
+        self.schemas = _schemas(pyarrow)
+        
+        self._output_dir: Optional[Path] = None
+        self._writers: Dict[str, object] = {}
+        self._columns: Dict[str, Dict[str, list]] = {}
+        self._reset_columns()
+        self.files: List[str] = []
+    
+    def export(self, document: Document, analysis: Analysis, output_path: str) -> str:
+        """
+        Ajoute un document et son analyse aux tables du répertoire output_path.
+        
+        Les lignes peuvent rester en mémoire jusqu'au prochain groupe : appeler
+        close() (ou utiliser l'exportateur comme gestionnaire de contexte) pour
+        garantir leur écriture.
+        
+        Args:
+            document: Document à exporter
+            analysis: Analyse à exporter
+            output_path: Répertoire recevant un fichier par table
+            
+        Returns:
+            str: Chemin du répertoire des tables
+        """
+        output_dir = Path(output_path)
+        if output_dir != self._output_dir:
+            self.close()
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._output_dir = output_dir
+        
+        doc_id = document_id(document)
+        sentiment = analysis.sentiment or {}
+        duplicate = analysis.duplicate_of or {}
+        
+        self._append('documents', {
+            'doc_id': doc_id,
+            'file_path': document.file_path,
+            'file_type': document.file_type,
+            'title': document.title,
+            'author': document.author,
+            'date': document.date,
+            'metadata': json.dumps(self.exported_metadata(document), ensure_ascii=False, default=str),
+            'content_length': len(document.content),
+            'language': analysis.language,
+            'word_count': analysis.word_count,
+            'sentence_count': analysis.sentence_count,
+            'sentiment_label': sentiment.get('label'),
+            'sentiment_polarity': sentiment.get('polarity'),
+            'sentiment_subjectivity': sentiment.get('subjectivity'),
+            'sentiment_section_polarity': sentiment.get('section_polarity'),
+            'duplicate_of': duplicate.get('file_path'),
+            'duplicate_similarity': duplicate.get('similarity'),
+            'export_date': datetime.now()
+        })
+        
+        # Entités, relations et catégories sont ajoutées colonne par colonne
+        entities = self._columns['entities']
+        entities['doc_id'].extend([doc_id] * len(analysis.entities))
+        for column, values in analysis.entities.columns().items():
+            entities[column].extend(values)
+        
+        relations = self._columns['relations']
+        for relation in analysis.relations:
+            relations['doc_id'].append(doc_id)
+            relations['entity1'].append(relation.entity1)
+            relations['entity2'].append(relation.entity2)
+            relations['relation_type'].append(relation.relation_type)
+            relations['confidence'].append(relation.confidence)
+        
+        categories = self._columns['categories']
+        for rank, category in enumerate(analysis.categories):
+            categories['doc_id'].append(doc_id)
+            categories['category'].append(category)
+            categories['rank'].append(rank)
+        
+        for table, columns in self._columns.items():
+            if len(columns['doc_id']) >= self.row_group_rows:
+                self._write_group(table)
+        
+        return str(self._output_dir.absolute())
+    
+    def flush(self):
+        """Écrit les lignes en attente de chaque table dans un nouveau groupe."""
+        for table in self._columns:
+            if self._columns[table]['doc_id']:
+                self._write_group(table)
+    
+    def close(self):
+        """Écrit les lignes en attente et finalise les fichiers (schéma et pied de page)."""
+        if self._output_dir is None:
+            return
+        
+        self.flush()
+        # Une table sans aucune ligne est tout de même créée, avec son schéma
+        for table in self.schemas:
+            self._get_writer(table)
+        for writer in self._writers.values():
+            writer.close()
+        
+        self._writers = {}
+        self._output_dir = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _table_path(self, table: str) -> Path:
+        """Retourne le chemin du fichier d'une table."""
+        return self._output_dir / f'{table}{self._EXTENSIONS[self.file_format]}'
+    
+    def _reset_columns(self, table: Optional[str] = None):
+        """Vide les colonnes accumulées d'une table (ou de toutes les tables)."""
+        for name in ([table] if table else self.schemas):
+            self._columns[name] = {column: [] for column in self.schemas[name].names}
+    
+    def _append(self, table: str, row: Dict):
+        """Ajoute une ligne à une table, valeur par valeur dans chaque colonne."""
+        columns = self._columns[table]
+        for column, value in row.items():
+            columns[column].append(value)
+    
+    def _get_writer(self, table: str):
+        """Ouvre (si nécessaire) le fichier d'une table."""
+        if table not in self._writers:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            
+            path = str(self._table_path(table))
+            if str(Path(path).absolute()) not in self.files:
+                self.files.append(str(Path(path).absolute()))
+            schema = self.schemas[table]
+            if self.file_format == 'parquet':
+                self._writers[table] = pq.ParquetWriter(path, schema, compression=self.compression or 'none')
+            else:
+                options = pa.ipc.IpcWriteOptions(compression=self.compression)
+                self._writers[table] = pa.ipc.new_file(path, schema, options=options)
+        return self._writers[table]
+    
+    def _write_group(self, table: str):
+        """Convertit les colonnes accumulées d'une table en un groupe de lignes et l'écrit."""
+        import pyarrow as pa
+        
+        batch = pa.RecordBatch.from_pydict(self._columns[table], schema=self.schemas[table])
+        writer = self._get_writer(table)
+        if self.file_format == 'parquet':
+            writer.write_table(pa.Table.from_batches([batch]), row_group_size=len(batch) or None)
+        else:
+            writer.write_batch(batch)
+        self._reset_columns(table)
+
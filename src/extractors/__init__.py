@@ -1,13 +1,26 @@
 """Extracteurs de texte depuis différents formats de documents."""
 
+import importlib
 from .base_extractor import BaseExtractor
-from .txt_extractor import TxtExtractor
-from .pdf_extractor import PdfExtractor
-from .epub_extractor import EpubExtractor
-from .html_extractor import HtmlExtractor
-from .docx_extractor import DocxExtractor
 from .extractor_factory import ExtractorFactory
 
+# Extracteurs importés à la demande, pour ne pas charger toutes les dépendances
+_LAZY_EXTRACTORS = {
+    'TxtExtractor': '.txt_extractor',
+    'PdfExtractor': '.pdf_extractor',
+    'EpubExtractor': '.epub_extractor',
+    'HtmlExtractor': '.html_extractor',
+    'DocxExtractor': '.docx_extractor'
+}
+
+
+def __getattr__(name):
+    """Importe un extracteur au premier accès (PEP 562)."""
+    if name in _LAZY_EXTRACTORS:
+        return getattr(importlib.import_module(_LAZY_EXTRACTORS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     'BaseExtractor',
     'TxtExtractor',
@@ -1,14 +1,261 @@
 """Extracteur pour les fichiers DOCX."""
 
-from docx import Document as DocxDocument
+import re
+import zipfile
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import IO, Dict, Iterator, Optional
 from src.extractors.base_extractor import BaseExtractor
 from src.models.document import Document
 
+try:
+    from lxml import etree
+except ImportError:  # lxml est optionnel : ElementTree (bibliothèque standard) sert de repli
+    import xml.etree.ElementTree as etree
+
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_P = _W + 'p'
+_R = _W + 'r'
+_T = _W + 't'
+_TBL = _W + 'tbl'
+_TR = _W + 'tr'
+_TC = _W + 'tc'
+_TC_PR = _W + 'tcPr'
+_TR_PR = _W + 'trPr'
+_GRID_SPAN = _W + 'gridSpan'
+_GRID_BEFORE = _W + 'gridBefore'
+_V_MERGE = _W + 'vMerge'
+_VAL = _W + 'val'
+_BR = _W + 'br'
+_BR_TYPE = _W + 'type'
+
+# Équivalent texte des éléments de contenu d'un run (hors w:t et w:br)
+_RUN_CHARS = {
+    _W + 'tab': '\t',
+    _W + 'ptab': '\t',
+    _W + 'cr': '\n',
+    _W + 'noBreakHyphen': '-'
+}
+
+_CP = '{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}'
+_DC = '{http://purl.org/dc/elements/1.1/}'
+_DCTERMS = '{http://purl.org/dc/terms/}'
+
+# Propriétés textuelles de docProps/core.xml, dans l'ordre de python-docx
+_CORE_TEXT_PROPERTIES = {
+    'title': _DC + 'title',
+    'author': _DC + 'creator',
+    'subject': _DC + 'subject',
+    'keywords': _CP + 'keywords',
+    'category': _CP + 'category',
+    'comments': _DC + 'description'
+}
+
+_OFFSET_PATTERN = re.compile(r'([+-])(\d\d):(\d\d)')
+
+
+def _parse_w3cdtf(value: Optional[str]) -> Optional[datetime]:
+    """
+    Convertit une date W3CDTF (ex: 2003-12-31T10:14:55-08:00) en datetime UTC.
+    
+    Args:
+        value: Date au format W3CDTF
+        
+    Returns:
+        Optional[datetime]: Date convertie, ou None si elle est absente ou invalide
+    """
+    if not value:
+        return None
+    
+    parsed = None
+    for template in ('%Y-%m-%dT%H:%M:%S', '%Y-%m-%d', '%Y-%m', '%Y'):
+        try:
+            parsed = datetime.strptime(value[:19], template)
+            break
+        except ValueError:
+            continue
+    if parsed is None:
+        return None
+    
+    offset = _OFFSET_PATTERN.match(value[19:])
+    if offset and len(value[19:]) == 6:
+        sign, hours, minutes = offset.groups()
+        delta = timedelta(hours=int(hours), minutes=int(minutes))
+        parsed = parsed - delta if sign == '+' else parsed + delta
+    return parsed.replace(tzinfo=timezone.utc)
+
+
+def _read_core_properties(archive: zipfile.ZipFile) -> Dict:
+    """
+    Lit les propriétés du document dans docProps/core.xml.
+    
+    Args:
+        archive: Archive DOCX ouverte
+        
+    Returns:
+        Dict: Métadonnées (mêmes clés et valeurs que les core_properties de python-docx)
+    """
+    try:
+        root = etree.fromstring(archive.read('docProps/core.xml'))
+    except KeyError:
+        return {}
+    
+    def text_of(tag: str) -> Optional[str]:
+        element = root.find(tag)
+        return element.text if element is not None else None
+    
+    metadata = {key: text_of(tag) or '' for key, tag in _CORE_TEXT_PROPERTIES.items()}
+    
+    created = _parse_w3cdtf(text_of(_DCTERMS + 'created'))
+    modified = _parse_w3cdtf(text_of(_DCTERMS + 'modified'))
+    metadata['created'] = str(created) if created else None
+    metadata['modified'] = str(modified) if modified else None
+    
+    try:
+        revision = max(0, int(text_of(_CP + 'revision') or 0))
+    except ValueError:
+        revision = 0
+    metadata['revision'] = revision
+    metadata['last_modified_by'] = text_of(_CP + 'lastModifiedBy') or ''
+    return metadata
+
+
+def _iter_blocks(source: IO[bytes]) -> Iterator[str]:
+    """
+    Parcourt word/document.xml en flux et produit le texte des blocs dans l'ordre du document.
+    
+    Chaque paragraphe hors tableau produit un bloc, et chaque ligne de tableau un
+    bloc où les cellules sont séparées par ' | ', comme les cellules d'une ligne
+    de python-docx : une cellule fusionnée horizontalement (gridSpan) est répétée
+    pour chaque colonne couverte, et la suite d'une fusion verticale (vMerge)
+    reprend le texte de la cellule d'origine. Le texte d'une cellule réunit ses
+    paragraphes et les lignes de ses tableaux imbriqués. Les éléments sont
+    détachés de l'arbre dès qu'ils ont été lus : la mémoire reste bornée quelle
+    que soit la taille du document.
+    
+    Args:
+        source: Flux de la partie word/document.xml
+        
+    Returns:
+        Iterator[str]: Texte des paragraphes et des lignes de tableau
+    """
+    stack = []
+    # Tampons des paragraphes ouverts (un paragraphe de zone de texte est imbriqué)
+    paragraphs = []
+    # Tableaux ouverts, du plus externe au plus imbriqué
+    tables = []
+    
+    for event, element in etree.iterparse(source, events=('start', 'end')):
+        tag = element.tag
+        
+        if event == 'start':
+            stack.append(element)
+            if tag == _P:
+                paragraphs.append([])
+            elif tag == _TBL:
+                # Texte des cellules d'origine des fusions verticales, par colonne de la grille
+                tables.append({'cells': [], 'blocks': [], 'columns': 0, 'merged': {}})
+            elif tables:
+                if tag == _TR:
+                    tables[-1]['cells'] = []
+                    tables[-1]['columns'] = 0
+                elif tag == _TC:
+                    tables[-1]['blocks'] = []
+            continue
+        
+        stack.pop()
+        parent = stack[-1] if stack else None
+        
+        if parent is not None and parent.tag == _R and paragraphs:
+            # Contenu d'un run : le texte n'est complet qu'à la fin de l'élément
+            if tag == _T:
+                if element.text:
+                    paragraphs[-1].append(element.text)
+            elif tag == _BR:
+                # Les sauts de page et de colonne n'ont pas d'équivalent texte
+                if element.get(_BR_TYPE, 'textWrapping') == 'textWrapping':
+                    paragraphs[-1].append('\n')
+            elif tag in _RUN_CHARS:
+                paragraphs[-1].append(_RUN_CHARS[tag])
+            continue
+        
+        if tag == _P:
+            text = ''.join(paragraphs.pop())
+            # Le texte des zones de texte imbriquées est ignoré, comme avec python-docx
+            if not paragraphs:
+                if tables:
+                    tables[-1]['blocks'].append(text)
+                else:
+                    text = text.strip()
+                    if text:
+                        yield text
+        elif tag == _TBL:
+            tables.pop()
+        elif tables:
+            table = tables[-1]
+            if tag == _TC:
+                _close_cell(table, element, parent)
+            elif tag == _TR:
+                row_text = ' | '.join(table['cells'])
+                if row_text:
+                    if len(tables) > 1:
+                        # Ligne d'un tableau imbriqué : elle fait partie de la cellule englobante
+                        tables[-2]['blocks'].append(row_text)
+                    else:
+                        yield row_text
+        
+        # Détacher les blocs lus (et tout enfant direct du corps) pour libérer la mémoire
+        if parent is not None and (tag in (_P, _TR) or len(stack) == 2):
+            parent.remove(element)
+
+
+def _close_cell(table: Dict, tc, tr):
+    """
+    Ajoute à la ligne en cours le texte d'une cellule lue, une fois par colonne couverte.
+    
+    Args:
+        table: État du tableau en cours de lecture (voir _iter_blocks)
+        tc: Élément w:tc complet
+        tr: Élément w:tr parent
+    """
+    if not table['cells'] and not table['columns']:
+        # Colonnes de la grille laissées vides en début de ligne
+        grid_before = tr.find(f'{_TR_PR}/{_GRID_BEFORE}')
+        table['columns'] = int(grid_before.get(_VAL, 0)) if grid_before is not None else 0
+    
+    span = tc.find(f'{_TC_PR}/{_GRID_SPAN}')
+    span = int(span.get(_VAL, 1)) if span is not None else 1
+    merge = tc.find(f'{_TC_PR}/{_V_MERGE}')
+    column = table['columns']
+    
+    if merge is not None and merge.get(_VAL, 'continue') == 'continue':
+        # Suite d'une fusion verticale : contenu de la cellule d'origine
+        texts = [table['merged'].get(column + offset, '') for offset in range(span)]
+    else:
+        text = '\n'.join(table['blocks']).strip()
+        texts = [text] * span
+        for offset in range(span):
+            table['merged'][column + offset] = text
+    
+    table['cells'].extend(texts)
+    table['columns'] += span
+
 
 class DocxExtractor(BaseExtractor):
     """Extracteur pour les fichiers DOCX (.docx)."""
     
+    def __init__(self, streaming: bool = True):
+        """
+        Initialise l'extracteur DOCX.
+        
+        Args:
+            streaming: Lire word/document.xml en flux (True), ou charger le modèle
+                objet complet de python-docx (False) ; le texte produit est le même,
+                paragraphes et tableaux dans l'ordre du document
+        """
+        self.streaming = streaming
+    
     def extract(self, file_path: str) -> Document:
         """
         Extrait le contenu d'un fichier DOCX.
@@ -32,35 +279,13 @@ class DocxExtractor(BaseExtractor):
         metadata = {}
         
         try:
-            doc = DocxDocument(file_path)
-            
-            # Extraction du texte de tous les paragraphes
-            for paragraph in doc.paragraphs:
-                text = paragraph.text.strip()
-                if text:
-                    content_parts.append(text)
-            
-            # Extraction du texte des tableaux
-            for table in doc.tables:
-                for row in table.rows:
-                    row_text = ' | '.join([cell.text.strip() for cell in row.cells])
-                    if row_text:
-                        content_parts.append(row_text)
-            
-            # Extraction des propriétés du document
-            core_props = doc.core_properties
-            metadata = {
-                'title': core_props.title,
-                'author': core_props.author,
-                'subject': core_props.subject,
-                'keywords': core_props.keywords,
-                'category': core_props.category,
-                'comments': core_props.comments,
-                'created': str(core_props.created) if core_props.created else None,
-                'modified': str(core_props.modified) if core_props.modified else None,
-                'revision': core_props.revision,
-                'last_modified_by': core_props.last_modified_by
-            }
+            if self.streaming:
+                with zipfile.ZipFile(file_path) as archive:
+                    with archive.open('word/document.xml') as source:
+                        content_parts.extend(_iter_blocks(source))
+                    metadata = _read_core_properties(archive)
+            else:
+                metadata = self._extract_with_python_docx(file_path, content_parts)
             
             # Nettoyage des valeurs None
             metadata = {k: v for k, v in metadata.items() if v is not None}
@@ -78,4 +303,74 @@ class DocxExtractor(BaseExtractor):
             author=metadata.get('author'),
             metadata=metadata
         )
+    
+    def _extract_with_python_docx(self, file_path: str, content_parts: list) -> Dict:
+        """
+        Extrait le texte avec le modèle objet de python-docx.
+        
+        Args:
+            file_path: Chemin vers le fichier DOCX
+            content_parts: Liste complétée avec le texte des paragraphes et des lignes
+                de tableau, dans l'ordre du document
+            
+        Returns:
+            Dict: Propriétés du document
+        """
+        # Import différé : python-docx n'est chargé que pour ce mode de lecture
+        from docx import Document as DocxDocument
+        from docx.table import Table
+        
+        doc = DocxDocument(file_path)
+        
+        # Paragraphes et tableaux du corps, dans l'ordre du document
+        for item in doc.iter_inner_content():
+            if isinstance(item, Table):
+                content_parts.extend(self._python_docx_rows(item))
+            else:
+                text = item.text.strip()
+                if text:
+                    content_parts.append(text)
+        
+        # Extraction des propriétés du document
+        core_props = doc.core_properties
+        return {
+            'title': core_props.title,
+            'author': core_props.author,
+            'subject': core_props.subject,
+            'keywords': core_props.keywords,
+            'category': core_props.category,
+            'comments': core_props.comments,
+            'created': str(core_props.created) if core_props.created else None,
+            'modified': str(core_props.modified) if core_props.modified else None,
+            'revision': core_props.revision,
+            'last_modified_by': core_props.last_modified_by
+        }
+    
+    @classmethod
+    def _python_docx_rows(cls, table) -> Iterator[str]:
+        """
+        Produit le texte des lignes d'un tableau python-docx (cellules séparées par ' | ').
+        
+        Args:
+            table: Tableau python-docx
+            
+        Returns:
+            Iterator[str]: Texte des lignes non vides
+        """
+        from docx.table import Table
+        
+        for row in table.rows:
+            cells = []
+            # row.cells répète les cellules fusionnées (gridSpan, vMerge)
+            for cell in row.cells:
+                blocks = []
+                for item in cell.iter_inner_content():
+                    if isinstance(item, Table):
+                        blocks.extend(cls._python_docx_rows(item))
+                    else:
+                        blocks.append(item.text)
+                cells.append('\n'.join(blocks).strip())
+            row_text = ' | '.join(cells)
+            if row_text:
+                yield row_text
 
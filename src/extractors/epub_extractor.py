@@ -1,16 +1,101 @@
 """Extracteur pour les fichiers EPUB."""
 
+import hashlib
+import os
 import ebooklib
+from concurrent.futures import ProcessPoolExecutor
 from ebooklib import epub
 from pathlib import Path
-from bs4 import BeautifulSoup
+from typing import List, Optional
 from src.extractors.base_extractor import BaseExtractor
 from src.models.document import Document
 
+try:
+    import lxml.html
+except ImportError:  # lxml est optionnel : BeautifulSoup sert de repli
+    lxml = None
+
+
+# Balises dont le contenu n'est pas du texte de chapitre
+_SKIPPED_TAGS = ('script', 'style', 'template')
+
+
+def _chapter_text(content: bytes, backend: str) -> str:
+    """
+    Extrait le texte d'un chapitre XHTML (exécutable dans un processus fils).
+    
+    Args:
+        content: Contenu brut du chapitre
+        backend: 'lxml' ou 'bs4'
+        
+    Returns:
+        str: Texte du chapitre, fragments séparés par une espace
+    """
+    if backend == 'lxml':
+        if not content.strip():
+            return ''
+        parser = lxml.html.HTMLParser(encoding='utf-8')
+        root = lxml.html.document_fromstring(content, parser=parser)
+        # Comme BeautifulSoup.get_text, le contenu des scripts, styles et modèles est
+        # ignoré. L'élément vidé reste en place : sa queue de texte demeure un nœud
+        # distinct, séparé par une espace (strip_elements la collerait au texte précédent)
+        for element in list(root.iter(*_SKIPPED_TAGS)):
+            element.clear(keep_tail=True)
+        return ' '.join(text.strip() for text in root.itertext() if text.strip())
+    
+    # Import différé : BeautifulSoup n'est chargé que pour le backend bs4
+    from bs4 import BeautifulSoup, CData
+    
+    soup = BeautifulSoup(content, 'html.parser')
+    for element in soup(list(_SKIPPED_TAGS)):
+        element.decompose()
+    # Les sections CDATA sont des commentaires pour l'analyseur HTML de lxml
+    for cdata in soup.find_all(string=lambda text: isinstance(text, CData)):
+        cdata.extract()
+    return soup.get_text(separator=' ', strip=True)
+
+
+def _chapter_texts(contents: List[bytes], backend: str) -> List[str]:
+    """Extrait le texte d'un lot de chapitres (une tâche par lot limite les échanges)."""
+    return [_chapter_text(content, backend) for content in contents]
+
 
 class EpubExtractor(BaseExtractor):
     """Extracteur pour les fichiers EPUB (.epub)."""
     
+    # Séparateur inséré entre deux chapitres dans le contenu
+    SEPARATOR = '\n\n'
+    
+    BACKENDS = ('auto', 'lxml', 'bs4')
+    
+    def __init__(self, max_workers: Optional[int] = 1, parallel_min_chapters: int = 50,
+                 backend: str = 'auto'):
+        """
+        Initialise l'extracteur EPUB.
+        
+        Args:
+            max_workers: Nombre de processus pour l'analyse HTML des chapitres
+                (1: analyse séquentielle, None: nombre de cœurs)
+            parallel_min_chapters: Nombre minimal de chapitres à partir duquel
+                l'analyse est répartie entre plusieurs processus
+            backend: 'lxml' (rapide, nécessite lxml), 'bs4' (BeautifulSoup avec
+                html.parser) ou 'auto' (lxml si disponible, sinon bs4)
+                
+        Raises:
+            ValueError: Si le backend est inconnu ou indisponible
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(
+                f"Backend HTML '{backend}' inconnu. Backends disponibles: {', '.join(self.BACKENDS)}"
+            )
+        if backend == 'lxml' and lxml is None:
+            raise ValueError("Le backend HTML 'lxml' nécessite le paquet lxml.")
+        if backend == 'auto':
+            backend = 'lxml' if lxml is not None else 'bs4'
+        self.backend = backend
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.parallel_min_chapters = parallel_min_chapters
+    
     def extract(self, file_path: str) -> Document:
         """
         Extrait le contenu d'un fichier EPUB.
@@ -31,6 +116,8 @@ class EpubExtractor(BaseExtractor):
             raise FileNotFoundError(f"Le fichier {file_path} n'existe pas.")
         
         content_parts = []
+        segments = []
+        offset = 0
         metadata = {}
         
         try:
@@ -51,18 +138,30 @@ class EpubExtractor(BaseExtractor):
                 if value and isinstance(value, list) and len(value) > 0:
                     metadata[key] = value[0][0] if isinstance(value[0], tuple) else value[0]
             
-            # Extraction du contenu de tous les chapitres
-            for item in book.get_items():
-                if item.get_type() == ebooklib.ITEM_DOCUMENT:
-                    soup = BeautifulSoup(item.get_content(), 'html.parser')
-                    text = soup.get_text(separator=' ', strip=True)
-                    if text:
-                        content_parts.append(text)
+            # Extraction du contenu de tous les chapitres, dans l'ordre du livre
+            items = [item for item in book.get_items() if item.get_type() == ebooklib.ITEM_DOCUMENT]
+            texts = self._parse_chapters([item.get_content() for item in items])
+            
+            # Position de chaque chapitre dans le contenu
+            for item, text in zip(items, texts):
+                if text:
+                    if content_parts:
+                        offset += len(self.SEPARATOR)
+                    segments.append({
+                        'id': item.get_id(),
+                        'hash': hashlib.sha256(text.encode('utf-8')).hexdigest(),
+                        'start': offset,
+                        'end': offset + len(text)
+                    })
+                    content_parts.append(text)
+                    offset += len(text)
         
         except Exception as e:
             raise Exception(f"Erreur lors de la lecture de l'EPUB: {str(e)}")
         
-        content = '\n\n'.join(content_parts)
+        content = self.SEPARATOR.join(content_parts)
+        # Segments par chapitre, utilisés pour la réanalyse incrémentale
+        metadata['segments'] = segments
         
         return Document(
             content=content,
@@ -72,4 +171,28 @@ class EpubExtractor(BaseExtractor):
             author=metadata.get('author'),
             metadata=metadata
         )
+    
+    def _parse_chapters(self, contents: List[bytes]) -> List[str]:
+        """
+        Extrait le texte de chaque chapitre, en parallèle pour les gros livres.
+        
+        Args:
+            contents: Contenu brut des chapitres, dans l'ordre du livre
+            
+        Returns:
+            List[str]: Texte de chaque chapitre, dans le même ordre
+        """
+        if self.max_workers <= 1 or len(contents) < self.parallel_min_chapters:
+            return [_chapter_text(content, self.backend) for content in contents]
+        
+        # Lots contigus de chapitres, réassemblés dans l'ordre
+        workers = min(self.max_workers, len(contents))
+        batch_size = -(-len(contents) // (workers * 4))
+        batches = [contents[i:i + batch_size] for i in range(0, len(contents), batch_size)]
+        
+        texts = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for batch_texts in executor.map(_chapter_texts, batches, [self.backend] * len(batches)):
+                texts.extend(batch_texts)
+        return texts
 
@@ -1,27 +1,58 @@
 """Factory pour sélectionner automatiquement le bon extracteur."""
 
+import importlib
 from pathlib import Path
-from src.extractors.txt_extractor import TxtExtractor
-from src.extractors.pdf_extractor import PdfExtractor
-from src.extractors.epub_extractor import EpubExtractor
-from src.extractors.html_extractor import HtmlExtractor
-from src.extractors.docx_extractor import DocxExtractor
 from src.extractors.base_extractor import BaseExtractor
 
 
 class ExtractorFactory:
     """Factory pour créer le bon extracteur selon le type de fichier."""
     
-    # Mapping des extensions vers les classes d'extracteurs
+    # Mapping des extensions vers les classes d'extracteurs (module, classe).
+    # Les modules ne sont importés qu'à la première utilisation : seules les
+    # dépendances du format demandé (pdfplumber, ebooklib, ...) sont chargées.
     _extractors = {
-        'txt': TxtExtractor,
-        'pdf': PdfExtractor,
-        'epub': EpubExtractor,
-        'html': HtmlExtractor,
-        'htm': HtmlExtractor,
-        'docx': DocxExtractor
+        'txt': ('src.extractors.txt_extractor', 'TxtExtractor'),
+        'pdf': ('src.extractors.pdf_extractor', 'PdfExtractor'),
+        'epub': ('src.extractors.epub_extractor', 'EpubExtractor'),
+        'html': ('src.extractors.html_extractor', 'HtmlExtractor'),
+        'htm': ('src.extractors.html_extractor', 'HtmlExtractor'),
+        'docx': ('src.extractors.docx_extractor', 'DocxExtractor')
     }
     
+    # Options passées au constructeur de l'extracteur, par extension
+    _options = {}
+    
+    @classmethod
+    def configure(cls, extension: str, **options):
+        """
+        Définit les options de construction de l'extracteur d'une extension.
+        
+        Args:
+            extension: Extension concernée (sans le point, ex: 'pdf')
+            **options: Arguments passés au constructeur de l'extracteur
+            
+        Raises:
+            ValueError: Si le format de fichier n'est pas supporté
+        """
+        extension = extension.lower().lstrip('.')
+        if extension not in cls._extractors:
+            raise ValueError(f"Format de fichier '{extension}' non supporté.")
+        cls._options.setdefault(extension, {}).update(options)
+    
+    @classmethod
+    def get_options(cls, extension: str) -> dict:
+        """
+        Retourne les options de construction de l'extracteur d'une extension.
+        
+        Args:
+            extension: Extension concernée (avec ou sans le point)
+            
+        Returns:
+            dict: Options définies par configure (vide si aucune)
+        """
+        return dict(cls._options.get(extension.lower().lstrip('.'), {}))
+    
     @classmethod
     def get_extractor(cls, file_path: str) -> BaseExtractor:
         """
@@ -46,8 +77,29 @@ class ExtractorFactory:
                 f"Formats supportés: {supported_formats}"
             )
         
-        extractor_class = cls._extractors[extension]
-        return extractor_class()
+        extractor_class = cls.get_extractor_class(extension)
+        return extractor_class(**cls._options.get(extension, {}))
+    
+    @classmethod
+    def get_extractor_class(cls, extension: str) -> type:
+        """
+        Importe (si nécessaire) et retourne la classe d'extracteur d'une extension.
+        
+        Args:
+            extension: Extension sans le point (ex: 'pdf')
+            
+        Returns:
+            type: Classe de l'extracteur
+            
+        Raises:
+            ValueError: Si le format de fichier n'est pas supporté
+        """
+        extension = extension.lower().lstrip('.')
+        if extension not in cls._extractors:
+            raise ValueError(f"Format de fichier '{extension}' non supporté.")
+        
+        module_name, class_name = cls._extractors[extension]
+        return getattr(importlib.import_module(module_name), class_name)
     
     @classmethod
     def is_supported(cls, file_path: str) -> bool:
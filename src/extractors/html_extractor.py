@@ -1,14 +1,45 @@
 """Extracteur pour les fichiers HTML."""
 
 from pathlib import Path
-from bs4 import BeautifulSoup
+from typing import Optional, Tuple
 from src.extractors.base_extractor import BaseExtractor
 from src.models.document import Document
 
+try:
+    import lxml.html
+except ImportError:  # lxml est optionnel : BeautifulSoup sert de repli
+    lxml = None
+
 
 class HtmlExtractor(BaseExtractor):
     """Extracteur pour les fichiers HTML (.html, .htm)."""
     
+    # Balises dont le contenu n'est pas du texte principal
+    REMOVED_TAGS = ('script', 'style', 'template', 'nav', 'header', 'footer')
+    
+    BACKENDS = ('auto', 'lxml', 'bs4')
+    
+    def __init__(self, backend: str = 'auto'):
+        """
+        Initialise l'extracteur HTML.
+        
+        Args:
+            backend: 'lxml' (rapide, nécessite lxml), 'bs4' (BeautifulSoup avec
+                html.parser) ou 'auto' (lxml si disponible, sinon bs4)
+                
+        Raises:
+            ValueError: Si le backend est inconnu ou indisponible
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(
+                f"Backend HTML '{backend}' inconnu. Backends disponibles: {', '.join(self.BACKENDS)}"
+            )
+        if backend == 'lxml' and lxml is None:
+            raise ValueError("Le backend HTML 'lxml' nécessite le paquet lxml.")
+        if backend == 'auto':
+            backend = 'lxml' if lxml is not None else 'bs4'
+        self.backend = backend
+    
     def extract(self, file_path: str) -> Document:
         """
         Extrait le contenu textuel d'un fichier HTML.
@@ -28,35 +59,14 @@ class HtmlExtractor(BaseExtractor):
         if not path.exists():
             raise FileNotFoundError(f"Le fichier {file_path} n'existe pas.")
         
-        metadata = {}
-        
         try:
             with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
                 html_content = f.read()
             
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Extraction du titre
-            title_tag = soup.find('title')
-            title = title_tag.get_text(strip=True) if title_tag else None
-            
-            # Extraction des métadonnées meta
-            meta_tags = soup.find_all('meta')
-            for meta in meta_tags:
-                name = meta.get('name') or meta.get('property')
-                content = meta.get('content')
-                if name and content:
-                    metadata[name] = content
-            
-            # Suppression des scripts et styles
-            for script in soup(['script', 'style', 'nav', 'header', 'footer']):
-                script.decompose()
-            
-            # Extraction du texte principal
-            content = soup.get_text(separator=' ', strip=True)
-            
-            # Nettoyage des espaces multiples
-            content = ' '.join(content.split())
+            if self.backend == 'lxml':
+                content, title, metadata = self._parse_lxml(html_content)
+            else:
+                content, title, metadata = self._parse_bs4(html_content)
         
         except Exception as e:
             raise Exception(f"Erreur lors de la lecture du HTML: {str(e)}")
@@ -68,4 +78,98 @@ class HtmlExtractor(BaseExtractor):
             title=title,
             metadata=metadata
         )
+    
+    def _parse_lxml(self, html_content: str) -> Tuple[str, Optional[str], dict]:
+        """
+        Extrait texte, titre et métadonnées avec lxml (analyseur C).
+        
+        Un seul parcours filtré de l'arbre collecte <title>, les <meta> et les
+        balises à supprimer ; le texte est ensuite produit par itertext.
+        
+        Args:
+            html_content: Code HTML du document
+            
+        Returns:
+            Tuple[str, Optional[str], dict]: Contenu textuel, titre et métadonnées
+        """
+        metadata = {}
+        if not html_content.strip():
+            return '', None, metadata
+        
+        parser = lxml.html.HTMLParser(encoding='utf-8')
+        root = lxml.html.document_fromstring(html_content.encode('utf-8'), parser=parser)
+        
+        title = None
+        title_found = False
+        removed = []
+        for element in root.iter('title', 'meta', *self.REMOVED_TAGS):
+            tag = element.tag
+            if tag == 'title':
+                if not title_found:
+                    title_found = True
+                    title = element.text_content().strip()
+            elif tag == 'meta':
+                name = element.get('name') or element.get('property')
+                content = element.get('content')
+                if name and content:
+                    metadata[name] = content
+            else:
+                removed.append(element)
+        
+        # Suppression des scripts, styles et zones de navigation. L'élément vidé reste
+        # en place : sa queue de texte demeure un nœud distinct, séparé par une espace
+        # comme avec BeautifulSoup (drop_tree la collerait au texte précédent)
+        for element in removed:
+            if element.getparent() is not None:
+                element.clear(keep_tail=True)
+        
+        # Extraction du texte principal et nettoyage des espaces multiples
+        content = ' '.join(' '.join(root.itertext()).split())
+        
+        return content, title, metadata
+    
+    def _parse_bs4(self, html_content: str) -> Tuple[str, Optional[str], dict]:
+        """
+        Extrait texte, titre et métadonnées avec BeautifulSoup (html.parser).
+        
+        Args:
+            html_content: Code HTML du document
+            
+        Returns:
+            Tuple[str, Optional[str], dict]: Contenu textuel, titre et métadonnées
+        """
+        # Import différé : BeautifulSoup n'est chargé que pour le backend bs4
+        from bs4 import BeautifulSoup, CData
+        
+        metadata = {}
+        
+        soup = BeautifulSoup(html_content, 'html.parser')
+        
+        # Extraction du titre
+        title_tag = soup.find('title')
+        title = title_tag.get_text(strip=True) if title_tag else None
+        
+        # Extraction des métadonnées meta
+        meta_tags = soup.find_all('meta')
+        for meta in meta_tags:
+            name = meta.get('name') or meta.get('property')
+            content = meta.get('content')
+            if name and content:
+                metadata[name] = content
+        
+        # Suppression des scripts et styles
+        for script in soup(list(self.REMOVED_TAGS)):
+            script.decompose()
+        
+        # Les sections CDATA sont des commentaires en HTML (ignorées par lxml et les navigateurs)
+        for cdata in soup.find_all(string=lambda text: isinstance(text, CData)):
+            cdata.extract()
+        
+        # Extraction du texte principal
+        content = soup.get_text(separator=' ', strip=True)
+        
+        # Nettoyage des espaces multiples
+        content = ' '.join(content.split())
+        
+        return content, title, metadata
 
@@ -1,14 +1,46 @@
 """Extracteur pour les fichiers PDF."""
 
+import os
 import pdfplumber
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterator, List, Optional
 from src.extractors.base_extractor import BaseExtractor
 from src.models.document import Document
 
 
+def _extract_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    """
+    Extrait le texte d'une plage de pages (exécuté dans un processus fils).
+    
+    Args:
+        file_path: Chemin vers le fichier PDF, ouvert indépendamment par chaque processus
+        start: Index de la première page (inclus)
+        stop: Index de la dernière page (exclu)
+        
+    Returns:
+        List[str]: Texte de chaque page de la plage, dans l'ordre
+    """
+    with pdfplumber.open(file_path) as pdf:
+        return list(PdfExtractor._iter_page_texts(pdf, start, stop))
+
+
 class PdfExtractor(BaseExtractor):
     """Extracteur pour les fichiers PDF (.pdf)."""
     
+    def __init__(self, max_workers: Optional[int] = 1, parallel_min_pages: int = 200):
+        """
+        Initialise l'extracteur PDF.
+        
+        Args:
+            max_workers: Nombre de processus pour l'extraction des pages
+                (1: extraction séquentielle, None: nombre de cœurs)
+            parallel_min_pages: Nombre minimal de pages à partir duquel
+                l'extraction est répartie entre plusieurs processus
+        """
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.parallel_min_pages = parallel_min_pages
+    
     def extract(self, file_path: str) -> Document:
         """
         Extrait le contenu d'un fichier PDF.
@@ -23,34 +55,26 @@ class PdfExtractor(BaseExtractor):
             FileNotFoundError: Si le fichier n'existe pas
             Exception: Si le PDF ne peut pas être lu
         """
-        path = Path(file_path)
-        
-        if not path.exists():
-            raise FileNotFoundError(f"Le fichier {file_path} n'existe pas.")
+        path = self._check_path(file_path)
         
         content_parts = []
         metadata = {}
         
         try:
             with pdfplumber.open(file_path) as pdf:
-                # Extraction du texte de toutes les pages
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        content_parts.append(text)
+                page_count = len(pdf.pages)
+                
+                if self.max_workers > 1 and page_count >= self.parallel_min_pages:
+                    # Répartition des pages entre plusieurs processus
+                    page_texts = self._extract_parallel(file_path, page_count)
+                else:
+                    # Extraction du texte page par page, caches libérés au fur et à mesure
+                    page_texts = self._iter_page_texts(pdf)
+                
+                content_parts = [text for text in page_texts if text]
                 
                 # Extraction des métadonnées
-                if pdf.metadata:
-                    metadata = {
-                        'title': pdf.metadata.get('Title'),
-                        'author': pdf.metadata.get('Author'),
-                        'subject': pdf.metadata.get('Subject'),
-                        'creator': pdf.metadata.get('Creator'),
-                        'producer': pdf.metadata.get('Producer'),
-                        'creation_date': str(pdf.metadata.get('CreationDate', '')),
-                        'modification_date': str(pdf.metadata.get('ModDate', '')),
-                        'page_count': len(pdf.pages)
-                    }
+                metadata = self._extract_metadata(pdf)
         except Exception as e:
             raise Exception(f"Erreur lors de la lecture du PDF: {str(e)}")
         
@@ -64,4 +88,139 @@ class PdfExtractor(BaseExtractor):
             author=metadata.get('author'),
             metadata=metadata
         )
+    
+    def iter_pages(self, file_path: str) -> Iterator[str]:
+        """
+        Extrait le texte d'un PDF page par page, avec une mémoire bornée.
+        
+        Args:
+            file_path: Chemin vers le fichier PDF
+            
+        Yields:
+            str: Texte de chaque page ('' pour une page sans texte)
+            
+        Raises:
+            FileNotFoundError: Si le fichier n'existe pas
+            Exception: Si le PDF ne peut pas être lu
+        """
+        self._check_path(file_path)
+        
+        try:
+            with pdfplumber.open(file_path) as pdf:
+                yield from self._iter_page_texts(pdf)
+        except Exception as e:
+            raise Exception(f"Erreur lors de la lecture du PDF: {str(e)}")
+    
+    def iter_chunks(self, file_path: str, max_chars: int = 100_000) -> Iterator[str]:
+        """
+        Regroupe les pages d'un PDF en blocs de texte de taille bornée.
+        
+        Les blocs joints par '\\n\\n' reproduisent exactement le contenu de extract().
+        Une page plus longue que max_chars forme un bloc à elle seule.
+        
+        Args:
+            file_path: Chemin vers le fichier PDF
+            max_chars: Taille maximale visée pour un bloc (en caractères)
+            
+        Yields:
+            str: Blocs de pages consécutives
+        """
+        buffer = []
+        size = 0
+        
+        for text in self.iter_pages(file_path):
+            if not text:
+                continue
+            if buffer and size + len(text) + 2 > max_chars:
+                yield '\n\n'.join(buffer)
+                buffer = []
+                size = 0
+            buffer.append(text)
+            size += len(text) + 2
+        
+        if buffer:
+            yield '\n\n'.join(buffer)
+    
+    def _extract_parallel(self, file_path: str, page_count: int) -> List[str]:
+        """
+        Extrait les pages en répartissant des plages de pages entre plusieurs processus.
+        
+        Args:
+            file_path: Chemin vers le fichier PDF
+            page_count: Nombre total de pages
+            
+        Returns:
+            List[str]: Texte de chaque page, dans l'ordre du document
+        """
+        # Plusieurs plages par processus pour équilibrer la charge entre les pages lourdes
+        shard_count = min(page_count, self.max_workers * 4)
+        shard_size = -(-page_count // shard_count)
+        bounds = [(start, min(start + shard_size, page_count))
+                  for start in range(0, page_count, shard_size)]
+        
+        page_texts = []
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(_extract_page_range, file_path, start, stop)
+                       for start, stop in bounds]
+            # Réassemblage dans l'ordre des plages
+            for future in futures:
+                page_texts.extend(future.result())
+        
+        return page_texts
+    
+    @staticmethod
+    def _check_path(file_path: str) -> Path:
+        """Vérifie l'existence du fichier et retourne son chemin."""
+        path = Path(file_path)
+        
+        if not path.exists():
+            raise FileNotFoundError(f"Le fichier {file_path} n'existe pas.")
+        
+        return path
+    
+    @staticmethod
+    def _iter_page_texts(pdf, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """
+        Parcourt les pages d'un PDF ouvert en libérant le cache de chaque page.
+        
+        Args:
+            pdf: Objet pdfplumber.PDF ouvert
+            start: Index de la première page à extraire
+            stop: Index de fin (exclu, None pour aller jusqu'à la dernière page)
+            
+        Yields:
+            str: Texte de chaque page ('' pour une page sans texte)
+        """
+        for page in pdf.pages[start:stop]:
+            try:
+                text = page.extract_text()
+            finally:
+                # Libère les objets de mise en page (caractères, lignes, ...) de la page
+                page.close()
+            yield text or ''
+    
+    @staticmethod
+    def _extract_metadata(pdf) -> dict:
+        """
+        Extrait les métadonnées d'un PDF ouvert.
+        
+        Args:
+            pdf: Objet pdfplumber.PDF ouvert
+            
+        Returns:
+            dict: Métadonnées du document (vide si le PDF n'en contient pas)
+        """
+        if not pdf.metadata:
+            return {}
+        
+        return {
+            'title': pdf.metadata.get('Title'),
+            'author': pdf.metadata.get('Author'),
+            'subject': pdf.metadata.get('Subject'),
+            'creator': pdf.metadata.get('Creator'),
+            'producer': pdf.metadata.get('Producer'),
+            'creation_date': str(pdf.metadata.get('CreationDate', '')),
+            'modification_date': str(pdf.metadata.get('ModDate', '')),
+            'page_count': len(pdf.pages)
+        }
 
@@ -1,7 +1,10 @@
 """Extracteur pour les fichiers texte."""
 
-import chardet
+import codecs
+import mmap
+from chardet import UniversalDetector
 from pathlib import Path
+from typing import Tuple
 from src.extractors.base_extractor import BaseExtractor
 from src.models.document import Document
 
@@ -9,6 +12,27 @@ from src.models.document import Document
 class TxtExtractor(BaseExtractor):
     """Extracteur pour les fichiers texte (.txt)."""
     
+    # Marques d'ordre des octets, des plus longues aux plus courtes
+    BOMS = [
+        (codecs.BOM_UTF32_LE, 'utf-32'),
+        (codecs.BOM_UTF32_BE, 'utf-32'),
+        (codecs.BOM_UTF8, 'utf-8-sig'),
+        (codecs.BOM_UTF16_LE, 'utf-16'),
+        (codecs.BOM_UTF16_BE, 'utf-16'),
+    ]
+    
+    def __init__(self, sample_size: int = 1024 * 1024, mmap_threshold: int = 64 * 1024 * 1024):
+        """
+        Initialise l'extracteur de texte.
+        
+        Args:
+            sample_size: Nombre maximal d'octets examinés pour détecter l'encodage
+            mmap_threshold: Taille à partir de laquelle le fichier est projeté en
+                mémoire (mmap) au lieu d'être copié dans un bytes
+        """
+        self.sample_size = sample_size
+        self.mmap_threshold = mmap_threshold
+    
     def extract(self, file_path: str) -> Document:
         """
         Extrait le contenu d'un fichier texte.
@@ -28,20 +52,14 @@ class TxtExtractor(BaseExtractor):
         if not path.exists():
             raise FileNotFoundError(f"Le fichier {file_path} n'existe pas.")
         
-        # Détection de l'encodage
+        # Lecture unique du fichier : les octets lus servent à la détection et au décodage
         with open(file_path, 'rb') as f:
-            raw_data = f.read()
-            encoding_result = chardet.detect(raw_data)
-            encoding = encoding_result.get('encoding', 'utf-8')
-        
-        # Lecture du contenu avec l'encodage détecté
-        try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-        except (UnicodeDecodeError, LookupError):
-            # Fallback sur UTF-8 si la détection échoue
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
+            size = path.stat().st_size
+            if size >= self.mmap_threshold:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    content, encoding, confidence = self._decode(data)
+            else:
+                content, encoding, confidence = self._decode(f.read())
         
         return Document(
             content=content,
@@ -49,7 +67,61 @@ class TxtExtractor(BaseExtractor):
             file_type=self.get_file_type(file_path),
             metadata={
                 'encoding': encoding,
-                'encoding_confidence': encoding_result.get('confidence', 0.0)
+                'encoding_confidence': confidence
             }
         )
+    
+    def _decode(self, data) -> Tuple[str, str, float]:
+        """
+        Détecte l'encodage des octets puis les décode.
+        
+        Args:
+            data: Contenu brut du fichier (bytes ou mmap)
+            
+        Returns:
+            Tuple[str, str, float]: Contenu décodé, encodage et confiance de la détection
+        """
+        # Voie rapide 1 : marque d'ordre des octets
+        head = bytes(data[:4])
+        for bom, encoding in self.BOMS:
+            if head.startswith(bom):
+                return str(data, encoding, 'replace'), encoding, 1.0
+        
+        # Voie rapide 2 : UTF-8 (ou ASCII) valide, vérifié par le décodage lui-même
+        try:
+            content = str(data, 'utf-8')
+            return content, 'ascii' if content.isascii() else 'utf-8', 1.0
+        except UnicodeDecodeError:
+            pass
+        
+        # Détection incrémentale sur un préfixe borné du fichier
+        encoding, confidence = self._detect_sample(data)
+        
+        try:
+            return str(data, encoding), encoding, confidence
+        except (UnicodeDecodeError, LookupError, TypeError):
+            # Fallback sur UTF-8 si la détection échoue
+            return str(data, 'utf-8', 'replace'), encoding, confidence
+    
+    def _detect_sample(self, data) -> Tuple[str, float]:
+        """
+        Détecte l'encodage en alimentant chardet par blocs jusqu'à obtenir une réponse.
+        
+        Args:
+            data: Contenu brut du fichier (bytes ou mmap)
+            
+        Returns:
+            Tuple[str, float]: Encodage détecté et confiance (utf-8 si indéterminé)
+        """
+        detector = UniversalDetector()
+        block_size = 64 * 1024
+        limit = min(len(data), self.sample_size)
+        
+        for start in range(0, limit, block_size):
+            detector.feed(bytes(data[start:min(start + block_size, limit)]))
+            if detector.done:
+                break
+        detector.close()
+        
+        return detector.result.get('encoding') or 'utf-8', detector.result.get('confidence') or 0.0
 
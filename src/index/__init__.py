@@ -0,0 +1,6 @@
+"""Index inversé des résultats d'analyse."""
+
+from .analysis_index import AnalysisIndex
+
+__all__ = ['AnalysisIndex']
+
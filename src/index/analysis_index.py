@@ -0,0 +1,258 @@
+"""Index inversé persistant des entités, relations et catégories des documents analysés."""
+
+import re
+import sqlite3
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+from src.models.document import Document
+from src.models.analysis import Analysis
+
+_SPACES = re.compile(r'\s+')
+
+
+def normalize(text: str) -> str:
+    """Normalise un terme indexé (casse et espaces) pour la recherche."""
+    return _SPACES.sub(' ', text).strip().casefold()
+
+
+class AnalysisIndex:
+    """
+    Index SQLite associant entités, relations et catégories aux documents qui les contiennent.
+    
+    Chaque terme (entité normalisée, paire d'entités d'une relation, catégorie)
+    renvoie à la liste des documents où il apparaît, via une table indexée par
+    terme : une recherche ne relit aucun fichier exporté. L'ajout d'un document
+    déjà indexé remplace ses entrées (mise à jour incrémentale).
+    """
+    
+    def __init__(self, path: str):
+        """
+        Ouvre (ou crée) l'index.
+        
+        Args:
+            path: Fichier SQLite de l'index
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.executescript(
+            'CREATE TABLE IF NOT EXISTS documents ('
+            'doc_id INTEGER PRIMARY KEY, '
+            'file_path TEXT NOT NULL UNIQUE, '
+            'title TEXT, '
+            'file_type TEXT, '
+            'language TEXT, '
+            'indexed_at REAL NOT NULL);'
+            'CREATE TABLE IF NOT EXISTS entities ('
+            'term TEXT NOT NULL, '
+            'label TEXT NOT NULL, '
+            'doc_id INTEGER NOT NULL, '
+            'text TEXT NOT NULL, '
+            'count INTEGER NOT NULL);'
+            'CREATE INDEX IF NOT EXISTS idx_entity_term ON entities(term, label);'
+            'CREATE INDEX IF NOT EXISTS idx_entity_label ON entities(label);'
+            'CREATE INDEX IF NOT EXISTS idx_entity_doc ON entities(doc_id);'
+            'CREATE TABLE IF NOT EXISTS relations ('
+            'term1 TEXT NOT NULL, '
+            'term2 TEXT NOT NULL, '
+            'relation_type TEXT NOT NULL, '
+            'doc_id INTEGER NOT NULL, '
+            'entity1 TEXT NOT NULL, '
+            'entity2 TEXT NOT NULL, '
+            'confidence REAL);'
+            'CREATE INDEX IF NOT EXISTS idx_relation_terms ON relations(term1, term2);'
+            'CREATE INDEX IF NOT EXISTS idx_relation_term2 ON relations(term2);'
+            'CREATE INDEX IF NOT EXISTS idx_relation_doc ON relations(doc_id);'
+            'CREATE TABLE IF NOT EXISTS categories ('
+            'term TEXT NOT NULL, '
+            'doc_id INTEGER NOT NULL, '
+            'category TEXT NOT NULL, '
+            'rank INTEGER NOT NULL);'
+            'CREATE INDEX IF NOT EXISTS idx_category_term ON categories(term);'
+            'CREATE INDEX IF NOT EXISTS idx_category_doc ON categories(doc_id);'
+        )
+        self._conn.commit()
+    
+    def add(self, document: Document, analysis: Analysis):
+        """
+        Indexe (ou réindexe) les entités, relations et catégories d'un document.
+        
+        Args:
+            document: Document analysé
+            analysis: Analyse du document
+        """
+        with self._conn:
+            self._delete(document.file_path)
+            cursor = self._conn.execute(
+                'INSERT INTO documents (file_path, title, file_type, language, indexed_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (document.file_path, document.title, document.file_type, analysis.language, time.time())
+            )
+            doc_id = cursor.lastrowid
+            
+            # Une entrée par entité distincte, avec son nombre d'occurrences
+            columns = analysis.entities.columns()
+            counts = Counter(zip(columns['text'], columns['label']))
+            self._conn.executemany(
+                'INSERT INTO entities (term, label, doc_id, text, count) VALUES (?, ?, ?, ?, ?)',
+                [(normalize(text), label, doc_id, text, count) for (text, label), count in counts.items()]
+            )
+            
+            # Les deux termes d'une relation sont triés : la paire se retrouve dans les deux sens
+            self._conn.executemany(
+                'INSERT INTO relations (term1, term2, relation_type, doc_id, entity1, entity2, confidence) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                [(*sorted([normalize(r.entity1), normalize(r.entity2)]), r.relation_type, doc_id,
+                  r.entity1, r.entity2, r.confidence) for r in analysis.relations]
+            )
+            
+            self._conn.executemany(
+                'INSERT INTO categories (term, doc_id, category, rank) VALUES (?, ?, ?, ?)',
+                [(normalize(category), doc_id, category, rank)
+                 for rank, category in enumerate(analysis.categories)]
+            )
+    
+    def remove(self, file_path: str):
+        """
+        Retire un document de l'index.
+        
+        Args:
+            file_path: Chemin du document
+        """
+        with self._conn:
+            self._delete(file_path)
+    
+    def find_entity(self, text: Optional[str] = None, label: Optional[str] = None,
+                    prefix: bool = False, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Recherche les documents mentionnant une entité.
+        
+        Args:
+            text: Texte de l'entité (casse et espaces ignorés ; None: toutes)
+            label: Label de l'entité (ex: 'PER', 'LOC' ; None: tous)
+            prefix: Rechercher les entités commençant par text
+            limit: Nombre maximal de résultats
+            
+        Returns:
+            List[Dict]: Documents (file_path, title) avec l'entité trouvée (text, label)
+            et son nombre d'occurrences, les plus fréquentes d'abord
+            
+        Raises:
+            ValueError: Si ni text ni label ne sont fournis
+        """
+        if text is None and label is None:
+            raise ValueError("La recherche d'entité nécessite un texte ou un label.")
+        
+        conditions, params = [], []
+        if text is not None:
+            if prefix:
+                # Une espace finale est conservée : 'marie ' ne trouve pas 'mariette'
+                term = _SPACES.sub(' ', text).lstrip().casefold()
+                # Intervalle de termes : la recherche par préfixe utilise l'index
+                conditions.append('e.term >= ? AND e.term < ?')
+                params.extend([term, term + '\U0010ffff'])
+            else:
+                conditions.append('e.term = ?')
+                params.append(normalize(text))
+        if label is not None:
+            conditions.append('e.label = ?')
+            params.append(label)
+        
+        return self._query(
+            'SELECT d.file_path, d.title, e.text, e.label, e.count FROM entities e '
+            'JOIN documents d ON d.doc_id = e.doc_id '
+            f'WHERE {" AND ".join(conditions)} ORDER BY e.count DESC, d.file_path',
+            params, limit
+        )
+    
+    def find_category(self, category: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Recherche les documents classés dans une catégorie.
+        
+        Args:
+            category: Catégorie (casse ignorée)
+            limit: Nombre maximal de résultats
+            
+        Returns:
+            List[Dict]: Documents (file_path, title) avec la catégorie et son rang
+            parmi les catégories du document
+        """
+        return self._query(
+            'SELECT d.file_path, d.title, c.category, c.rank FROM categories c '
+            'JOIN documents d ON d.doc_id = c.doc_id '
+            'WHERE c.term = ? ORDER BY c.rank, d.file_path',
+            [normalize(category)], limit
+        )
+    
+    def find_relation(self, entity1: str, entity2: Optional[str] = None,
+                      relation_type: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Recherche les documents contenant une relation entre deux entités (dans les deux sens).
+        
+        Args:
+            entity1: Première entité
+            entity2: Seconde entité (None: toute relation impliquant entity1)
+            relation_type: Type de relation (None: tous)
+            limit: Nombre maximal de résultats
+            
+        Returns:
+            List[Dict]: Documents (file_path, title) avec la relation trouvée
+            (entity1, entity2, relation_type, confidence)
+        """
+        term1 = normalize(entity1)
+        if entity2 is not None:
+            terms = sorted([term1, normalize(entity2)])
+            condition = 'r.term1 = ? AND r.term2 = ?'
+            params = terms
+        else:
+            condition = '(r.term1 = ? OR r.term2 = ?)'
+            params = [term1, term1]
+        if relation_type is not None:
+            condition += ' AND r.relation_type = ?'
+            params.append(relation_type)
+        
+        return self._query(
+            'SELECT d.file_path, d.title, r.entity1, r.entity2, r.relation_type, r.confidence '
+            'FROM relations r JOIN documents d ON d.doc_id = r.doc_id '
+            f'WHERE {condition} ORDER BY d.file_path',
+            params, limit
+        )
+    
+    def stats(self) -> dict:
+        """
+        Retourne la taille de l'index.
+        
+        Returns:
+            dict: Nombre de documents, d'entités distinctes, de relations et de catégories indexées
+        """
+        return {
+            'documents': self._conn.execute('SELECT COUNT(*) FROM documents').fetchone()[0],
+            'entities': self._conn.execute('SELECT COUNT(DISTINCT term) FROM entities').fetchone()[0],
+            'relations': self._conn.execute('SELECT COUNT(*) FROM relations').fetchone()[0],
+            'categories': self._conn.execute('SELECT COUNT(DISTINCT term) FROM categories').fetchone()[0]
+        }
+    
+    def close(self):
+        """Ferme la connexion à la base de l'index."""
+        self._conn.close()
+    
+    def _delete(self, file_path: str):
+        """Supprime les entrées d'un document (dans la transaction en cours)."""
+        row = self._conn.execute('SELECT doc_id FROM documents WHERE file_path = ?', (file_path,)).fetchone()
+        if row is None:
+            return
+        for table in ('entities', 'relations', 'categories', 'documents'):
+            self._conn.execute(f'DELETE FROM {table} WHERE doc_id = ?', row)
+    
+    def _query(self, sql: str, params: List, limit: Optional[int]) -> List[Dict]:
+        """Exécute une recherche et retourne les lignes sous forme de dictionnaires."""
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params = list(params) + [limit]
+        cursor = self._conn.execute(sql, params)
+        names = [column[0] for column in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
+
@@ -0,0 +1,6 @@
+"""Instrumentation des étapes d'extraction et d'analyse."""
+
+from .stage_timer import Instrumentation, StageTiming
+
+__all__ = ['Instrumentation', 'StageTiming']
+
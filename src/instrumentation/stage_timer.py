@@ -0,0 +1,162 @@
+"""Mesure du temps et de la mémoire de chaque étape du traitement d'un document."""
+
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows : pas de mesure du pic de mémoire
+    resource = None
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    """Retourne le pic de RSS du processus en octets (None si indisponible)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss est en octets sous macOS et en kilo-octets sous Linux
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+@dataclass
+class StageTiming:
+    """Mesure d'une étape (extraction, analyse spaCy, analyseur) sur un document."""
+    
+    stage: str
+    name: str
+    document: str
+    wall_s: float
+    cpu_s: float
+    peak_rss_delta_bytes: Optional[int] = None
+    document_chars: Optional[int] = None
+    
+    @property
+    def key(self) -> str:
+        """Identifiant de l'étape, ex: 'analyze.EntityAnalyzer'."""
+        return f"{self.stage}.{self.name}"
+    
+    def to_dict(self) -> Dict:
+        """Convertit la mesure en dictionnaire."""
+        return asdict(self)
+
+
+class Instrumentation:
+    """
+    Collecte les mesures de chaque étape et les transmet aux callbacks enregistrés.
+    
+    Les mesures sont regroupées par document (chemin absolu du fichier), ce qui
+    permet de les rattacher à la bonne analyse même lorsque l'extraction des
+    documents suivants a déjà commencé (mode lot).
+    
+    Le surcoût mémoire d'une étape est l'augmentation du pic de RSS du processus
+    qu'elle provoque : une étape qui reste sous le pic déjà atteint vaut 0.
+    """
+    
+    def __init__(self, hooks: Optional[List[Callable[[StageTiming], None]]] = None,
+                 attach_to_analysis: bool = False):
+        """
+        Initialise l'instrumentation.
+        
+        Args:
+            hooks: Fonctions appelées avec chaque StageTiming dès sa mesure
+            attach_to_analysis: Ajouter un bloc 'timings' aux analyses produites
+        """
+        self.hooks: List[Callable[[StageTiming], None]] = list(hooks or [])
+        self.attach_to_analysis = attach_to_analysis
+        self._records: Dict[str, List[StageTiming]] = {}
+    
+    def add_hook(self, hook: Callable[[StageTiming], None]):
+        """
+        Enregistre une fonction appelée avec chaque nouvelle mesure.
+        
+        Args:
+            hook: Fonction prenant un StageTiming
+        """
+        self.hooks.append(hook)
+    
+    @contextmanager
+    def measure(self, stage: str, name: str, document: str, document_chars: Optional[int] = None):
+        """
+        Mesure le bloc de code exécuté dans le contexte.
+        
+        Le contexte fournit un dictionnaire dans lequel 'document_chars' peut être
+        renseigné après coup (utile pour l'extraction, dont la taille n'est connue
+        qu'à la fin).
+        
+        Args:
+            stage: Type d'étape ('extract', 'spacy', 'analyze', ...)
+            name: Nom de l'étape (classe de l'extracteur ou de l'analyseur)
+            document: Identifiant du document (chemin absolu du fichier)
+            document_chars: Taille du document en caractères, si connue
+            
+        Yields:
+            dict: Informations complémentaires à renseigner par l'appelant
+        """
+        info = {'document_chars': document_chars}
+        peak_before = _peak_rss_bytes()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        try:
+            yield info
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            peak_after = _peak_rss_bytes()
+            
+            record = StageTiming(
+                stage=stage,
+                name=name,
+                document=document,
+                wall_s=wall,
+                cpu_s=cpu,
+                peak_rss_delta_bytes=(peak_after - peak_before
+                                      if peak_before is not None and peak_after is not None else None),
+                document_chars=info.get('document_chars')
+            )
+            self._records.setdefault(document, []).append(record)
+            for hook in self.hooks:
+                hook(record)
+    
+    def discard(self, document: str):
+        """
+        Oublie les mesures d'un document qui ne sera pas analysé (extraction échouée).
+        
+        Args:
+            document: Identifiant du document
+        """
+        self._records.pop(document, None)
+    
+    def pop_timings(self, document: str) -> Dict[str, Dict]:
+        """
+        Retire et agrège les mesures d'un document, par étape.
+        
+        Les mesures répétées d'une même étape (documents analysés par blocs) sont
+        cumulées pour les temps et réduites au maximum pour la mémoire.
+        
+        Args:
+            document: Identifiant du document
+            
+        Returns:
+            Dict[str, Dict]: Mesures agrégées indexées par 'etape.nom', dans l'ordre d'exécution
+        """
+        timings: Dict[str, Dict] = {}
+        for record in self._records.pop(document, []):
+            entry = timings.get(record.key)
+            if entry is None:
+                timings[record.key] = {
+                    'wall_s': record.wall_s,
+                    'cpu_s': record.cpu_s,
+                    'peak_rss_delta_bytes': record.peak_rss_delta_bytes,
+                    'document_chars': record.document_chars
+                }
+                continue
+            entry['wall_s'] += record.wall_s
+            entry['cpu_s'] += record.cpu_s
+            if record.peak_rss_delta_bytes is not None:
+                entry['peak_rss_delta_bytes'] = max(entry['peak_rss_delta_bytes'] or 0,
+                                                    record.peak_rss_delta_bytes)
+        return timings
+
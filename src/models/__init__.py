@@ -1,7 +1,7 @@
 """Modèles de données pour le parseur de documents."""
 
 from .document import Document
-from .analysis import Analysis
+from .analysis import Analysis, Entity, EntityTable, Relation
 
-__all__ = ['Document', 'Analysis']
+__all__ = ['Document', 'Analysis', 'Entity', 'EntityTable', 'Relation']
 
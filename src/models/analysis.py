@@ -1,10 +1,12 @@
 """Modèle de données pour représenter les résultats d'analyse NLP."""
 
+import math
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """Représente une entité nommée extraite du texte."""
     
@@ -15,7 +17,144 @@ class Entity:
     confidence: Optional[float] = None
 
 
-@dataclass
+class EntityTable:
+    """
+    Stockage compact des entités d'un document, colonne par colonne.
+    
+    Les labels sont internés (un indice par entité), les positions et les scores
+    sont stockés dans des tableaux typés, et le texte d'une entité n'est conservé
+    que s'il ne peut pas être relu dans le contenu du document. La table s'utilise
+    comme une liste d'Entity (itération, indexation, len, append).
+    """
+    
+    __slots__ = ('content', '_texts', '_label_ids', '_labels', '_label_index',
+                 '_starts', '_ends', '_confidences')
+    
+    def __init__(self, entities: Iterable[Entity] = (), content: Optional[str] = None):
+        """
+        Initialise la table.
+        
+        Args:
+            entities: Entités initiales
+            content: Contenu du document, dans lequel les textes d'entités sont relus
+        """
+        self.content = content
+        self._texts: List[Optional[str]] = []  # None : texte lu dans content[start:end]
+        self._label_ids = array('i')
+        self._labels: List[str] = []
+        self._label_index: Dict[str, int] = {}
+        # Entiers 64 bits : les positions dépassent 2**31 dans les très gros fichiers (mmap)
+        self._starts = array('q')
+        self._ends = array('q')
+        self._confidences = array('d')  # NaN : pas de score
+        self.extend(entities)
+    
+    def add(self, text: str, label: str, start: int, end: int, confidence: Optional[float] = None):
+        """Ajoute une entité à partir de ses champs, sans créer d'objet Entity."""
+        content = self.content
+        self._texts.append(
+            None if content is not None and content[start:end] == text else text
+        )
+        label_id = self._label_index.get(label)
+        if label_id is None:
+            label_id = self._label_index[label] = len(self._labels)
+            self._labels.append(label)
+        self._label_ids.append(label_id)
+        self._starts.append(start)
+        self._ends.append(end)
+        self._confidences.append(math.nan if confidence is None else confidence)
+    
+    def append(self, entity: Entity):
+        """Ajoute une entité."""
+        self.add(entity.text, entity.label, entity.start, entity.end, entity.confidence)
+    
+    def extend(self, entities: Iterable[Entity]):
+        """Ajoute plusieurs entités."""
+        for entity in entities:
+            self.add(entity.text, entity.label, entity.start, entity.end, entity.confidence)
+    
+    def text(self, index: int) -> str:
+        """Retourne le texte de l'entité numéro index."""
+        text = self._texts[index]
+        if text is None:
+            return self.content[self._starts[index]:self._ends[index]]
+        return text
+    
+    def iter_texts(self) -> Iterator[str]:
+        """Itère sur les textes des entités sans créer d'objets Entity."""
+        for index in range(len(self._texts)):
+            yield self.text(index)
+    
+    @property
+    def labels(self) -> List[str]:
+        """Labels distincts, dans l'ordre de première apparition."""
+        return list(self._labels)
+    
+    def columns(self) -> Dict[str, list]:
+        """
+        Retourne les entités sous forme de colonnes.
+        
+        Returns:
+            Dict[str, list]: Listes 'text', 'label', 'start', 'end' et 'confidence'
+        """
+        labels = self._labels
+        return {
+            'text': list(self.iter_texts()),
+            'label': [labels[label_id] for label_id in self._label_ids],
+            'start': self._starts.tolist(),
+            'end': self._ends.tolist(),
+            'confidence': [None if math.isnan(c) else c for c in self._confidences]
+        }
+    
+    def to_dicts(self) -> List[Dict]:
+        """Sérialise les entités pour l'export, directement depuis les colonnes."""
+        labels = self._labels
+        return [
+            {
+                'text': self.text(index),
+                'label': labels[label_id],
+                'start': start,
+                'end': end,
+                'confidence': None if math.isnan(confidence) else confidence
+            }
+            for index, (label_id, start, end, confidence) in enumerate(
+                zip(self._label_ids, self._starts, self._ends, self._confidences)
+            )
+        ]
+    
+    def __len__(self) -> int:
+        return len(self._texts)
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[Entity, List[Entity]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index d'entité hors limites")
+        confidence = self._confidences[index]
+        return Entity(
+            text=self.text(index),
+            label=self._labels[self._label_ids[index]],
+            start=self._starts[index],
+            end=self._ends[index],
+            confidence=None if math.isnan(confidence) else confidence
+        )
+    
+    def __iter__(self) -> Iterator[Entity]:
+        for index in range(len(self)):
+            yield self[index]
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (EntityTable, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"EntityTable({len(self)} entités, labels={self._labels})"
+
+
+@dataclass(slots=True)
 class Relation:
     """Représente une relation entre deux entités."""
     
@@ -29,27 +168,25 @@ class Relation:
 class Analysis:
     """Stocke tous les résultats d'analyse NLP d'un document."""
     
-    entities: List[Entity] = field(default_factory=list)
+    entities: EntityTable = field(default_factory=EntityTable)
     sentiment: Optional[Dict[str, float]] = None
     categories: List[str] = field(default_factory=list)
     relations: List[Relation] = field(default_factory=list)
     language: Optional[str] = None
     word_count: Optional[int] = None
     sentence_count: Optional[int] = None
+    duplicate_of: Optional[Dict] = None
+    timings: Optional[Dict[str, Dict]] = None
+    
+    def __post_init__(self):
+        """Convertit une liste d'entités en EntityTable."""
+        if not isinstance(self.entities, EntityTable):
+            self.entities = EntityTable(self.entities)
     
     def to_dict(self) -> Dict:
         """Convertit l'analyse en dictionnaire pour l'export."""
-        return {
-            'entities': [
-                {
-                    'text': e.text,
-                    'label': e.label,
-                    'start': e.start,
-                    'end': e.end,
-                    'confidence': e.confidence
-                }
-                for e in self.entities
-            ],
+        data = {
+            'entities': self.entities.to_dicts(),
             'sentiment': self.sentiment,
             'categories': self.categories,
             'relations': [
@@ -65,4 +202,29 @@ class Analysis:
             'word_count': self.word_count,
             'sentence_count': self.sentence_count
         }
+        # Document canonique dont l'analyse a été reprise (quasi-doublon)
+        if self.duplicate_of is not None:
+            data['duplicate_of'] = self.duplicate_of
+        # Mesures de performance, présentes uniquement si l'instrumentation les a ajoutées
+        if self.timings is not None:
+            data['timings'] = self.timings
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Analysis':
+        """Reconstruit une analyse à partir du dictionnaire produit par to_dict."""
+        entities = EntityTable()
+        for e in data.get('entities', []):
+            entities.add(**e)
+        return cls(
+            entities=entities,
+            sentiment=data.get('sentiment'),
+            categories=list(data.get('categories', [])),
+            relations=[Relation(**r) for r in data.get('relations', [])],
+            language=data.get('language'),
+            word_count=data.get('word_count'),
+            sentence_count=data.get('sentence_count'),
+            duplicate_of=data.get('duplicate_of'),
+            timings=data.get('timings')
+        )
 
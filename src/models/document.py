@@ -23,4 +23,29 @@ class Document:
             self.metadata = {}
         if self.title is None:
             self.title = self.file_path.split('/')[-1].split('\\')[-1]
+    
+    def to_dict(self) -> dict:
+        """Convertit le document (contenu inclus) en dictionnaire sérialisable."""
+        return {
+            'content': self.content,
+            'file_path': self.file_path,
+            'file_type': self.file_type,
+            'title': self.title,
+            'author': self.author,
+            'date': self.date.isoformat() if self.date else None,
+            'metadata': self.metadata
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Document':
+        """Reconstruit un document à partir du dictionnaire produit par to_dict."""
+        return cls(
+            content=data['content'],
+            file_path=data['file_path'],
+            file_type=data['file_type'],
+            title=data.get('title'),
+            author=data.get('author'),
+            date=datetime.fromisoformat(data['date']) if data.get('date') else None,
+            metadata=data.get('metadata')
+        )
 
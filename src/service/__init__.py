@@ -0,0 +1,6 @@
+"""Service d'ingestion de documents longue durée."""
+
+from .ingestion_service import IngestionService
+
+__all__ = ['IngestionService']
+
@@ -0,0 +1,471 @@
+"""Service d'ingestion longue durée : API HTTP locale, extraction et analyse en parallèle.
+
+L'extraction (E/S, bibliothèques C) s'exécute dans un pool de threads, l'analyse
+NLP dans un pool de processus où chaque processus garde son NLPPipeline (et son
+modèle spaCy) chargé d'une requête à l'autre. Les demandes passent par une file
+bornée : lorsqu'elle est pleine, le service répond 503 au lieu d'accumuler.
+Le pipeline accepte les options du mode lot (cache de résultats, mode
+incrémental, détection de la langue, index des quasi-doublons).
+
+API (JSON) :
+    POST /jobs         {"file_path": "...", "wait": false}  -> 202 (ou 200 si wait)
+    GET  /jobs/<id>    état et résultat d'une demande
+    GET  /health       état du service
+    GET  /metrics      compteurs au format texte Prometheus
+"""
+
+import asyncio
+import json
+import multiprocessing
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from src.extractors.extractor_factory import ExtractorFactory
+from src.analyzers.nlp_pipeline import NLPPipeline
+from src.analyzers.language_detector import LanguageDetector
+from src.exporters.json_exporter import JsonExporter
+from src.cache.result_cache import ResultCache
+from src.dedup.minhash_index import MinHashIndex
+from src.models.document import Document
+from src.models.analysis import Analysis
+
+# Pipeline et cache propres à chaque processus d'analyse, créés par _init_worker
+_worker_pipeline: Optional[NLPPipeline] = None
+_worker_cache: Optional[ResultCache] = None
+
+
+def _init_worker(model_name: str, options: Dict):
+    """
+    Initialise un processus d'analyse : création du pipeline et chargement du modèle.
+    
+    Le pipeline reçoit les mêmes options qu'en mode lot (voir create_pipeline dans
+    main.py) ; le cache et l'index des quasi-doublons sont des fichiers SQLite
+    partagés par tous les processus.
+    
+    Args:
+        model_name: Nom du modèle spaCy
+        options: Options du pipeline (voir IngestionService.pipeline_options)
+    """
+    global _worker_pipeline, _worker_cache
+    _worker_cache = None
+    if options['cache_dir']:
+        _worker_cache = ResultCache(options['cache_dir'], max_size_bytes=options['cache_max_size_bytes'])
+    duplicate_index = None
+    if options['dedup_index']:
+        duplicate_index = MinHashIndex(options['dedup_index'], threshold=options['dedup_threshold'])
+    _worker_pipeline = NLPPipeline(
+        model_name=model_name,
+        segment_store=_worker_cache if options['incremental'] else None,
+        language_detector=LanguageDetector() if options['detect_language'] else None,
+        language_models=options['language_models'],
+        duplicate_index=duplicate_index
+    )
+    _worker_pipeline.nlp
+
+
+def _lookup_in_worker(file_path: str, extractor_options: dict) -> Tuple[str, Optional[Tuple[Document, dict]]]:
+    """
+    Cherche un fichier dans le cache de résultats, avant toute extraction.
+    
+    Args:
+        file_path: Chemin du fichier demandé
+        extractor_options: Options de l'extracteur du fichier (elles changent le texte extrait)
+        
+    Returns:
+        Tuple[str, Optional[Tuple[Document, dict]]]: Clé de cache du fichier et, s'il
+        est en cache, son Document et son analyse sérialisée
+    """
+    # Même configuration que cache_config (main.py) : le mode lot et le service partagent le cache
+    config = dict(_worker_pipeline.get_config(), extractor=extractor_options)
+    key = ResultCache.make_key(file_path, config)
+    cached = _worker_cache.get(key, file_path)
+    if cached is None:
+        return key, None
+    document, analysis = cached
+    return key, (document, analysis.to_dict())
+
+
+def _analyze_in_worker(document: Document, cache_key: Optional[str] = None) -> dict:
+    """Analyse un document dans un processus du pool (le résultat est renvoyé sérialisé)."""
+    analysis = _worker_pipeline.analyze(document)
+    if cache_key is not None:
+        _worker_cache.put(cache_key, document, analysis)
+    return analysis.to_dict()
+
+
+def _warm_up() -> bool:
+    """Tâche vide forçant le démarrage d'un processus d'analyse."""
+    return _worker_pipeline is not None
+
+
+class IngestionService:
+    """Service d'ingestion de documents exposé par une API HTTP locale."""
+    
+    _REASONS = {200: 'OK', 202: 'Accepted', 400: 'Bad Request', 404: 'Not Found',
+                405: 'Method Not Allowed', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+    
+    def __init__(self, model_name: str = 'fr_core_news_sm', nlp_workers: int = 1,
+                 extract_workers: int = 4, queue_size: int = 100, output_dir: Optional[str] = None,
+                 max_jobs: int = 10_000, mp_context: str = 'spawn', cache_dir: Optional[str] = None,
+                 cache_max_size_bytes: int = 1024 * 1024 * 1024, incremental: bool = False,
+                 detect_language: bool = False, language_models: Optional[Dict[str, str]] = None,
+                 dedup_index: Optional[str] = None, dedup_threshold: float = 0.8):
+        """
+        Initialise le service (les pools sont créés au démarrage).
+        
+        Les options du pipeline sont celles du mode lot ; chaque processus
+        d'analyse ouvre le cache et l'index des quasi-doublons.
+        
+        Args:
+            model_name: Nom du modèle spaCy chargé par chaque processus d'analyse
+            nlp_workers: Nombre de processus d'analyse NLP
+            extract_workers: Nombre de threads d'extraction (et de demandes traitées en parallèle)
+            queue_size: Nombre maximal de demandes en attente avant de refuser (503)
+            output_dir: Répertoire où exporter un JSON par document (optionnel)
+            max_jobs: Nombre de demandes terminées conservées pour GET /jobs/<id>
+            mp_context: Méthode de démarrage des processus ('spawn', 'forkserver' ou 'fork')
+            cache_dir: Répertoire du cache de résultats (optionnel) ; un fichier en
+                cache n'est ni extrait ni analysé
+            cache_max_size_bytes: Taille maximale du cache
+            incremental: Analyser les EPUB chapitre par chapitre (nécessite cache_dir)
+            detect_language: Analyser chaque document avec le modèle de sa langue
+            language_models: Langue -> modèle spaCy (voir NLPPipeline)
+            dedup_index: Fichier de l'index des quasi-doublons (optionnel)
+            dedup_threshold: Similarité à partir de laquelle un document est un doublon
+        """
+        self.model_name = model_name
+        self.nlp_workers = max(1, nlp_workers)
+        self.extract_workers = max(1, extract_workers)
+        self.queue_size = queue_size
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.max_jobs = max_jobs
+        self.mp_context = mp_context
+        self.pipeline_options = {
+            'cache_dir': cache_dir,
+            'cache_max_size_bytes': cache_max_size_bytes,
+            'incremental': incremental,
+            'detect_language': detect_language,
+            'language_models': language_models,
+            'dedup_index': dedup_index,
+            'dedup_threshold': dedup_threshold
+        }
+        
+        self.jobs: 'OrderedDict[str, Dict]' = OrderedDict()
+        self.metrics = {
+            'jobs_submitted': 0,
+            'jobs_rejected': 0,
+            'jobs_completed': 0,
+            'jobs_failed': 0,
+            'cache_hits': 0,
+            'extract_seconds': 0.0,
+            'analyze_seconds': 0.0,
+            'export_seconds': 0.0
+        }
+        self.ready = False
+        self.started_at = None
+        self._in_flight = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._dispatchers = []
+        self._exporter = JsonExporter()
+    
+    async def start(self):
+        """Crée les pools, démarre les tâches de traitement et préchauffe les processus."""
+        self.started_at = time.time()
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._processes = self._create_process_pool()
+        self._threads = ThreadPoolExecutor(max_workers=self.extract_workers,
+                                           thread_name_prefix='extraction')
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.extract_workers)]
+        await self._warm_up_pool(self._processes)
+        self.ready = True
+    
+    async def _warm_up_pool(self, pool: ProcessPoolExecutor):
+        """Démarre les processus d'analyse pour qu'ils chargent le modèle avant la prochaine demande."""
+        loop = asyncio.get_running_loop()
+        # Un appel par processus : chacun exécute _init_worker à son démarrage
+        await asyncio.gather(*(loop.run_in_executor(pool, _warm_up) for _ in range(self.nlp_workers)))
+    
+    def _create_process_pool(self) -> ProcessPoolExecutor:
+        """Crée le pool de processus d'analyse, chacun avec son pipeline préchargé."""
+        return ProcessPoolExecutor(
+            max_workers=self.nlp_workers,
+            mp_context=multiprocessing.get_context(self.mp_context),
+            initializer=_init_worker,
+            initargs=(self.model_name, self.pipeline_options)
+        )
+    
+    async def stop(self):
+        """Arrête les tâches de traitement et libère les pools."""
+        self.ready = False
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self._dispatchers = []
+        if self._threads:
+            self._threads.shutdown(wait=True)
+        if self._processes:
+            self._processes.shutdown(wait=True, cancel_futures=True)
+    
+    def submit(self, file_path: str) -> Dict:
+        """
+        Place une demande d'analyse dans la file.
+        
+        Args:
+            file_path: Chemin du fichier à analyser (sur la machine du service)
+            
+        Returns:
+            Dict: La demande créée
+            
+        Raises:
+            ValueError: Si le format de fichier n'est pas supporté
+            asyncio.QueueFull: Si la file d'attente est pleine
+        """
+        if not ExtractorFactory.is_supported(file_path):
+            supported = ', '.join(ExtractorFactory.get_supported_formats())
+            raise ValueError(f"Format non supporté. Formats supportés: {supported}")
+        
+        job = {
+            'id': uuid.uuid4().hex,
+            'file_path': file_path,
+            'status': 'queued',
+            'submitted_at': time.time(),
+            'result': None,
+            'error': None,
+            'done': asyncio.Event()
+        }
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.metrics['jobs_rejected'] += 1
+            raise
+        
+        self.metrics['jobs_submitted'] += 1
+        self.jobs[job['id']] = job
+        self._forget_old_jobs()
+        return job
+    
+    async def _dispatch(self):
+        """Traite les demandes de la file une par une : extraction, analyse puis export."""
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._queue.get()
+            self._in_flight += 1
+            job['status'] = 'running'
+            pool = self._processes
+            try:
+                start = time.perf_counter()
+                cache_key, cached = None, None
+                if self.pipeline_options['cache_dir']:
+                    extractor_options = ExtractorFactory.get_options(Path(job['file_path']).suffix)
+                    cache_key, cached = await loop.run_in_executor(
+                        pool, _lookup_in_worker, job['file_path'], extractor_options
+                    )
+                if cached is not None:
+                    document, analysis_data = cached
+                    self.metrics['cache_hits'] += 1
+                    extracted = analyzed = time.perf_counter()
+                else:
+                    document = await loop.run_in_executor(self._threads, self._extract, job['file_path'])
+                    extracted = time.perf_counter()
+                    analysis_data = await loop.run_in_executor(pool, _analyze_in_worker, document, cache_key)
+                    analyzed = time.perf_counter()
+                job['result'] = await loop.run_in_executor(
+                    self._threads, self._build_result, document, analysis_data
+                )
+                
+                self.metrics['extract_seconds'] += extracted - start
+                self.metrics['analyze_seconds'] += analyzed - extracted
+                self.metrics['export_seconds'] += time.perf_counter() - analyzed
+                self.metrics['jobs_completed'] += 1
+                job['status'] = 'done'
+            except BrokenProcessPool as e:
+                # Un processus d'analyse s'est arrêté brutalement : le pool est recréé
+                self.metrics['jobs_failed'] += 1
+                job['status'] = 'failed'
+                job['error'] = f"{e.__class__.__name__}: {str(e)}"
+                if self._processes is pool:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    self._processes = self._create_process_pool()
+                    await self._rebuild_warm_up(self._processes)
+            except Exception as e:
+                self.metrics['jobs_failed'] += 1
+                job['status'] = 'failed'
+                job['error'] = f"{e.__class__.__name__}: {str(e)}"
+            finally:
+                job['finished_at'] = time.time()
+                job['done'].set()
+                self._in_flight -= 1
+                self._queue.task_done()
+    
+    async def _rebuild_warm_up(self, pool: ProcessPoolExecutor):
+        """Préchauffe un pool recréé ; le service n'est pas prêt tant que le modèle se charge."""
+        self.ready = False
+        try:
+            await self._warm_up_pool(pool)
+        except BrokenProcessPool:
+            # Le nouveau pool est lui aussi cassé : la prochaine demande le recréera
+            pass
+        self.ready = True
+    
+    @staticmethod
+    def _extract(file_path: str) -> Document:
+        """Extrait un document (exécuté dans le pool de threads)."""
+        return ExtractorFactory.get_extractor(file_path).extract(file_path)
+    
+    def _build_result(self, document: Document, analysis_data: dict) -> Dict:
+        """Construit le résultat renvoyé au client et exporte le JSON si demandé."""
+        analysis = Analysis.from_dict(analysis_data)
+        result = self._exporter.build_export_data(document, analysis)
+        if self.output_dir:
+            output_path = self.output_dir / Path(document.file_path).with_suffix('.json').name
+            result['output_path'] = self._exporter.export(document, analysis, str(output_path))
+        return result
+    
+    def _forget_old_jobs(self):
+        """Oublie les demandes terminées les plus anciennes au-delà de max_jobs."""
+        while len(self.jobs) > self.max_jobs:
+            oldest_id = next(iter(self.jobs))
+            if not self.jobs[oldest_id]['done'].is_set():
+                break
+            del self.jobs[oldest_id]
+    
+    @staticmethod
+    def job_view(job: Dict) -> Dict:
+        """Représentation JSON d'une demande."""
+        return {key: value for key, value in job.items() if key != 'done'}
+    
+    def health(self) -> Dict:
+        """État du service."""
+        return {
+            'status': 'ok' if self.ready else 'starting',
+            'model': self.model_name,
+            'nlp_workers': self.nlp_workers,
+            'extract_workers': self.extract_workers,
+            'queue_depth': self._queue.qsize() if self._queue else 0,
+            'queue_size': self.queue_size,
+            'in_flight': self._in_flight,
+            'uptime_s': time.time() - self.started_at if self.started_at else 0.0
+        }
+    
+    def metrics_text(self) -> str:
+        """Compteurs du service au format texte Prometheus."""
+        values = dict(self.metrics)
+        values['queue_depth'] = self._queue.qsize() if self._queue else 0
+        values['in_flight'] = self._in_flight
+        values['ready'] = int(self.ready)
+        return ''.join(f"docparser_{name} {value}\n" for name, value in values.items())
+    
+    # --- Serveur HTTP minimal (asyncio, sans dépendance externe) ---
+    
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Traite une requête HTTP/1.1 puis ferme la connexion."""
+        try:
+            request_line = (await reader.readline()).decode('latin-1').strip()
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode('latin-1').strip()
+                if not line:
+                    break
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+            body = b''
+            if int(headers.get('content-length', 0) or 0) > 0:
+                body = await reader.readexactly(int(headers['content-length']))
+            
+            parts = request_line.split()
+            if len(parts) < 2:
+                status, payload = 400, {'error': 'Requête invalide'}
+            else:
+                status, payload = await self.route(parts[0].upper(), parts[1], body)
+        except Exception as e:
+            status, payload = 500, {'error': str(e)}
+        
+        if isinstance(payload, str):
+            data, content_type = payload.encode('utf-8'), 'text/plain; version=0.0.4; charset=utf-8'
+        else:
+            data = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+            content_type = 'application/json; charset=utf-8'
+        writer.write(
+            f"HTTP/1.1 {status} {self._REASONS.get(status, '')}\r\n"
+            f"Content-Type: {content_type}\r\nContent-Length: {len(data)}\r\n"
+            f"Connection: close\r\n\r\n".encode('latin-1') + data
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+    
+    async def route(self, method: str, path: str, body: bytes):
+        """
+        Aiguille une requête vers le bon point d'accès.
+        
+        Args:
+            method: Méthode HTTP
+            path: Chemin demandé
+            body: Corps de la requête
+            
+        Returns:
+            Tuple[int, object]: Code HTTP et contenu (dict JSON ou texte)
+        """
+        path = path.split('?', 1)[0].rstrip('/') or '/'
+        
+        if path == '/health':
+            return 200 if self.ready else 503, self.health()
+        if path == '/metrics':
+            return 200, self.metrics_text()
+        
+        if path == '/jobs':
+            if method != 'POST':
+                return 405, {'error': 'Utilisez POST pour soumettre un document'}
+            try:
+                request = json.loads(body or b'{}')
+                file_path = str(request['file_path'])
+            except (ValueError, KeyError, TypeError):
+                return 400, {'error': 'Corps JSON attendu: {"file_path": "...", "wait": false}'}
+            if not Path(file_path).exists():
+                return 400, {'error': f"Le fichier {file_path} n'existe pas."}
+            
+            try:
+                job = self.submit(file_path)
+            except ValueError as e:
+                return 400, {'error': str(e)}
+            except asyncio.QueueFull:
+                return 503, {'error': "File d'attente pleine, réessayez plus tard"}
+            if request.get('wait'):
+                await job['done'].wait()
+                return (200 if job['status'] == 'done' else 500), self.job_view(job)
+            return 202, self.job_view(job)
+        
+        if path.startswith('/jobs/'):
+            job = self.jobs.get(path[len('/jobs/'):])
+            if job is None:
+                return 404, {'error': 'Demande inconnue'}
+            return 200, self.job_view(job)
+        
+        return 404, {'error': f"Chemin inconnu: {path}"}
+    
+    async def serve(self, host: str = '127.0.0.1', port: int = 8080):
+        """
+        Démarre le service et répond aux requêtes jusqu'à l'interruption.
+        
+        Args:
+            host: Adresse d'écoute (locale par défaut)
+            port: Port d'écoute
+        """
+        await self.start()
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        print(f"✓ Service prêt sur http://{host}:{port} "
+              f"({self.nlp_workers} processus NLP, {self.extract_workers} threads d'extraction, "
+              f"file de {self.queue_size})")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.stop()
+
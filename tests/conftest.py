@@ -0,0 +1,37 @@
+"""Configuration commune des tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(scope='session')
+def blank_model(tmp_path_factory) -> str:
+    """
+    Modèle spaCy français sans composant entraîné, enregistré sur disque.
+    
+    Les phrases sont délimitées par règles et les entités reconnues par motifs :
+    les résultats sont déterministes et aucun modèle téléchargé n'est nécessaire.
+    
+    Returns:
+        str: Chemin du modèle, utilisable comme model_name
+    """
+    import spacy
+    
+    nlp = spacy.blank('fr')
+    nlp.add_pipe('sentencizer')
+    ruler = nlp.add_pipe('entity_ruler')
+    ruler.add_patterns([
+        {'label': 'PER', 'pattern': 'Marie'},
+        {'label': 'LOC', 'pattern': 'Paris'},
+        {'label': 'ORG', 'pattern': 'Google'}
+    ])
+    path = tmp_path_factory.mktemp('models') / 'fr_blank'
+    nlp.to_disk(path)
+    return str(path)
+
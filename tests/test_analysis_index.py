@@ -0,0 +1,110 @@
+"""Tests de l'index inversé des entités, relations et catégories."""
+
+import pytest
+
+from src.index.analysis_index import AnalysisIndex, normalize
+from src.models.analysis import Analysis, Relation
+from src.models.document import Document
+
+
+def indexed(file_path: str, entities, relations=(), categories=()):
+    """Document et analyse minimaux à indexer."""
+    document = Document(content='', file_path=file_path, file_type='txt', title=file_path)
+    analysis = Analysis(categories=list(categories), relations=list(relations), language='fr')
+    for text, label in entities:
+        analysis.entities.add(text, label, 0, len(text))
+    return document, analysis
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = AnalysisIndex(str(tmp_path / 'index.sqlite3'))
+    index.add(*indexed(
+        'a.txt',
+        [('Marie', 'PER'), ('Marie', 'PER'), ('Marie  Curie', 'PER'), ('Paris', 'LOC'), ('Éloïse', 'PER')],
+        [Relation('Marie', 'Paris', 'LOCATED_IN', 0.9)],
+        ['science', 'santé']
+    ))
+    index.add(*indexed(
+        'b.txt',
+        [('Mariette', 'PER'), ('Ελένη', 'PER'), ('東京', 'LOC'), ('Google', 'ORG')],
+        [Relation('Google', 'Marie', 'WORKS_FOR', 0.7)],
+        ['technologie']
+    ))
+    yield index
+    index.close()
+
+
+def texts(results):
+    """Couples (document, entité) d'une recherche, triés."""
+    return sorted((result['file_path'], result['text']) for result in results)
+
+
+def test_normalize():
+    assert normalize('  Marie \n Curie ') == 'marie curie'
+    assert normalize('STRASSE') == normalize('Straße')
+
+
+def test_exact_and_prefix_lookup(index):
+    # Exacte : casse et espaces ignorés, occurrences comptées
+    assert index.find_entity('marie curie') == [
+        {'file_path': 'a.txt', 'title': 'a.txt', 'text': 'Marie  Curie', 'label': 'PER', 'count': 1}
+    ]
+    assert index.find_entity('MARIE')[0]['count'] == 2
+    assert texts(index.find_entity('Mari', prefix=True)) == [
+        ('a.txt', 'Marie'), ('a.txt', 'Marie  Curie'), ('b.txt', 'Mariette')
+    ]
+    assert index.find_entity('Mari') == []
+    assert index.find_entity('Mari', label='LOC', prefix=True) == []
+
+
+def test_prefix_edge_cases(index):
+    # Préfixe vide : tous les termes (borne supérieure '\U0010ffff'), filtrables par label
+    assert len(index.find_entity('', prefix=True)) == 8
+    assert texts(index.find_entity('', label='LOC', prefix=True)) == [('a.txt', 'Paris'), ('b.txt', '東京')]
+    # Préfixes non ASCII (UTF-8 sur deux, trois octets) et casse hors ASCII
+    assert texts(index.find_entity('élo', prefix=True)) == [('a.txt', 'Éloïse')]
+    assert texts(index.find_entity('ΕΛ', prefix=True)) == [('b.txt', 'Ελένη')]
+    assert texts(index.find_entity('東', prefix=True)) == [('b.txt', '東京')]
+    assert index.find_entity('\U0010ffff', prefix=True) == []
+    assert index.find_entity('Marie Curie et', prefix=True) == []
+    # Espace finale : début d'un mot suivant, pas suite du même mot
+    assert texts(index.find_entity('  marie  ', prefix=True)) == [('a.txt', 'Marie  Curie')]
+    
+    with pytest.raises(ValueError):
+        index.find_entity()
+    assert len(index.find_entity(label='PER', limit=2)) == 2
+
+
+def test_find_relation_and_category(index):
+    # Une relation se retrouve dans les deux sens
+    assert index.find_relation('paris', 'MARIE') == [{
+        'file_path': 'a.txt', 'title': 'a.txt', 'entity1': 'Marie', 'entity2': 'Paris',
+        'relation_type': 'LOCATED_IN', 'confidence': 0.9
+    }]
+    assert [r['file_path'] for r in index.find_relation('Marie')] == ['a.txt', 'b.txt']
+    assert [r['file_path'] for r in index.find_relation('Marie', relation_type='WORKS_FOR')] == ['b.txt']
+    assert index.find_relation('Marie', 'Google', relation_type='LOCATED_IN') == []
+    
+    assert [(r['file_path'], r['rank']) for r in index.find_category('Santé')] == [('a.txt', 1)]
+
+
+def test_reindexing_replaces_entries(index, tmp_path):
+    index.add(*indexed('a.txt', [('Pierre', 'PER')], categories=['sport']))
+    
+    assert index.find_entity('Marie') == []
+    assert index.find_relation('Paris') == []
+    assert index.find_category('science') == []
+    assert texts(index.find_entity('Pierre')) == [('a.txt', 'Pierre')]
+    assert index.stats() == {'documents': 2, 'entities': 5, 'relations': 1, 'categories': 2}
+    
+    index.remove('b.txt')
+    index.remove('absent.txt')
+    assert index.stats() == {'documents': 1, 'entities': 1, 'relations': 0, 'categories': 1}
+    
+    # L'index est persistant
+    index.close()
+    reopened = AnalysisIndex(str(tmp_path / 'index.sqlite3'))
+    assert texts(reopened.find_entity('pierre')) == [('a.txt', 'Pierre')]
+    reopened.close()
+
@@ -0,0 +1,55 @@
+"""Tests de l'analyse par blocs des longs documents."""
+
+import re
+
+from src.analyzers.chunking import get_offset, iter_docs, split_text
+from src.analyzers.nlp_pipeline import NLPPipeline
+from src.models.document import Document
+
+SENTENCES = [
+    'Marie habite à Paris depuis dix ans.',
+    'Elle travaille chez Google, près de la gare.',
+    'Le week-end, Marie quitte Paris pour la campagne !',
+    'Google ouvre un nouveau bureau à Paris ?'
+]
+
+
+def long_text(paragraphs: int = 30) -> str:
+    return '\n\n'.join(' '.join(SENTENCES) for _ in range(paragraphs))
+
+
+def test_split_text_covers_text():
+    text = long_text()
+    chunks = list(split_text(text, 500))
+    
+    assert len(chunks) > 1
+    for offset, chunk in chunks:
+        assert len(chunk) <= 500
+        assert text[offset:offset + len(chunk)] == chunk
+    # Seuls les espaces entre blocs sont omis
+    assert re.sub(r'\s', '', ''.join(chunk for _, chunk in chunks)) == re.sub(r'\s', '', text)
+
+
+def test_chunked_docs_carry_offsets(blank_model):
+    nlp = NLPPipeline(model_name=blank_model).nlp
+    text = long_text()
+    for doc in iter_docs(nlp, text, 500):
+        offset = get_offset(doc)
+        assert text[offset:offset + len(doc.text)] == doc.text
+
+
+def test_chunked_analysis_matches_single_pass(blank_model):
+    document = Document(content=long_text(), file_path='long.txt', file_type='txt')
+    
+    single = NLPPipeline(model_name=blank_model, max_chunk_chars=1_000_000).analyze(document)
+    chunked_pipeline = NLPPipeline(model_name=blank_model, max_chunk_chars=500)
+    assert chunked_pipeline._is_long(document)
+    chunked = chunked_pipeline.analyze(document)
+    
+    assert len(single.entities) == 30 * 7
+    assert chunked.entities.to_dicts() == single.entities.to_dicts()
+    for entity in chunked.entities:
+        assert document.content[entity.start:entity.end] == entity.text
+    assert chunked.word_count == single.word_count
+    assert chunked.sentence_count == single.sentence_count == 30 * len(SENTENCES)
+
@@ -0,0 +1,61 @@
+"""Tests de l'extracteur DOCX : lecture en flux et modèle objet de python-docx."""
+
+import pytest
+
+from src.extractors.docx_extractor import DocxExtractor
+
+docx = pytest.importorskip('docx')
+
+
+@pytest.fixture
+def report(tmp_path):
+    """DOCX mêlant paragraphes, cellules fusionnées et tableau imbriqué."""
+    document = docx.Document()
+    document.core_properties.title = 'Rapport'
+    document.add_paragraph('Introduction du rapport.')
+    run = document.add_paragraph('Première ligne').add_run()
+    run.add_break()
+    run.add_text('seconde ligne')
+    
+    table = document.add_table(rows=3, cols=3)
+    for i, row in enumerate(table.rows):
+        for j, cell in enumerate(row.cells):
+            cell.text = f'c{i}{j}'
+    # Fusion horizontale (gridSpan) sur la première ligne, verticale (vMerge) sur la première colonne
+    table.cell(0, 0).merge(table.cell(0, 1)).text = 'Titre fusionné'
+    table.cell(1, 0).merge(table.cell(2, 0)).text = 'Marie'
+    
+    nested = table.cell(1, 2).add_table(rows=2, cols=2)
+    for i, row in enumerate(nested.rows):
+        for j, cell in enumerate(row.cells):
+            cell.text = f'n{i}{j}'
+    
+    document.add_paragraph('Conclusion après le tableau.')
+    path = tmp_path / 'rapport.docx'
+    document.save(str(path))
+    return path
+
+
+def test_streaming_matches_python_docx(report):
+    streamed = DocxExtractor(streaming=True).extract(str(report))
+    legacy = DocxExtractor(streaming=False).extract(str(report))
+    
+    assert streamed.content == legacy.content
+    assert streamed.title == legacy.title == 'Rapport'
+
+
+def test_tables_in_document_order(report):
+    blocks = DocxExtractor(streaming=True).extract(str(report)).content.split('\n\n')
+    
+    assert blocks == [
+        'Introduction du rapport.',
+        'Première ligne\nseconde ligne',
+        # gridSpan : la cellule fusionnée occupe deux colonnes
+        'Titre fusionné | Titre fusionné | c02',
+        # Les lignes du tableau imbriqué font partie de la cellule qui le contient
+        'Marie | c11 | c12\nn00 | n01\nn10 | n11',
+        # vMerge : la suite de la fusion reprend le texte de la cellule d'origine
+        'Marie | c21 | c22',
+        'Conclusion après le tableau.'
+    ]
+
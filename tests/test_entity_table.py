@@ -0,0 +1,88 @@
+"""Tests du stockage en colonnes des entités et de la sérialisation des analyses."""
+
+import pytest
+
+from src.models.analysis import Analysis, Entity, EntityTable, Relation
+
+CONTENT = 'Marie habite à Paris. Marie travaille chez Google.'
+
+
+def sample_entities():
+    return [
+        Entity('Marie', 'PER', 0, 5, 0.9),
+        Entity('Paris', 'LOC', 15, 20),
+        Entity('Marie', 'PER', 22, 27, 0.8),
+        Entity('Google', 'ORG', 43, 49, 0.7)
+    ]
+
+
+def test_append_and_read_back():
+    table = EntityTable(content=CONTENT)
+    for entity in sample_entities():
+        table.append(entity)
+    
+    assert len(table) == 4
+    assert list(table) == sample_entities()
+    assert table[1] == Entity('Paris', 'LOC', 15, 20, None)
+    assert table[-1].text == 'Google'
+    assert table[1:3] == sample_entities()[1:3]
+    assert table.labels == ['PER', 'LOC', 'ORG']
+    with pytest.raises(IndexError):
+        table[4]
+
+
+def test_texts_read_from_content():
+    table = EntityTable(sample_entities(), content=CONTENT)
+    
+    # Textes identiques au contenu : relus dans content, non stockés
+    assert table._texts == [None, None, None, None]
+    assert list(table.iter_texts()) == ['Marie', 'Paris', 'Marie', 'Google']
+    
+    # Texte différent du contenu (ex: entité normalisée) : conservé tel quel
+    table.add('Google Inc.', 'ORG', 43, 49)
+    assert table._texts[-1] == 'Google Inc.'
+    assert table.text(4) == 'Google Inc.'
+
+
+def test_columns_and_to_dicts():
+    table = EntityTable(sample_entities(), content=CONTENT)
+    
+    assert table.columns() == {
+        'text': ['Marie', 'Paris', 'Marie', 'Google'],
+        'label': ['PER', 'LOC', 'PER', 'ORG'],
+        'start': [0, 15, 22, 43],
+        'end': [5, 20, 27, 49],
+        'confidence': [0.9, None, 0.8, 0.7]
+    }
+    assert table.to_dicts() == [
+        {'text': e.text, 'label': e.label, 'start': e.start, 'end': e.end, 'confidence': e.confidence}
+        for e in sample_entities()
+    ]
+
+
+def test_offsets_beyond_32_bits():
+    start = 2 ** 31 + 10
+    table = EntityTable([Entity('Paris', 'LOC', start, start + 5)])
+    assert table[0].start == start
+    assert table.columns()['end'] == [start + 5]
+
+
+def test_analysis_round_trip():
+    analysis = Analysis(
+        entities=EntityTable(sample_entities(), content=CONTENT),
+        sentiment={'polarity': 0.2, 'subjectivity': 0.4, 'label': 'positif'},
+        categories=['technologie'],
+        relations=[Relation('Marie', 'Google', 'travaille_pour', 0.6)],
+        language='fr',
+        word_count=9,
+        sentence_count=2
+    )
+    
+    data = analysis.to_dict()
+    restored = Analysis.from_dict(data)
+    
+    assert restored.to_dict() == data
+    assert restored.entities == sample_entities()
+    assert restored.relations == analysis.relations
+    assert 'timings' not in data and 'duplicate_of' not in data
+
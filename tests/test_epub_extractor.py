@@ -0,0 +1,40 @@
+"""Tests de l'extracteur EPUB : backends lxml et BeautifulSoup."""
+
+import pytest
+
+from benchmarks.fixtures import generate_paragraphs, write_epub
+from src.extractors.epub_extractor import EpubExtractor, _chapter_text
+
+pytest.importorskip('lxml.html')
+pytest.importorskip('bs4')
+
+CHAPTER = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    '<html xmlns="http://www.w3.org/1999/xhtml"><head><title>Chapitre 1</title>'
+    '<style>p { margin: 0; }</style></head><body>'
+    '<h1>Chapitre 1</h1>'
+    '<p>a<script>x</script>b</p>'
+    '<p>Marie<!-- note -->habite à <em>Paris</em>.</p>'
+    '<p>avant<![CDATA[données]]>après</p>'
+    '<template><p>modèle</p></template>fin'
+    '</body></html>'
+).encode('utf-8')
+
+
+def test_backends_extract_same_chapter_text():
+    text = _chapter_text(CHAPTER, 'lxml')
+    assert text == _chapter_text(CHAPTER, 'bs4')
+    assert 'a b' in text
+    assert 'modèle' not in text
+
+
+def test_backends_extract_same_book(tmp_path):
+    write_epub(tmp_path / 'book.epub', generate_paragraphs(20_000), 40)
+    
+    lxml_document = EpubExtractor(backend='lxml').extract(str(tmp_path / 'book.epub'))
+    bs4_document = EpubExtractor(backend='bs4').extract(str(tmp_path / 'book.epub'))
+    
+    assert lxml_document.content == bs4_document.content
+    # Les segments (et donc les clés du mode incrémental) ne dépendent pas du backend
+    assert lxml_document.metadata['segments'] == bs4_document.metadata['segments']
+
@@ -0,0 +1,37 @@
+"""Tests de l'extracteur HTML : backends lxml et BeautifulSoup."""
+
+import pytest
+
+from src.extractors.html_extractor import HtmlExtractor
+
+pytest.importorskip('lxml.html')
+pytest.importorskip('bs4')
+
+PAGES = [
+    '<div>1<script>x</script>2</div><nav>n</nav>after<footer>f</footer>end',
+    '<html><head><title>Rapport</title><meta name="author" content="Marie">'
+    '<style>p { color: red; }</style></head><body>'
+    '<header><nav><a href="/">Accueil</a></nav>En-tête</header>'
+    '<p>Marie<script>var x = 1;</script>habite<!-- commentaire -->à Paris.</p>'
+    '<p>avant<![CDATA[section cdata]]>après</p>'
+    '<template><p>modèle</p></template>suite'
+    '<footer>Pied de page</footer>fin</body></html>',
+    ''
+]
+
+
+@pytest.mark.parametrize('page', PAGES)
+def test_backends_extract_same_text(page):
+    extractor = HtmlExtractor()
+    lxml_result = extractor._parse_lxml(page)
+    bs4_result = extractor._parse_bs4(page)
+    
+    # Texte, titre et métadonnées
+    assert lxml_result[0] == bs4_result[0]
+    assert lxml_result[1:] == bs4_result[1:]
+
+
+def test_removed_element_tail_stays_separate():
+    content, _, _ = HtmlExtractor(backend='lxml')._parse_lxml(PAGES[0])
+    assert content == '1 2 after end'
+
@@ -0,0 +1,106 @@
+"""Tests de la réanalyse incrémentale des EPUB, chapitre par chapitre."""
+
+import json
+
+import pytest
+
+from benchmarks.fixtures import generate_paragraphs, write_epub
+from src.analyzers.nlp_pipeline import NLPPipeline
+from src.cache.result_cache import ResultCache
+from src.exporters.json_exporter import JsonExporter
+from src.exporters.parquet_exporter import ParquetExporter
+from src.extractors.epub_extractor import EpubExtractor
+from src.models.analysis import Analysis
+
+
+@pytest.fixture
+def book(tmp_path):
+    """EPUB de 6 chapitres (plus la table des matières) et sa variante où seul le chapitre 3 change."""
+    paragraphs = generate_paragraphs(30_000)
+    # Mots du lexique répartis dans tout le livre : la polarité par section couvre chaque chapitre
+    paragraphs = [('Un résultat excellent mais un départ triste. ' if i % 5 == 0 else '') + paragraph
+                  for i, paragraph in enumerate(paragraphs)]
+    chapter_size = -(-len(paragraphs) // 6)
+    write_epub(tmp_path / 'book.epub', paragraphs, chapter_size)
+    
+    changed = list(paragraphs)
+    changed[2 * chapter_size] = 'Marie quitte Google et part vivre à Paris. ' + changed[2 * chapter_size]
+    write_epub(tmp_path / 'book_v2.epub', changed, chapter_size)
+    
+    extractor = EpubExtractor()
+    return extractor.extract(str(tmp_path / 'book.epub')), extractor.extract(str(tmp_path / 'book_v2.epub'))
+
+
+def comparable(analysis) -> dict:
+    """Résultats comparables entre analyse segmentée et analyse d'un seul tenant."""
+    data = analysis.to_dict()
+    sentiment = data.pop('sentiment')
+    # Sommes flottantes cumulées dans un ordre différent selon le découpage
+    data['polarity'] = round(sentiment['polarity'], 9)
+    data['section_polarity'] = [round(polarity, 9) for polarity in sentiment['section_polarity']]
+    data['section_words'] = sentiment['section_words']
+    data['scored_words'] = sentiment['scored_words']
+    return data
+
+
+def test_segmented_matches_unsegmented(book, blank_model, tmp_path):
+    document, _ = book
+    assert len(document.metadata['segments']) == 7
+    
+    cache = ResultCache(str(tmp_path / 'cache'))
+    pipeline = NLPPipeline(model_name=blank_model, segment_store=cache)
+    assert pipeline._is_segmented(document)
+    segmented = pipeline.analyze(document)
+    whole = NLPPipeline(model_name=blank_model).analyze(document)
+    
+    assert comparable(segmented) == comparable(whole)
+    for entity in segmented.entities:
+        assert document.content[entity.start:entity.end] == entity.text
+    cache.close()
+
+
+def test_only_changed_chapter_is_recomputed(book, blank_model, tmp_path):
+    document, changed = book
+    cache = ResultCache(str(tmp_path / 'cache'))
+    pipeline = NLPPipeline(model_name=blank_model, segment_store=cache)
+    pipeline.analyze(document)
+    segment_count = len(document.metadata['segments'])
+    assert cache.stats()['misses'] == segment_count
+    
+    computed = []
+    analyze_segment = pipeline._analyze_segment
+    
+    def recording_analyze_segment(document, text, *args):
+        computed.append(text)
+        return analyze_segment(document, text, *args)
+    
+    pipeline._analyze_segment = recording_analyze_segment
+    hits = cache.stats()['hits']
+    incremental = pipeline.analyze(changed)
+    
+    assert cache.stats()['hits'] - hits == segment_count - 1
+    assert len(computed) == 1
+    assert computed[0].startswith('Chapitre 3')
+    assert 'Marie quitte Google' in computed[0]
+    
+    whole = NLPPipeline(model_name=blank_model).analyze(changed)
+    assert comparable(incremental) == comparable(whole)
+    cache.close()
+
+
+def test_segments_not_exported(book, tmp_path):
+    document, _ = book
+    
+    data = JsonExporter().build_export_data(document, Analysis())
+    assert 'segments' not in data['document']['metadata']
+    assert data['document']['metadata']['title'] == document.metadata['title']
+    # Le découpage reste disponible pour le pipeline
+    assert 'segments' in document.metadata
+    
+    pq = pytest.importorskip('pyarrow.parquet')
+    exporter = ParquetExporter()
+    exporter.export(document, Analysis(), str(tmp_path / 'tables'))
+    exporter.close()
+    table = pq.read_table(tmp_path / 'tables' / 'documents.parquet')
+    assert 'segments' not in json.loads(table['metadata'][0].as_py())
+
@@ -0,0 +1,193 @@
+"""Tests du service d'ingestion, démarré localement sur un port éphémère."""
+
+import asyncio
+import json
+import threading
+
+from src.service.ingestion_service import IngestionService
+
+
+async def http_request(port: int, method: str, path: str, payload=None):
+    """Envoie une requête HTTP/1.1 au service et retourne le code et le corps décodé."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode('latin-1') + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    
+    head, _, data = response.partition(b'\r\n\r\n')
+    status = int(head.split()[1])
+    if b'application/json' in head:
+        return status, json.loads(data)
+    return status, data.decode('utf-8')
+
+
+async def start_service(service: IngestionService):
+    """Démarre le service et son serveur HTTP sur un port choisi par le système."""
+    await service.start()
+    server = await asyncio.start_server(service.handle_connection, '127.0.0.1', 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+async def wait_for_job(port: int, job_id: str, timeout: float = 60.0) -> dict:
+    """Interroge /jobs/<id> jusqu'à la fin de la demande."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while True:
+        status, job = await http_request(port, 'GET', f'/jobs/{job_id}')
+        assert status == 200
+        if job['status'] in ('done', 'failed'):
+            return job
+        assert asyncio.get_running_loop().time() < deadline, "la demande n'a pas abouti"
+        await asyncio.sleep(0.05)
+
+
+def test_job_lifecycle_health_and_metrics(tmp_path, blank_model):
+    document = tmp_path / 'note.txt'
+    document.write_text('Marie habite à Paris. Elle travaille chez Google.', encoding='utf-8')
+    
+    async def scenario():
+        service = IngestionService(model_name=blank_model, nlp_workers=1, extract_workers=1)
+        server, port = await start_service(service)
+        try:
+            status, health = await http_request(port, 'GET', '/health')
+            assert status == 200
+            assert health['status'] == 'ok'
+            
+            status, job = await http_request(port, 'POST', '/jobs', {'file_path': str(document)})
+            assert status == 202
+            assert job['status'] in ('queued', 'running')
+            
+            job = await wait_for_job(port, job['id'])
+            assert job['status'] == 'done', job['error']
+            entities = {(e['text'], e['label']) for e in job['result']['analysis']['entities']}
+            assert entities == {('Marie', 'PER'), ('Paris', 'LOC'), ('Google', 'ORG')}
+            
+            status, metrics = await http_request(port, 'GET', '/metrics')
+            assert status == 200
+            assert 'docparser_jobs_submitted 1\n' in metrics
+            assert 'docparser_jobs_completed 1\n' in metrics
+            assert 'docparser_jobs_rejected 0\n' in metrics
+            
+            status, _ = await http_request(port, 'GET', '/jobs/inconnu')
+            assert status == 404
+        finally:
+            server.close()
+            await server.wait_closed()
+            await service.stop()
+    
+    asyncio.run(scenario())
+
+
+def test_full_queue_rejects_request(tmp_path, blank_model):
+    document = tmp_path / 'note.txt'
+    document.write_text('Marie habite à Paris.', encoding='utf-8')
+    
+    # L'unique thread d'extraction reste occupé par la première demande
+    release = threading.Event()
+    extract = IngestionService._extract
+    
+    def blocking_extract(file_path):
+        release.wait(timeout=60)
+        return extract(file_path)
+    
+    async def scenario():
+        service = IngestionService(model_name=blank_model, nlp_workers=1, extract_workers=1,
+                                   queue_size=1)
+        service._extract = blocking_extract
+        server, port = await start_service(service)
+        try:
+            _, first = await http_request(port, 'POST', '/jobs', {'file_path': str(document)})
+            while service.jobs[first['id']]['status'] != 'running':
+                await asyncio.sleep(0.01)
+            
+            status, second = await http_request(port, 'POST', '/jobs', {'file_path': str(document)})
+            assert status == 202
+            status, rejected = await http_request(port, 'POST', '/jobs', {'file_path': str(document)})
+            assert status == 503
+            assert 'error' in rejected
+            
+            _, metrics = await http_request(port, 'GET', '/metrics')
+            assert 'docparser_jobs_rejected 1\n' in metrics
+            assert 'docparser_queue_depth 1\n' in metrics
+            
+            release.set()
+            for job_id in (first['id'], second['id']):
+                assert (await wait_for_job(port, job_id))['status'] == 'done'
+        finally:
+            release.set()
+            server.close()
+            await server.wait_closed()
+            await service.stop()
+    
+    asyncio.run(scenario())
+
+
+
+def test_pipeline_options_reach_workers(tmp_path, blank_model):
+    document = tmp_path / 'note.txt'
+    document.write_text('Marie habite à Paris. Elle travaille chez Google. ' * 20, encoding='utf-8')
+    copy = tmp_path / 'copie.txt'
+    copy.write_text(document.read_text(encoding='utf-8').upper(), encoding='utf-8')
+    
+    async def scenario():
+        service = IngestionService(model_name=blank_model, nlp_workers=1, extract_workers=1,
+                                   cache_dir=str(tmp_path / 'cache'), detect_language=True,
+                                   language_models={}, dedup_index=str(tmp_path / 'dedup.sqlite3'))
+        server, port = await start_service(service)
+        try:
+            jobs = []
+            for path in (document, document, copy):
+                _, job = await http_request(port, 'POST', '/jobs', {'file_path': str(path), 'wait': True})
+                assert job['status'] == 'done', job['error']
+                jobs.append(job['result']['analysis'])
+            
+            # Langue détectée, deuxième demande servie par le cache, copie reconnue comme doublon
+            assert jobs[0]['language'] == 'fr'
+            assert jobs[1] == jobs[0]
+            assert jobs[2]['duplicate_of']['file_path'] == str(document.absolute())
+            _, metrics = await http_request(port, 'GET', '/metrics')
+            assert 'docparser_cache_hits 1\n' in metrics
+        finally:
+            server.close()
+            await server.wait_closed()
+            await service.stop()
+    
+    asyncio.run(scenario())
+
+
+def test_broken_pool_is_rebuilt_and_warmed_up(tmp_path, blank_model):
+    document = tmp_path / 'note.txt'
+    document.write_text('Marie habite à Paris.', encoding='utf-8')
+    
+    async def scenario():
+        service = IngestionService(model_name=blank_model, nlp_workers=1, extract_workers=1)
+        server, port = await start_service(service)
+        try:
+            broken = service._processes
+            for process in list(broken._processes.values()):
+                process.kill()
+                process.join()
+            
+            _, job = await http_request(port, 'POST', '/jobs', {'file_path': str(document), 'wait': True})
+            assert job['status'] == 'failed'
+            assert 'BrokenProcessPool' in job['error']
+            
+            # Le pool recréé est préchauffé avant que le service ne soit de nouveau prêt
+            assert service._processes is not broken
+            assert len(service._processes._processes) == 1
+            status, health = await http_request(port, 'GET', '/health')
+            assert status == 200 and health['status'] == 'ok'
+            
+            _, job = await http_request(port, 'POST', '/jobs', {'file_path': str(document), 'wait': True})
+            assert job['status'] == 'done', job['error']
+        finally:
+            server.close()
+            await server.wait_closed()
+            await service.stop()
+    
+    asyncio.run(scenario())
+
@@ -0,0 +1,65 @@
+"""Tests du comptage de mots-clés en une passe, comparé à une recherche par mot-clé."""
+
+import re
+from collections import Counter
+
+from benchmarks.fixtures import generate_paragraphs
+from src.analyzers.category_analyzer import CategoryAnalyzer
+from src.analyzers.keyword_matcher import KeywordMatcher
+
+TAXONOMY = {
+    'technologie': ['intelligence artificielle', 'intelligence', 'artificielle', 'e-mail', 'mail',
+                    'données', 'base de données', 'base'],
+    'économie': ['marché', 'marché financier', 'financier', 'très très'],
+    'science': ['intelligence', 'recherche', 'recherche et développement', 'développement']
+}
+
+TEXT = (
+    "L'intelligence artificielle transforme la recherche et développement. Une base de données "
+    "et un e-mail suffisent ; le mail part vers le marché financier, un marché très très très "
+    "volatil. L'intelligence humaine, l'intelligence artificielle et la base : des données."
+)
+
+
+def baseline_counts(matcher: KeywordMatcher, text: str) -> Counter:
+    """Comptage de référence : une recherche \\b<mot-clé>\\b par mot-clé."""
+    counts = Counter()
+    for keyword in matcher.keyword_categories:
+        found = len(re.findall(r'\b' + re.escape(keyword) + r'\b', text))
+        if found:
+            counts[keyword] = found
+    return counts
+
+
+def baseline_scores(matcher: KeywordMatcher, text: str) -> dict:
+    """Scores de référence par catégorie, dans l'ordre de déclaration."""
+    scores = Counter()
+    for keyword, count in baseline_counts(matcher, text).items():
+        for category in matcher.keyword_categories[keyword]:
+            scores[category] += count
+    return {category: scores[category] for category in matcher.categories if category in scores}
+
+
+def test_overlapping_keywords_match_per_keyword_search():
+    matcher = KeywordMatcher(TAXONOMY)
+    text = TEXT.lower()
+    
+    counts = matcher.count_keywords(text)
+    assert counts == baseline_counts(matcher, text)
+    # Mots-clés contenus dans une correspondance plus longue
+    assert counts['intelligence'] == 3
+    assert counts['intelligence artificielle'] == 2
+    assert counts['artificielle'] == 2
+    assert counts['mail'] == 2
+    # Deux occurrences d'un même mot-clé ne se chevauchent pas
+    assert counts['très très'] == 1
+    assert matcher.score(text) == baseline_scores(matcher, text)
+
+
+def test_default_taxonomy_matches_per_keyword_search():
+    analyzer = CategoryAnalyzer()
+    text = '\n\n'.join(generate_paragraphs(50_000)).lower()
+    
+    assert analyzer.matcher.count_keywords(text) == baseline_counts(analyzer.matcher, text)
+    assert analyzer.matcher.score(text) == baseline_scores(analyzer.matcher, text)
+
@@ -0,0 +1,73 @@
+"""Tests de l'index MinHash/LSH des quasi-doublons."""
+
+import pytest
+
+from benchmarks.fixtures import generate_paragraphs
+from src.dedup.minhash_index import MinHashIndex
+from src.models.analysis import Analysis
+
+pytest.importorskip('numpy')
+
+PARAGRAPHS = generate_paragraphs(20_000)
+OTHER_PARAGRAPHS = generate_paragraphs(20_000, seed=1)
+TEXT = '\n\n'.join(PARAGRAPHS)
+# Mise en forme différente (casse, sauts de ligne) et un paragraphe sur trente remplacé
+NEAR_DUPLICATE = '\n'.join(
+    other if i % 30 == 0 else paragraph.upper()
+    for i, (paragraph, other) in enumerate(zip(PARAGRAPHS, OTHER_PARAGRAPHS))
+)
+OTHER = '\n\n'.join(OTHER_PARAGRAPHS)
+
+
+@pytest.fixture
+def index():
+    index = MinHashIndex()
+    yield index
+    index.close()
+
+
+def test_near_duplicate_found_and_distinct_text_missed(index):
+    index.add('original.txt', index.signature(TEXT), 'config')
+    
+    match = index.find(index.signature(NEAR_DUPLICATE), 'config')
+    assert match['file_path'] == 'original.txt'
+    assert index.threshold <= match['similarity'] < 1
+    
+    assert index.find(index.signature(OTHER), 'config') is None
+    # Analyse faite avec une autre configuration : pas de canonique réutilisable
+    assert index.find(index.signature(NEAR_DUPLICATE), 'autre config') is None
+    # Un document n'est pas son propre doublon
+    assert index.find(index.signature(TEXT), 'config', exclude='original.txt') is None
+
+
+def test_short_text_has_no_signature(index):
+    assert index.signature('Trop court, quatre mots') is None
+
+
+def test_remove_and_persistence(tmp_path):
+    path = tmp_path / 'dedup.sqlite3'
+    index = MinHashIndex(str(path))
+    index.add('original.txt', index.signature(TEXT))
+    analysis = Analysis(language='fr', word_count=42)
+    index.set_analysis('original.txt', analysis)
+    index.close()
+    
+    # Signatures et analyse relues depuis le fichier
+    index = MinHashIndex(str(path))
+    assert index.stats() == {'documents': 1}
+    assert index.find(index.signature(NEAR_DUPLICATE))['file_path'] == 'original.txt'
+    assert index.get_analysis('original.txt').word_count == 42
+    
+    index.remove('original.txt')
+    assert index.stats() == {'documents': 0}
+    assert index.find(index.signature(NEAR_DUPLICATE)) is None
+    assert index.get_analysis('original.txt') is None
+    # Aucune bande orpheline ne subsiste
+    assert index._conn.execute('SELECT COUNT(*) FROM bands').fetchone()[0] == 0
+    index.close()
+
+
+def test_bands_must_divide_permutations():
+    with pytest.raises(ValueError):
+        MinHashIndex(num_perm=100, bands=16)
+
@@ -0,0 +1,41 @@
+"""Tests de l'exportateur NDJSON : sérialisation avec orjson et avec json."""
+
+import json
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+
+from src.exporters import ndjson_exporter
+from src.exporters.ndjson_exporter import NdjsonExporter
+
+pytest.importorskip('orjson')
+
+RECORD = {
+    'document': {
+        'title': 'Été à Paris',
+        'metadata': {
+            'created': datetime(2024, 3, 1, 9, 30, 15),
+            'modified': datetime(2024, 3, 2, 18, 0, 0, 250, tzinfo=timezone(timedelta(hours=1))),
+            'day': date(2024, 3, 1),
+            'at': time(12, 45),
+            'pages': 12,
+            'ratio': 0.5,
+            'tags': ('a', 'b'),
+            3: 'clé numérique'
+        }
+    },
+    'analysis': {'entities': [], 'sentiment': None, 'flag': True}
+}
+
+
+def test_orjson_and_json_write_same_record(monkeypatch):
+    with_orjson = NdjsonExporter.serialize(RECORD)
+    monkeypatch.setattr(ndjson_exporter, 'orjson', None)
+    with_json = NdjsonExporter.serialize(RECORD)
+    
+    assert with_orjson == with_json
+    assert with_orjson.endswith(b'\n')
+    metadata = json.loads(with_orjson)['document']['metadata']
+    assert metadata['created'] == '2024-03-01T09:30:15'
+    assert metadata['modified'] == '2024-03-02T18:00:00.000250+01:00'
+
@@ -0,0 +1,55 @@
+"""Tests de l'exportateur colonnaire : compression des fichiers Parquet et Arrow."""
+
+import pytest
+
+from src.exporters.parquet_exporter import ParquetExporter
+from src.models.analysis import Analysis
+from src.models.document import Document
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+
+def export_tables(output_dir, **options):
+    """Exporte quelques documents avec des entités et retourne l'exportateur fermé."""
+    exporter = ParquetExporter(**options)
+    for i in range(20):
+        document = Document(content='Marie habite à Paris. ' * 50, file_path=f'/corpus/doc{i}.txt',
+                            file_type='txt')
+        analysis = Analysis(categories=['société'], language='fr', word_count=200)
+        for _ in range(10):
+            analysis.entities.add('Marie', 'PER', 0, 5)
+            analysis.entities.add('Paris', 'LOC', 15, 20)
+        exporter.export(document, analysis, str(output_dir))
+    exporter.close()
+    return exporter
+
+
+def test_arrow_is_uncompressed_and_mapped_without_copy(tmp_path):
+    export_tables(tmp_path, file_format='arrow')
+    
+    with pa.memory_map(str(tmp_path / 'entities.arrow')) as source:
+        allocated = pa.total_allocated_bytes()
+        table = pa.ipc.open_file(source).read_all()
+        # Les colonnes pointent dans le fichier projeté : aucune décompression, aucune copie
+        assert pa.total_allocated_bytes() == allocated
+        assert table.num_rows == 400
+
+
+def test_compression_is_explicit_option(tmp_path):
+    export_tables(tmp_path / 'parquet', file_format='parquet')
+    export_tables(tmp_path / 'arrow', file_format='arrow', compression='zstd')
+    
+    # Parquet reste compressé par défaut
+    metadata = pq.ParquetFile(str(tmp_path / 'parquet' / 'entities.parquet')).metadata
+    assert metadata.row_group(0).column(0).compression == 'ZSTD'
+    
+    with pa.memory_map(str(tmp_path / 'arrow' / 'entities.arrow')) as source:
+        allocated = pa.total_allocated_bytes()
+        table = pa.ipc.open_file(source).read_all()
+        assert pa.total_allocated_bytes() > allocated
+        assert table.num_rows == 400
+    
+    with pytest.raises(ValueError):
+        ParquetExporter(file_format='arrow', compression='gzip')
+
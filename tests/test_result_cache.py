@@ -0,0 +1,60 @@
+"""Tests du cache disque des résultats."""
+
+import random
+
+from src.cache.result_cache import ResultCache
+
+
+def stored_size(cache: ResultCache) -> int:
+    """Taille totale réellement stockée dans la base."""
+    return cache._conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+
+
+def segment(i: int) -> dict:
+    """Résultat de segment peu compressible (environ 400 octets une fois compressé)."""
+    return {'text': '%0200x' % random.Random(i).getrandbits(800)}
+
+
+def test_running_size_tracks_puts_replacements_and_eviction(tmp_path):
+    cache = ResultCache(str(tmp_path), max_size_bytes=1500)
+    for i in range(20):
+        cache.put_segment(f'segment-{i}', segment(i))
+        assert cache.stats()['size_bytes'] == stored_size(cache)
+        assert cache.stats()['size_bytes'] <= 1500
+    
+    # Les entrées les plus anciennes sont évincées, les plus récentes conservées
+    assert cache.get_segment('segment-0') is None
+    assert cache.get_segment('segment-19') == segment(19)
+    
+    # Remplacer une entrée ne compte pas deux fois sa taille
+    cache.put_segment('segment-19', {'text': 'court'})
+    assert cache.stats()['size_bytes'] == stored_size(cache)
+    cache.close()
+    
+    # La taille totale est relue à l'ouverture
+    reopened = ResultCache(str(tmp_path), max_size_bytes=1500)
+    assert reopened.stats()['size_bytes'] == stored_size(reopened)
+    reopened.clear()
+    assert reopened.stats()['size_bytes'] == 0
+    reopened.close()
+
+
+
+def test_key_depends_on_extractor_options(tmp_path, monkeypatch):
+    from main import cache_config
+    from src.extractors.extractor_factory import ExtractorFactory
+    
+    monkeypatch.setattr(ExtractorFactory, '_options', {})
+    page = tmp_path / 'page.html'
+    page.write_text('<p>Marie habite à Paris.</p>', encoding='utf-8')
+    config = {'model': 'fr_core_news_sm'}
+    
+    ExtractorFactory.configure('html', backend='lxml')
+    lxml_key = ResultCache.make_key(str(page), cache_config(config, page))
+    ExtractorFactory.configure('html', backend='html.parser')
+    parser_key = ResultCache.make_key(str(page), cache_config(config, page))
+    assert lxml_key != parser_key
+    
+    # Les options des autres formats n'invalident pas les entrées HTML
+    ExtractorFactory.configure('pdf', max_workers=4)
+    assert ResultCache.make_key(str(page), cache_config(config, page)) == parser_key
@@ -0,0 +1,46 @@
+"""Tests du choix du lexique de sentiment selon la langue détectée."""
+
+from src.analyzers.language_detector import LanguageDetector
+from src.analyzers.nlp_pipeline import NLPPipeline
+from src.analyzers.sentiment_lexicon import SentimentLexicon
+from src.models.document import Document
+
+ENGLISH = ("This is a wonderful and excellent product. We love the team, the results are great "
+           "and the customers are happy with the new service.")
+FRENCH = ("Un résultat excellent et une équipe heureuse : nous adorons ce produit magnifique, "
+          "les clients sont ravis du nouveau service.")
+GERMAN = ("Das ist ein wunderbares und ausgezeichnetes Produkt. Wir lieben die Mannschaft, "
+          "die Ergebnisse sind großartig und die Kunden sind zufrieden.")
+
+
+def scored_words(language: str, text: str) -> int:
+    """Nombre de mots du texte présents dans le lexique d'une langue."""
+    lexicon = SentimentLexicon.for_language(language)
+    words, _ = lexicon.tokenize(text)
+    return int(lexicon.score_words(words)[2].sum())
+
+
+def test_lexicon_follows_detected_language(blank_model):
+    pipeline = NLPPipeline(model_name=blank_model, language_detector=LanguageDetector(),
+                           language_models={'fr': blank_model, 'en': blank_model})
+    documents = [Document(content=text, file_path=f'{name}.txt', file_type='txt')
+                 for name, text in (('en', ENGLISH), ('fr', FRENCH), ('de', GERMAN))]
+    
+    # Document seul et traitement par lot choisissent le même lexique
+    for analyses in ([pipeline.analyze(document) for document in documents],
+                     [analysis for _, analysis in pipeline.analyze_batch(documents)]):
+        english, french, german = analyses
+        
+        assert english.language == 'en'
+        assert english.sentiment['label'] == 'positif'
+        assert english.sentiment['scored_words'] == scored_words('en', ENGLISH)
+        assert scored_words('fr', ENGLISH) < english.sentiment['scored_words']
+        
+        assert french.language == 'fr'
+        assert french.sentiment['label'] == 'positif'
+        assert french.sentiment['scored_words'] == scored_words('fr', FRENCH)
+        
+        # Aucun lexique allemand : pas de sentiment plutôt qu'un score avec le lexique français
+        assert german.language == 'de'
+        assert german.sentiment is None
+
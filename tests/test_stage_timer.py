@@ -0,0 +1,33 @@
+"""Tests de l'instrumentation des étapes."""
+
+import pytest
+
+from main import extract_document, iter_documents
+from src.instrumentation.stage_timer import Instrumentation
+
+
+def test_extraction_timing_is_attached_to_document(tmp_path):
+    path = tmp_path / 'doc.txt'
+    path.write_text('Marie habite à Paris.', encoding='utf-8')
+    instrumentation = Instrumentation()
+    
+    document = extract_document(path, instrumentation)
+    
+    timings = instrumentation.pop_timings(document.file_path)
+    assert list(timings) == ['extract.TxtExtractor']
+    assert timings['extract.TxtExtractor']['document_chars'] == len(document.content)
+
+
+def test_failed_extraction_leaves_no_record(tmp_path):
+    missing = tmp_path / 'absent.txt'
+    hooked = []
+    instrumentation = Instrumentation(hooks=[hooked.append])
+    
+    with pytest.raises(Exception):
+        extract_document(missing, instrumentation)
+    assert list(iter_documents([missing], instrumentation)) == []
+    
+    # Les hooks voient la mesure, mais elle n'est pas gardée pour une analyse qui n'aura pas lieu
+    assert len(hooked) == 2
+    assert instrumentation.pop_timings(str(missing.absolute())) == {}
+
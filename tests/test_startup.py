@@ -0,0 +1,28 @@
+"""Tests des imports différés : chaque vérification s'exécute dans un interpréteur neuf."""
+
+import pytest
+
+from benchmarks.fixtures import FORMATS, generate_fixtures
+from benchmarks.startup import EXTRACTION_CASES, extraction_probe, imported_heavy_modules
+
+
+@pytest.fixture(scope='module')
+def fixtures(tmp_path_factory):
+    """Un petit fichier de chaque format supporté."""
+    generated = generate_fixtures(str(tmp_path_factory.mktemp('fixtures')), ['small'], FORMATS)
+    return {file_format: path for (file_format, _), path in generated.items()}
+
+
+def test_import_main_loads_no_heavy_dependency():
+    # Ni spaCy, ni pdfplumber, ni pyarrow, ni aucun backend d'extraction
+    assert imported_heavy_modules('import main') == []
+
+
+@pytest.mark.parametrize(
+    'file_format, backend, options, allowed', EXTRACTION_CASES,
+    ids=[f'{file_format}-{backend}' for file_format, backend, _, _ in EXTRACTION_CASES]
+)
+def test_extraction_loads_only_its_backend(fixtures, file_format, backend, options, allowed):
+    loaded = imported_heavy_modules(extraction_probe(str(fixtures[file_format]), file_format, options))
+    assert set(loaded) <= allowed
+